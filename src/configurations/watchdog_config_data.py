@@ -13,6 +13,10 @@ class WorkerData(NamedTuple):
     - args: list[str]. List of script arguments.
     - timeout: float. Timeout in seconds.
     - healthcheck_url_key: str. Key to look up the ping URL in HEALTHCHECK_PING_URL.
+    - max_rss_mb: float | None. Resident memory limit in MB; the worker is gracefully restarted
+      once it is exceeded (Linux). None for no limit.
+    - max_cpu_pct: float | None. CPU limit in % of one core, averaged since the previous check;
+      the worker is gracefully restarted once it is exceeded (Linux). None for no limit.
     """
 
     name: str
@@ -20,6 +24,8 @@ class WorkerData(NamedTuple):
     args: list[str]
     timeout: float
     healthcheck_url_key: str = ""
+    max_rss_mb: float | None = None
+    max_cpu_pct: float | None = None
 
 
 class SupervisionTimingData(NamedTuple):
@@ -41,6 +47,19 @@ class SupervisionTimingData(NamedTuple):
     - crash_loop_count: int. Minimum number of restarts within crash_loop_window that counts as
       a crash loop.
     - crash_loop_window: float. Trailing window in seconds used to detect a crash loop.
+    - heartbeat_events: bool. Watch the heartbeat files with inotify (Linux) and check a worker as
+      soon as its heartbeat deadline passes, instead of reading every heartbeat file each
+      check_interval. Falls back to polling where inotify is not available.
+    - asyncio_supervisor: bool. Supervise every worker in its own asyncio task (immediate crash
+      detection, concurrent stops and restarts) instead of one sequential pass over all of them.
+    - shared_memory_heartbeats: bool. Workers write their heartbeats (monotonic timestamp and
+      progress counter) into slots of a shared-memory table the watchdog allocates, instead of
+      touching heartbeat files; the watchdog reads all the slots in one scan.
+    - metrics_port: int. Port of the HTTP endpoint GET /metrics with the supervision metrics
+      (Prometheus text / OpenMetrics). 0 disables the endpoint.
+    - metrics_host: str. Interface the metrics endpoint listens on.
+    - metrics_textfile: str. Path of a .prom file the metrics are written to every check, for the
+      node_exporter textfile collector. Empty disables it.
     """
 
     check_interval: float = 30.0
@@ -51,6 +70,12 @@ class SupervisionTimingData(NamedTuple):
     backoff_cap: float = 300.0
     crash_loop_count: int = 5
     crash_loop_window: float = 300.0
+    heartbeat_events: bool = True
+    asyncio_supervisor: bool = False
+    shared_memory_heartbeats: bool = False
+    metrics_port: int = 0
+    metrics_host: str = "127.0.0.1"
+    metrics_textfile: str = ""
 
 
 class WatchdogConfigData(NamedTuple):
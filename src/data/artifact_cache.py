@@ -0,0 +1,335 @@
+"""
+Artifact cache.
+
+Content-addressed reuse layer on top of SaverAndLoader. A result is stored under a key hashed from the identity of
+the function computing it, its parameters and the fingerprints of its input files, so a repeated run with the same
+inputs loads the result instead of recomputing it. Every entry is saved with a manifest whose checksum is verified
+before the entry is used, and the cache folder is kept under a size limit by evicting the least recently used entries.
+
+Usage can be found at the end of the file.
+"""
+
+import dataclasses
+import hashlib
+import marshal
+import os
+import time
+from collections.abc import Callable, Iterable, Mapping
+from enum import Enum
+from functools import partial, wraps
+from pathlib import Path, PurePath
+from types import FunctionType
+from typing import Any, NamedTuple
+
+from numpy import ndarray
+from pandas import DataFrame, Series
+from pandas.util import hash_pandas_object
+
+from src.data import saver_and_loader
+from src.data.saver_and_loader import SaverAndLoader, get_manifest_path
+from src.exceptions.data_exception import FileNotFound, IncorrectDataStructure
+from src.exceptions.development_exception import IncorrectValue
+from src.utils.logger import Logger
+
+DEFAULT_MAX_SIZE_BYTES = 5 * 1024**3
+
+
+class CacheEntry(NamedTuple):
+    """
+    Sidecar of one cached result.
+    - key: str. Content address of the entry.
+    - function: str. Qualified name of the function which computed the result.
+    - created: float. Creation time (time.time()).
+    """
+
+    key: str
+    function: str
+    created: float
+
+
+def _unwrap(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Returns the function wrapped by (nested) functools.partial objects.
+
+    :param fn: Callable[..., Any]. Function, possibly a partial.
+    :return: Callable[..., Any]. Innermost function.
+    """
+    while isinstance(fn, partial):
+        fn = fn.func
+    return fn
+
+
+def _function_identity(fn: Callable[..., Any]) -> tuple[str, bytes]:
+    """
+    Returns the qualified name and marshalled code object of fn, unwrapping functools.partial, so the key changes
+    when the function's code changes - including its constants and nested functions.
+
+    :param fn: Callable[..., Any]. Function computing the result.
+    :return: tuple[str, bytes]. Qualified name and marshalled code (empty for callables without __code__).
+    """
+    fn = _unwrap(fn)
+    name = f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', type(fn).__qualname__)}"
+    code = getattr(fn, "__code__", None)
+    return name, b"" if code is None else marshal.dumps(code)
+
+
+def _function_state(fn: Callable[..., Any]) -> tuple[Any, Any, list[Any]]:
+    """
+    Returns the state of fn which its code does not contain, unwrapping functools.partial.
+
+    :param fn: Callable[..., Any]. Function computing the result.
+    :return: tuple[Any, Any, list[Any]]. Default arguments, keyword-only default arguments and closure cell values
+        (None for an empty cell).
+    """
+    fn = _unwrap(fn)
+    cells = []
+    for cell in getattr(fn, "__closure__", None) or ():
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:  # cell of a variable not assigned yet
+            cells.append(None)
+    return getattr(fn, "__defaults__", None), getattr(fn, "__kwdefaults__", None), cells
+
+
+def _update_hash_of_leaf(hasher: Any, obj: Any) -> bool:
+    """
+    Feeds obj into hasher if it is not a container: None, a scalar, an enum member, a path, a function, an array or
+    a pandas object.
+
+    :param hasher: Any. hashlib hash object.
+    :param obj: Any. Parameter to be hashed.
+    :return: bool. Whether obj was hashed.
+    """
+    if obj is None or isinstance(obj, str | int | float | bool | bytes):
+        hasher.update(repr(obj).encode())
+    elif isinstance(obj, Enum):
+        hasher.update(obj.name.encode())
+    elif isinstance(obj, PurePath):
+        hasher.update(str(obj).encode())
+    elif isinstance(obj, FunctionType):
+        # the state of a nested function is not followed, a recursive closure would never end
+        name, code = _function_identity(obj)
+        hasher.update(name.encode())
+        hasher.update(code)
+    elif isinstance(obj, ndarray):
+        hasher.update(f"{obj.dtype.str}{obj.shape}".encode())
+        hasher.update(obj.tobytes())
+    elif isinstance(obj, DataFrame | Series):
+        _update_hash(hasher, [str(column) for column in obj.axes[-1]] if isinstance(obj, DataFrame) else obj.name)
+        hasher.update(hash_pandas_object(obj).to_numpy().tobytes())
+    else:
+        return False
+    return True
+
+
+def _update_hash(hasher: Any, obj: Any) -> None:
+    """
+    Feeds a deterministic, type-tagged representation of obj into hasher.
+
+    Unlike pickle or repr, the representation does not depend on set ordering, on the truncation of large objects
+    or on memory addresses: arrays and pandas objects contribute their full content. Objects of other types than the
+    supported ones cannot be hashed deterministically and are rejected.
+
+    :param hasher: Any. hashlib hash object.
+    :param obj: Any. Parameter to be hashed - None, a scalar, an enum member, a path, a function, an array, a pandas
+        object, a dataclass instance or a container of these.
+    :raises IncorrectValue: If obj, or an item of it, is of an unsupported type.
+    """
+    hasher.update(type(obj).__qualname__.encode())
+    if _update_hash_of_leaf(hasher, obj):
+        return
+    if isinstance(obj, Mapping):
+        for key in sorted(obj, key=repr):
+            _update_hash(hasher, key)
+            _update_hash(hasher, obj[key])
+    elif isinstance(obj, set | frozenset):
+        item_digests = []
+        for item in obj:
+            item_hasher = hashlib.sha256()
+            _update_hash(item_hasher, item)
+            item_digests.append(item_hasher.digest())
+        for item_digest in sorted(item_digests):
+            hasher.update(item_digest)
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        _update_hash(hasher, {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)})
+    elif isinstance(obj, Iterable):
+        for item in obj:
+            _update_hash(hasher, item)
+    else:
+        raise IncorrectValue(
+            description=f"Cache key part of type {type(obj).__qualname__} can not be hashed deterministically."
+        )
+
+
+class ArtifactCache:
+    """
+    Content-addressed, checksummed cache of computed results stored through SaverAndLoader.
+
+    The key of a result hashes the function identity (qualified name, code, default arguments and closure values),
+    the key parts (its parameters) and the fingerprints (path, size, modification time) of its input files. Results
+    are pickled under the `where` location from the config file with a FileManifest holding their checksum, and a
+    .json CacheEntry sidecar describing them. Reading an entry marks it as recently used; after every store, least
+    recently used entries are evicted until the folder fits into max_size_bytes.
+    """
+
+    def __init__(self, where: str = "cache", max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES) -> None:
+        """
+        :param where: str. Name of the path from the config file the cache lives in. Default is "cache".
+        :param max_size_bytes: int. Maximum total size of the cached pickle files.
+        """
+        self._where = where
+        self._max_size_bytes = max_size_bytes
+
+    def _folder(self) -> Path:
+        """
+        Returns the cache folder, creating it if needed.
+
+        :return: Path.
+        """
+        folder = Path(saver_and_loader.get_path("", self._where, ""))
+        folder.mkdir(parents=True, exist_ok=True)
+        return folder
+
+    @staticmethod
+    def make_key(fn: Callable[..., Any], key_parts: Any, input_files: Iterable[str | Path] = ()) -> str:
+        """
+        Computes the content address of a result.
+
+        :param fn: Callable[..., Any]. Function computing the result.
+        :param key_parts: Any. Parameters of the computation - scalars, containers, arrays, pandas objects or
+            dataclass instances. Other types raise IncorrectValue.
+        :param input_files: Iterable[str | Path]. Files the result depends on. A missing file raises FileNotFound.
+        :return: str. Hex digest used as the cache file name.
+        """
+        hasher = hashlib.sha256()
+        name, code = _function_identity(fn)
+        hasher.update(name.encode())
+        hasher.update(code)
+        _update_hash(hasher, _function_state(fn))
+        _update_hash(hasher, key_parts)
+        for input_file in input_files:
+            input_path = Path(input_file).resolve()
+            if not input_path.exists():
+                raise FileNotFound(description=f"Cache input file {input_path} was not found.")
+            stat = input_path.stat()
+            _update_hash(hasher, (str(input_path), stat.st_size, stat.st_mtime_ns))
+        return hasher.hexdigest()
+
+    def _load(self, key: str) -> tuple[bool, Any]:
+        """
+        Loads a cached result after verifying its checksum. A corrupt or incomplete entry is deleted.
+
+        :param key: str. Content address.
+        :return: tuple[bool, Any]. Whether the entry was found intact, and the result if so.
+        """
+        data_path = self._folder() / f"{key}.pkl"
+        if not data_path.exists():
+            return False, None
+        try:
+            SaverAndLoader.load_config_data(key, CacheEntry, self._where)
+            SaverAndLoader.verify_file(key, self._where)
+            result = SaverAndLoader.load_from_pickle(key, self._where)
+        except (FileNotFound, IncorrectDataStructure) as exc:
+            Logger().warning(f"Discarding cache entry {key}: {exc}")
+            self._delete(key)
+            return False, None
+        os.utime(data_path)
+        return True, result
+
+    def _store(self, key: str, fn: Callable[..., Any], result: Any) -> None:
+        """
+        Stores a result together with its CacheEntry sidecar and evicts old entries if needed.
+
+        :param key: str. Content address.
+        :param fn: Callable[..., Any]. Function which computed the result.
+        :param result: Any. Result to be stored.
+        """
+        self._folder()  # creates the folder on the first store
+        SaverAndLoader.save_to_pickle(result, key, self._where, manifest=True)
+        entry = CacheEntry(key=key, function=_function_identity(fn)[0], created=time.time())
+        SaverAndLoader.save_config_data(entry, key, self._where)
+        self.evict(keep=key)
+
+    def _delete(self, key: str) -> None:
+        """
+        Deletes an entry and its sidecars, whichever of them exist.
+
+        :param key: str. Content address.
+        """
+        data_path = self._folder() / f"{key}.pkl"
+        for path in (data_path, get_manifest_path(data_path), data_path.with_suffix(".json")):
+            path.unlink(missing_ok=True)
+
+    def get_or_compute[T](self, key_parts: Any, fn: Callable[[], T], input_files: Iterable[str | Path] = ()) -> T:
+        """
+        Returns the cached result of fn for these key parts and input files, computing and storing it on a miss.
+
+        :param key_parts: Any. Parameters of the computation, see make_key.
+        :param fn: Callable[[], T]. Computes the result. Use functools.partial to bind its arguments.
+        :param input_files: Iterable[str | Path]. Files the result depends on.
+        :return: T. Cached or freshly computed result.
+        """
+        key = self.make_key(fn, key_parts, input_files)
+        found, result = self._load(key)
+        if found:
+            cached_result: T = result
+            return cached_result
+        computed = fn()
+        self._store(key, fn, computed)
+        return computed
+
+    def cached[**P, T](self, input_files: Iterable[str | Path] = ()) -> Callable[[Callable[P, T]], Callable[P, T]]:
+        """
+        Decorator caching a function on its arguments and the given input files.
+
+        :param input_files: Iterable[str | Path]. Files the results depend on.
+        :return: Callable[[Callable[P, T]], Callable[P, T]]. Decorator.
+        """
+        files = list(input_files)
+
+        def decorator(fn: Callable[P, T]) -> Callable[P, T]:
+            @wraps(fn)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                return self.get_or_compute((args, kwargs), partial(fn, *args, **kwargs), files)
+
+            return wrapper
+
+        return decorator
+
+    def evict(self, keep: str | None = None) -> None:
+        """
+        Deletes least recently used entries until the cached pickle files fit into max_size_bytes.
+
+        :param keep: str | None. Key which is never evicted, e.g. the entry just stored.
+        """
+        entries = []
+        for data_path in self._folder().glob("*.pkl"):
+            stat = data_path.stat()
+            entries.append((stat.st_mtime, stat.st_size, data_path.stem))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total_size <= self._max_size_bytes:
+                break
+            if key == keep:
+                continue
+            self._delete(key)
+            total_size -= size
+
+    def clear(self) -> None:
+        """
+        Deletes all entries.
+        """
+        for data_path in self._folder().glob("*.pkl"):
+            self._delete(data_path.stem)
+
+
+if __name__ == "__main__":
+    CACHE = ArtifactCache()
+
+    @CACHE.cached()
+    def _slow_square(x: int) -> int:
+        time.sleep(1)
+        return x * x
+
+    print(_slow_square(4))
+    print(_slow_square(4))
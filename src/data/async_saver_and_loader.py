@@ -0,0 +1,332 @@
+"""
+Async saver and loader.
+
+Asyncio facade of SaverAndLoader. Every call runs the blocking SaverAndLoader method on a bounded thread pool, so
+the event loop keeps running - e.g. heartbeat touches of a worker supervised by the watchdog - while a pickle is
+unpickled or a csv parsed. At most max_concurrency files are processed at once, further calls wait in the pool's
+queue.
+
+Methods returning a lazy iterator, as SaverAndLoader.iter_dataframe_chunks_from_csv, are not awaited by run but
+iterated by iterate, an async iterator fetching one item at a time on the pool. So a chunked csv stays chunked and the
+event loop never waits for the next item. The awaited load_many collects its results that way.
+
+A cancelled await does not stop the file operation already running in its thread; saves are atomic, so a
+cancelled save either completes or leaves the previous file.
+
+Usage can be found at the end of the file.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import Any, Self
+
+from numpy import dtype, ndarray
+from pandas import DataFrame
+
+from src.data.saver_and_loader import FileResult, SaverAndLoader
+from src.exceptions.development_exception import NotValidOperation
+
+_EXHAUSTED = object()
+
+
+def _call_returning_no_iterator(method: str, function: Callable[[], Any]) -> Any:
+    """
+    Calls function, raising NotValidOperation if it returns an iterator.
+
+    The work an iterator defers would otherwise run on the event loop, which iterates it.
+
+    :param method: str. Name of the SaverAndLoader method, for the error message.
+    :param function: Callable[[], Any]. Method with bound arguments.
+    :return: Any. Return value.
+    """
+    result = function()
+    if isinstance(result, Iterator):
+        close = getattr(result, "close", None)
+        if close is not None:
+            close()
+        raise NotValidOperation(description=f"SaverAndLoader.{method} returns an iterator, use iterate.")
+    return result
+
+
+class AsyncSaverAndLoader:
+    """
+    Awaitable counterparts of the SaverAndLoader load_* and save_* methods, run on a bounded thread pool.
+
+    Use it as an async context manager, or call aclose when done, to shut the pool down.
+    """
+
+    def __init__(self, max_concurrency: int = 4, saver_and_loader: SaverAndLoader | None = None) -> None:
+        """
+        :param max_concurrency: int. Maximum number of file operations running at once.
+        :param saver_and_loader: SaverAndLoader | None. Instance carrying the csv parameters. None creates a default.
+        """
+        self._saver_and_loader = SaverAndLoader() if saver_and_loader is None else saver_and_loader
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="saver_and_loader")
+
+    async def __aenter__(self) -> Self:
+        """
+        :return: Self.
+        """
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """
+        Shuts the pool down, see aclose.
+        """
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Waits for the running operations and shuts the pool down, without blocking the event loop.
+        """
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    async def run(self, method: str, /, *args: Any, **kwargs: Any) -> Any:
+        """
+        Awaits any SaverAndLoader method by name on the pool.
+
+        :param method: str. Name of the SaverAndLoader method, e.g. "save_many". Positional only, so a method= keyword
+            argument of the method (as of load_many) is passed through.
+        :param args: Any. Positional arguments of the method.
+        :param kwargs: Any. Keyword arguments of the method.
+        :return: Any. Return value of the method. A method returning an iterator raises NotValidOperation, see iterate.
+        """
+        function = partial(getattr(self._saver_and_loader, method), *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(_call_returning_no_iterator, method, function)
+        )
+
+    async def iterate(self, method: str, /, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Iterates any SaverAndLoader method returning an iterator by name.
+
+        Every item is fetched on the pool only when it is asked for, so a chunked csv is read one chunk at a time.
+
+        :param method: str. Name of the SaverAndLoader method, e.g. "iter_dataframe_chunks_from_csv". Positional only.
+        :param args: Any. Positional arguments of the method.
+        :param kwargs: Any. Keyword arguments of the method.
+        :return: AsyncIterator[Any]. Items of the returned iterator.
+        """
+        loop = asyncio.get_running_loop()
+        function = partial(getattr(self._saver_and_loader, method), *args, **kwargs)
+        iterator: Iterator[Any] = await loop.run_in_executor(self._executor, function)
+        while (item := await loop.run_in_executor(self._executor, next, iterator, _EXHAUSTED)) is not _EXHAUSTED:
+            yield item
+
+    async def load_many(
+        self, file_names: list[str], where: str = "raw_data", max_workers: int | None = None, **kwargs: Any
+    ) -> list[FileResult]:
+        """
+        See SaverAndLoader.load_many. Its results are collected on the pool, so the event loop never waits for a file.
+
+        :param file_names: list[str]. File names without extension.
+        :param where: str. Name of the path from the config file.
+        :param max_workers: int | None. Size of the pool of load_many. None uses max_concurrency, so the loads stay
+            bounded as every other call of this class.
+        :param kwargs: Any. Further keyword arguments of the method, e.g. method=, executor= and ordered=.
+        :return: list[FileResult]. One result per file.
+        """
+        max_workers = self._max_concurrency if max_workers is None else max_workers
+        return [
+            result async for result in self.iterate("load_many", file_names, where, max_workers=max_workers, **kwargs)
+        ]
+
+    async def iter_dataframe_chunks_from_csv(
+        self, file_name: str, where: str = "raw_data", **kwargs: Any
+    ) -> AsyncIterator[DataFrame]:
+        """
+        See SaverAndLoader.iter_dataframe_chunks_from_csv. Every chunk is read on the pool when it is asked for.
+
+        :param file_name: str. File name without .csv
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method, e.g. chunk_rows=.
+        :return: AsyncIterator[DataFrame]. Chunks in file order.
+        """
+        async for chunk in self.iterate("iter_dataframe_chunks_from_csv", file_name, where, **kwargs):
+            yield chunk
+
+    async def load_from_pickle(self, file_name: str, where: str = "raw_data", **kwargs: Any) -> Any:
+        """
+        See SaverAndLoader.load_from_pickle.
+
+        :param file_name: str. File name without .pkl.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        :return: Any. Loaded data.
+        """
+        return await self.run("load_from_pickle", file_name, where, **kwargs)
+
+    async def save_to_pickle(self, data: Any, file_name: str, where: str = "raw_data", **kwargs: Any) -> None:
+        """
+        See SaverAndLoader.save_to_pickle.
+
+        :param data: Any. Python data to be saved.
+        :param file_name: str. File name without .pkl.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_to_pickle", data, file_name, where, **kwargs)
+
+    async def load_dataframe_from_pickle(self, file_name: str, where: str = "raw_data", **kwargs: Any) -> DataFrame:
+        """
+        See SaverAndLoader.load_dataframe_from_pickle.
+
+        :param file_name: str. File name without .pkl.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        :return: DataFrame. Loaded data frame.
+        """
+        loaded: DataFrame = await self.run("load_dataframe_from_pickle", file_name, where, **kwargs)
+        return loaded
+
+    async def save_dataframe_to_pickle(
+        self, df: DataFrame, file_name: str, where: str = "raw_data", **kwargs: Any
+    ) -> None:
+        """
+        See SaverAndLoader.save_dataframe_to_pickle.
+
+        :param df: DataFrame to be saved.
+        :param file_name: str. File name without .pkl.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_dataframe_to_pickle", df, file_name, where, **kwargs)
+
+    async def load_dataframe_from_csv(self, file_name: str, where: str = "raw_data", **kwargs: Any) -> DataFrame:
+        """
+        See SaverAndLoader.load_dataframe_from_csv.
+
+        :param file_name: str. File name without .csv
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        :return: DataFrame. Loaded data frame.
+        """
+        loaded: DataFrame = await self.run("load_dataframe_from_csv", file_name, where, **kwargs)
+        return loaded
+
+    async def save_dataframe_to_csv(
+        self, df: DataFrame, file_name: str, where: str = "raw_data", **kwargs: Any
+    ) -> None:
+        """
+        See SaverAndLoader.save_dataframe_to_csv.
+
+        :param df: DataFrame to be saved.
+        :param file_name: str. File name without .csv
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_dataframe_to_csv", df, file_name, where, **kwargs)
+
+    async def load_dataframe_from_parquet(self, file_name: str, where: str = "raw_data", **kwargs: Any) -> DataFrame:
+        """
+        See SaverAndLoader.load_dataframe_from_parquet.
+
+        :param file_name: str. File name without .parquet.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method, e.g. columns= and filters=.
+        :return: DataFrame. Loaded data frame.
+        """
+        loaded: DataFrame = await self.run("load_dataframe_from_parquet", file_name, where, **kwargs)
+        return loaded
+
+    async def save_dataframe_to_parquet(
+        self, df: DataFrame, file_name: str, where: str = "raw_data", **kwargs: Any
+    ) -> None:
+        """
+        See SaverAndLoader.save_dataframe_to_parquet.
+
+        :param df: DataFrame to be saved.
+        :param file_name: str. File name without .parquet.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_dataframe_to_parquet", df, file_name, where, **kwargs)
+
+    async def load_dataframe_from_feather(self, file_name: str, where: str = "raw_data", **kwargs: Any) -> DataFrame:
+        """
+        See SaverAndLoader.load_dataframe_from_feather.
+
+        :param file_name: str. File name without .feather.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method, e.g. columns= and filters=.
+        :return: DataFrame. Loaded data frame.
+        """
+        loaded: DataFrame = await self.run("load_dataframe_from_feather", file_name, where, **kwargs)
+        return loaded
+
+    async def save_dataframe_to_feather(
+        self, df: DataFrame, file_name: str, where: str = "raw_data", **kwargs: Any
+    ) -> None:
+        """
+        See SaverAndLoader.save_dataframe_to_feather.
+
+        :param df: DataFrame to be saved.
+        :param file_name: str. File name without .feather.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_dataframe_to_feather", df, file_name, where, **kwargs)
+
+    async def load_array(self, file_name: str, where: str = "raw_data", **kwargs: Any) -> ndarray[Any, dtype[Any]]:
+        """
+        See SaverAndLoader.load_array.
+
+        :param file_name: str. File name without .npy.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method, e.g. mmap=.
+        :return: ndarray[Any, dtype[Any]]. Loaded array.
+        """
+        loaded: ndarray[Any, dtype[Any]] = await self.run("load_array", file_name, where, **kwargs)
+        return loaded
+
+    async def save_array(
+        self, array: ndarray[Any, dtype[Any]], file_name: str, where: str = "raw_data", **kwargs: Any
+    ) -> None:
+        """
+        See SaverAndLoader.save_array.
+
+        :param array: ndarray[Any, dtype[Any]]. Array to be saved.
+        :param file_name: str. File name without .npy.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_array", array, file_name, where, **kwargs)
+
+    async def load_config_data(self, file_name: str, config_data_structure: Any, where: str = "raw_data") -> Any:
+        """
+        See SaverAndLoader.load_config_data.
+
+        :param file_name: str. File name without .json.
+        :param config_data_structure: Any. Named tuple of the config.
+        :param where: str. Name of the path from the config file.
+        :return: Any. Loaded named tuple.
+        """
+        return await self.run("load_config_data", file_name, config_data_structure, where)
+
+    async def save_config_data(self, config_data: Any, file_name: str, where: str = "raw_data", **kwargs: Any) -> None:
+        """
+        See SaverAndLoader.save_config_data.
+
+        :param config_data: Any. Configuration's named tuple.
+        :param file_name: str. File name without .json.
+        :param where: str. Name of the path from the config file.
+        :param kwargs: Any. Further keyword arguments of the method.
+        """
+        await self.run("save_config_data", config_data, file_name, where, **kwargs)
+
+
+if __name__ == "__main__":
+    from numpy import arange
+
+    async def _main() -> None:
+        async with AsyncSaverAndLoader(max_concurrency=2) as saver_and_loader:
+            await saver_and_loader.save_dataframe_to_pickle(DataFrame({"a": arange(10)}), "async_example", "data")
+            print(await saver_and_loader.load_dataframe_from_pickle("async_example", "data"))
+
+    asyncio.run(_main())
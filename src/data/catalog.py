@@ -0,0 +1,213 @@
+"""
+Dataset catalog.
+
+SQLite index of the files stored in one `where` location: row count, columns, dtypes, byte size, SHA-256 and
+creation time of every file. Tools can list and preflight datasets, or pick the smallest file which has the needed
+columns, from one small database instead of opening (or even stat-ing) the files themselves.
+
+A location gets a catalog by SaverAndLoader.get_catalog(where); from then on every SaverAndLoader save into that
+location records the file and every delete removes it. Files written by other means are not seen, so the catalog
+is an index to be trusted only as far as the location is managed through SaverAndLoader.
+
+Usage can be found at the end of the file.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from numpy import ndarray
+from pandas import DataFrame
+
+CATALOG_FILE_NAME = "_catalog.sqlite"
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS datasets (
+    file TEXT PRIMARY KEY,
+    n_rows INTEGER,
+    columns TEXT NOT NULL,
+    dtypes TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    created REAL NOT NULL
+)
+"""
+_SELECT_FILE = """
+SELECT file, n_rows, columns, dtypes, size, sha256, created FROM datasets WHERE file = ?
+"""
+_SELECT_GLOB = """
+SELECT file, n_rows, columns, dtypes, size, sha256, created FROM datasets WHERE file GLOB ? ORDER BY file
+"""
+
+
+class CatalogEntry(NamedTuple):
+    """
+    Metadata of one stored file.
+    - file: str. File name with extension, relative to the location.
+    - n_rows: int | None. Number of rows (length of the first axis for arrays), None for other objects.
+    - columns: list[str]. Column names, empty for anything but a table.
+    - dtypes: list[str]. Data types of the columns, of the array, or the type name of another object.
+    - size: int. Size of the file in bytes.
+    - sha256: str. SHA-256 of the file.
+    - created: float. Time of the save (time.time()).
+    """
+
+    file: str
+    n_rows: int | None
+    columns: list[str]
+    dtypes: list[str]
+    size: int
+    sha256: str
+    created: float
+
+
+def describe(data: Any) -> tuple[int | None, list[str], list[str]]:
+    """
+    Returns the row count, columns and dtypes recorded for an object.
+
+    :param data: Any. Saved object.
+    :return: tuple[int | None, list[str], list[str]]. Row count, column names and dtypes.
+    """
+    if isinstance(data, DataFrame):
+        return len(data), [str(column) for column in data.columns], [str(dtype) for dtype in data.dtypes]
+    if isinstance(data, ndarray):
+        return (len(data) if data.ndim else 1), [], [str(data.dtype)]
+    return None, [], [type(data).__qualname__]
+
+
+class DatasetCatalog:
+    """
+    SQLite catalog of the files in one folder. Every call opens its own connection, so processes saving into the
+    same location concurrently (see SaverAndLoader.save_many) serialise on the database lock.
+    """
+
+    def __init__(self, folder: str | Path) -> None:
+        """
+        :param folder: str | Path. Folder of the location. The catalog file is created in it if missing.
+        """
+        self._path = Path(folder) / CATALOG_FILE_NAME
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(_CREATE_TABLE)
+
+    @staticmethod
+    def exists(folder: str | Path) -> bool:
+        """
+        Tests if the folder has a catalog.
+
+        :param folder: str | Path. Folder of the location.
+        :return: bool.
+        """
+        return (Path(folder) / CATALOG_FILE_NAME).exists()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Opens a connection, commits the block and closes the connection.
+
+        :return: Iterator[sqlite3.Connection].
+        """
+        with closing(sqlite3.connect(self._path, timeout=30.0)) as connection, connection:
+            yield connection
+
+    def record(
+        self,
+        file: str,
+        size: int,
+        sha256: str,
+        n_rows: int | None = None,
+        columns: list[str] | None = None,
+        dtypes: list[str] | None = None,
+    ) -> CatalogEntry:
+        """
+        Records a saved file, replacing its previous entry.
+
+        :param file: str. File name with extension, relative to the location.
+        :param size: int. Size of the file in bytes.
+        :param sha256: str. SHA-256 of the file.
+        :param n_rows: int | None. Number of rows.
+        :param columns: list[str] | None. Column names.
+        :param dtypes: list[str] | None. Data types.
+        :return: CatalogEntry. Recorded entry.
+        """
+        entry = CatalogEntry(file, n_rows, columns or [], dtypes or [], size, sha256, time.time())
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*entry[:2], json.dumps(entry.columns), json.dumps(entry.dtypes), *entry[4:]),
+            )
+        return entry
+
+    def remove(self, file: str) -> None:
+        """
+        Removes the entry of a file, if there is one.
+
+        :param file: str. File name with extension, relative to the location.
+        """
+        with self._connect() as connection:
+            connection.execute("DELETE FROM datasets WHERE file = ?", (file,))
+
+    @staticmethod
+    def _to_entry(row: tuple[Any, ...]) -> CatalogEntry:
+        """
+        Converts a database row to an entry.
+
+        :param row: tuple[Any, ...]. Row in the column order of the table.
+        :return: CatalogEntry.
+        """
+        file, n_rows, columns, dtypes, size, sha256, created = row
+        return CatalogEntry(file, n_rows, json.loads(columns), json.loads(dtypes), size, sha256, created)
+
+    def get(self, file: str) -> CatalogEntry | None:
+        """
+        Returns the entry of a file.
+
+        :param file: str. File name with extension, relative to the location.
+        :return: CatalogEntry | None. None if the file is not catalogued.
+        """
+        with self._connect() as connection:
+            row = connection.execute(_SELECT_FILE, (file,)).fetchone()
+        return None if row is None else self._to_entry(row)
+
+    def list_entries(self, pattern: str = "*") -> list[CatalogEntry]:
+        """
+        Returns the entries whose file name matches a glob pattern, sorted by file name.
+
+        :param pattern: str. SQLite GLOB pattern, e.g. "*.parquet". Default lists everything.
+        :return: list[CatalogEntry].
+        """
+        with self._connect() as connection:
+            rows = connection.execute(_SELECT_GLOB, (pattern,)).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def find_smallest(
+        self, columns: list[str] | None = None, min_rows: int = 0, pattern: str = "*"
+    ) -> CatalogEntry | None:
+        """
+        Returns the smallest file having all the given columns and at least min_rows rows.
+
+        :param columns: list[str] | None. Required columns. None requires none.
+        :param min_rows: int. Minimum number of rows. Files without a row count match only min_rows 0.
+        :param pattern: str. SQLite GLOB pattern the file name has to match, e.g. "prices_*".
+        :return: CatalogEntry | None. None if no file qualifies.
+        """
+        required = set(columns or [])
+        for entry in sorted(self.list_entries(pattern), key=lambda entry: entry.size):
+            if (entry.n_rows or 0) >= min_rows and required.issubset(entry.columns):
+                return entry
+        return None
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as TEMP_DIR:
+        CATALOG = DatasetCatalog(TEMP_DIR)
+        CATALOG.record("big.parquet", 10_000, "0" * 64, *describe(DataFrame({"a": range(100), "b": range(100)})))
+        CATALOG.record("small.parquet", 1_000, "1" * 64, *describe(DataFrame({"a": range(10)})))
+        print(CATALOG.list_entries())
+        print(CATALOG.find_smallest(columns=["a"], min_rows=50))
@@ -0,0 +1,175 @@
+"""
+Compression.
+
+Registry of the stream compression codecs SaverAndLoader can wrap its pickle and csv files in. Each codec has a file
+extension appended to the regular one (data.pkl.zst) and magic bytes, so a compressed file is recognised by its name
+or, if renamed, by its header.
+
+- lz4: very fast in both directions, moderate ratio - for hot data read often from a slow (network) path.
+- zstd: fast decompression with a ratio tunable by level (1 - 22) - the default choice, high levels for archival.
+- gzip, bz2, xz: standard library codecs for interchange with other tools.
+
+Usage can be found at the end of the file.
+"""
+
+import bz2
+import gzip
+import lzma
+from collections.abc import Callable
+from io import BufferedIOBase
+from pathlib import Path
+from typing import NamedTuple
+
+import lz4.frame
+import zstandard
+
+from src.exceptions.development_exception import NoProperOptionInIf
+
+
+class Codec(NamedTuple):
+    """
+    Description of one compression codec.
+    - extension: str. Suffix appended to the file extension, e.g. ".zst".
+    - magic: Callable[[bytes], bool]. Whether the first (HEADER_SIZE) bytes of a file are those of the codec.
+    - default_level: int. Level used when none is given.
+    - opener: Callable[[Path | BufferedIOBase, str, int], BufferedIOBase]. Opens a path or wraps a binary file for
+      reading ("rb") or writing ("wb") at the given level. The level is ignored when reading.
+    """
+
+    extension: str
+    magic: Callable[[bytes], bool]
+    default_level: int
+    opener: Callable[[Path | BufferedIOBase, str, int], BufferedIOBase]
+
+
+def _magic(prefix: bytes, next_byte_in: bytes | None = None) -> Callable[[bytes], bool]:
+    """
+    Returns the check of the magic bytes of a codec.
+
+    :param prefix: bytes. Fixed first bytes.
+    :param next_byte_in: bytes | None. Allowed values of the byte after the prefix, for a prefix short enough to start
+        a plain text file (bz2 "BZh" is followed by the block size digit). None allows any.
+    :return: Callable[[bytes], bool]. Whether a header starts with the magic bytes.
+    """
+
+    def matches(header: bytes) -> bool:
+        if not header.startswith(prefix):
+            return False
+        return next_byte_in is None or (len(header) > len(prefix) and header[len(prefix)] in next_byte_in)
+
+    return matches
+
+
+def _open_gzip(target: Path | BufferedIOBase, mode: str, level: int) -> BufferedIOBase:
+    if isinstance(target, Path):
+        return gzip.GzipFile(target, mode, compresslevel=level)
+    return gzip.GzipFile(fileobj=target, mode=mode, compresslevel=level)
+
+
+def _open_bz2(target: Path | BufferedIOBase, mode: str, level: int) -> BufferedIOBase:
+    return bz2.BZ2File(target, "wb" if "w" in mode else "rb", compresslevel=level)
+
+
+def _open_xz(target: Path | BufferedIOBase, mode: str, level: int) -> BufferedIOBase:
+    return lzma.LZMAFile(target, mode, preset=level if "w" in mode else None)  # type: ignore[arg-type]
+
+
+def _open_zstd(target: Path | BufferedIOBase, mode: str, level: int) -> BufferedIOBase:
+    handle: BufferedIOBase = zstandard.open(
+        target,  # type: ignore[arg-type]
+        mode,
+        cctx=zstandard.ZstdCompressor(level=level),
+        closefd=False,
+    )
+    return handle
+
+
+def _open_lz4(target: Path | BufferedIOBase, mode: str, level: int) -> BufferedIOBase:
+    handle: BufferedIOBase = lz4.frame.open(target, mode, compression_level=level)
+    return handle
+
+
+# number of first bytes of a file the magic checks see
+HEADER_SIZE = 6
+CODECS: dict[str, Codec] = {
+    "lz4": Codec(extension=".lz4", magic=_magic(b"\x04\x22\x4d\x18"), default_level=0, opener=_open_lz4),
+    "zstd": Codec(extension=".zst", magic=_magic(b"\x28\xb5\x2f\xfd"), default_level=3, opener=_open_zstd),
+    "gzip": Codec(extension=".gz", magic=_magic(b"\x1f\x8b"), default_level=6, opener=_open_gzip),
+    "bz2": Codec(extension=".bz2", magic=_magic(b"BZh", next_byte_in=b"123456789"), default_level=9, opener=_open_bz2),
+    "xz": Codec(extension=".xz", magic=_magic(b"\xfd7zXZ\x00"), default_level=6, opener=_open_xz),
+}
+
+
+def get_codec(compression: str) -> Codec:
+    """
+    Returns the codec of the given name.
+
+    :param compression: str. One of the CODECS keys.
+    :return: Codec.
+    """
+    if compression not in CODECS:
+        raise NoProperOptionInIf(description=f"Unknown compression {compression}, use one of {list(CODECS)}.")
+    return CODECS[compression]
+
+
+def compression_extension(compression: str | None) -> str:
+    """
+    Returns the suffix appended to the file extension for the given compression.
+
+    :param compression: str | None. Name of the codec. None means no compression.
+    :return: str. E.g. ".zst", empty for None.
+    """
+    return "" if compression is None else get_codec(compression).extension
+
+
+def detect_compression(path: str | Path) -> str | None:
+    """
+    Detects the codec of a file from its extension, falling back to its magic bytes.
+
+    :param path: str | Path. Existing file.
+    :return: str | None. Name of the codec, None for an uncompressed file.
+    """
+    path_obj = Path(path)
+    for name, codec in CODECS.items():
+        if path_obj.name.endswith(codec.extension):
+            return name
+    with path_obj.open("rb") as handle:
+        header = handle.read(HEADER_SIZE)
+    for name, codec in CODECS.items():
+        if codec.magic(header):
+            return name
+    return None
+
+
+def open_compressed(
+    path: str | Path | BufferedIOBase, mode: str, compression: str | None, level: int | None = None
+) -> BufferedIOBase:
+    """
+    Opens a file for binary reading or writing through the given codec.
+
+    An already open binary file is wrapped instead - it is returned as it is without a codec, and closing the codec
+    stream finishes it without closing the file.
+    :param path: str | Path | BufferedIOBase. Path of the file, or an open binary file.
+    :param mode: str. "rb" or "wb".
+    :param compression: str | None. Name of the codec. None opens the file as it is.
+    :param level: int | None. Compression level when writing. None uses the default level of the codec.
+    :return: BufferedIOBase. File object, closing it finishes the compressed stream.
+    """
+    target = path if isinstance(path, BufferedIOBase) else Path(path)
+    if compression is None:
+        if isinstance(target, BufferedIOBase):
+            return target
+        return target.open("wb") if "w" in mode else target.open("rb")
+    codec = get_codec(compression)
+    return codec.opener(target, mode, codec.default_level if level is None else level)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as TEMP_DIR:
+        for NAME, CODEC in CODECS.items():
+            PATH = Path(TEMP_DIR) / f"data.csv{CODEC.extension}"
+            with open_compressed(PATH, "wb", NAME) as HANDLE:
+                HANDLE.write(b"a,b\n" * 100_000)
+            print(NAME, PATH.stat().st_size, detect_compression(PATH))
@@ -0,0 +1,158 @@
+"""
+Partitioned dataset.
+
+Stores a time-indexed DataFrame as a folder of monthly parquet partitions instead of one file, so a time range is
+read by opening only the partitions overlapping it, and new data is appended as new part files without rewriting
+the existing ones:
+
+    <where>/<name>/year=2026/month=01/part-00000.parquet
+    <where>/<name>/year=2026/month=02/part-00000.parquet
+    <where>/<name>/year=2026/month=02/part-00001.parquet   <- appended later
+
+The Hive-style folder names make the dataset readable by pyarrow.dataset, Spark or DuckDB as well. Every part is
+written through SaverAndLoader, so it is atomic and optionally compressed. One writer per dataset is assumed.
+
+Usage can be found at the end of the file.
+"""
+
+import re
+from pathlib import Path
+
+from pandas import DataFrame, DatetimeIndex, Timedelta, Timestamp, concat
+
+from src.data import saver_and_loader
+from src.data.saver_and_loader import SaverAndLoader
+from src.exceptions.data_exception import IncorrectDataStructure, NoData
+
+_PARTITION_PATTERN = re.compile(r"year=(\d{4})/month=(\d{2})")
+_PART_FILE_PATTERN = "part-*.parquet"
+_PART_INDEX_PATTERN = re.compile(r"part-(\d+)")
+
+
+class PartitionedDataset:
+    """
+    Monthly partitioned parquet dataset of a DataFrame with DatetimeIndex, in the `where` location from the config.
+    """
+
+    def __init__(self, name: str, where: str = "data", compression: str | None = "snappy") -> None:
+        """
+        :param name: str. Name of the dataset, the folder it is stored in.
+        :param where: str. Name of the path from the config file. Default is "data".
+        :param compression: str | None. Native parquet codec of the parts, see SaverAndLoader.save_dataframe_to_parquet.
+        """
+        self._name = name
+        self._where = where
+        self._compression = compression
+
+    def _root(self) -> Path:
+        """
+        Returns the folder of the dataset.
+        :return: Path.
+        """
+        return Path(saver_and_loader.get_path(self._name, self._where, ""))
+
+    def partitions(self) -> list[tuple[int, int]]:
+        """
+        Returns the (year, month) of every existing partition, in time order.
+        :return: list[tuple[int, int]].
+        """
+        partitions = []
+        for folder in self._root().glob("year=*/month=*"):
+            match = _PARTITION_PATTERN.search(folder.relative_to(self._root()).as_posix())
+            if match is not None and any(folder.glob(_PART_FILE_PATTERN)):
+                partitions.append((int(match.group(1)), int(match.group(2))))
+        return sorted(partitions)
+
+    def _part_indices(self, year: int, month: int) -> list[int]:
+        """
+        Returns the indices of the parts of one partition, in write order. Part files with another name are ignored.
+        :param year: int.
+        :param month: int.
+        :return: list[int].
+        """
+        folder = self._root() / f"year={year:04d}" / f"month={month:02d}"
+        matches = (_PART_INDEX_PATTERN.fullmatch(path.stem) for path in folder.glob(_PART_FILE_PATTERN))
+        return sorted(int(match.group(1)) for match in matches if match is not None)
+
+    def _part_file_name(self, year: int, month: int, index: int) -> str:
+        """
+        Returns the name of a part file relative to `where`, without extension.
+        :param year: int.
+        :param month: int.
+        :param index: int. Index of the part in its partition.
+        :return: str.
+        """
+        return f"{self._name}/year={year:04d}/month={month:02d}/part-{index:05d}"
+
+    def _partition_file_names(self, year: int, month: int) -> list[str]:
+        """
+        Returns the part file names (relative to `where`, without extension) of one partition, in write order.
+        :param year: int.
+        :param month: int.
+        :return: list[str].
+        """
+        return [self._part_file_name(year, month, index) for index in self._part_indices(year, month)]
+
+    def append(self, df: DataFrame) -> list[str]:
+        """
+        Appends the rows of df to the dataset as one new part file per month they fall in. Existing parts are never
+        rewritten, so appending rows already stored duplicates them.
+
+        The month is taken from the wall time of the index, in its own time zone if it has one.
+        :param df: DataFrame. Data with DatetimeIndex.
+        :return: list[str]. Names of the written part files, relative to `where`, without extension.
+        """
+        if not isinstance(df.index, DatetimeIndex):
+            raise IncorrectDataStructure(
+                description=f"Dataset {self._name} can only store a DataFrame with DatetimeIndex."
+            )
+        written = []
+        for (year, month), group in df.groupby([df.index.year, df.index.month], sort=True):
+            # after the highest index, not the number of parts: with a gap in the numbering (a deleted part) that
+            # would be the index of an existing part, overwritten by the atomic replace
+            existing = self._part_indices(int(year), int(month))
+            file_name = self._part_file_name(int(year), int(month), max(existing, default=-1) + 1)
+            Path(saver_and_loader.get_path(file_name, self._where, "")).parent.mkdir(parents=True, exist_ok=True)
+            SaverAndLoader.save_dataframe_to_parquet(group, file_name, self._where, compression=self._compression)
+            written.append(file_name)
+        return written
+
+    def read(
+        self, start: Timestamp | str | None = None, end: Timestamp | str | None = None, columns: list[str] | None = None
+    ) -> DataFrame:
+        """
+        Reads the rows in [start, end) opening only the partitions overlapping that range.
+
+        :param start: Timestamp | str | None. First time included. None reads from the beginning.
+        :param end: Timestamp | str | None. First time excluded. None reads to the end.
+        :param columns: list[str] | None. Columns to be loaded, the index is always loaded. None loads all of them.
+        :return: DataFrame. Rows sorted by the index (stable, so appended duplicates keep their write order).
+        """
+        first = None if start is None else Timestamp(start)
+        # the last instant still included decides the last partition - end itself may open a new month
+        last = None if end is None else Timestamp(end) - Timedelta(1, "ns")
+        frames = [
+            SaverAndLoader.load_dataframe_from_parquet(file_name, self._where, columns=columns)
+            for year, month in self.partitions()
+            if (first is None or (year, month) >= (first.year, first.month))
+            and (last is None or (year, month) <= (last.year, last.month))
+            for file_name in self._partition_file_names(year, month)
+        ]
+        if not frames:
+            raise NoData(description=f"Dataset {self._name} has no partition between {start} and {end}.")
+        df = concat(frames).sort_index(kind="stable")
+        if first is not None:
+            df = df[df.index >= first]
+        if end is not None:
+            df = df[df.index < Timestamp(end)]
+        return df
+
+
+if __name__ == "__main__":
+    from numpy import arange
+    from pandas import date_range
+
+    DATASET = PartitionedDataset(name="example_dataset")
+    DATASET.append(DataFrame({"value": arange(24 * 90)}, index=date_range("2026-01-01", periods=24 * 90, freq="h")))
+    print(DATASET.partitions())
+    print(DATASET.read(start="2026-02-15", end="2026-03-01"))
@@ -4,19 +4,64 @@ Saver and loader.
 Class for simplification of saving and loading.
 """
 
+import hashlib
 import json
+import os
 
 # Bandit exception: pickle is intentionally used only for trusted internal data files.
 import pickle  # nosec B403
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from io import BufferedIOBase
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Any
+from tempfile import mkstemp
+from typing import Any, NamedTuple
 
 import typedload
-from pandas import DataFrame, read_csv, read_pickle
-
+from numpy import dtype, load, ndarray, save
+from pandas import DataFrame, read_csv, read_parquet, read_pickle
+from pyarrow import Codec, Schema, Table, ipc, memory_map
+from pyarrow.ipc import RecordBatchFileWriter
+from pyarrow.parquet import ParquetWriter, filters_to_expression
+
+from src.data.catalog import DatasetCatalog, describe
+from src.data.compression import CODECS, compression_extension, detect_compression, open_compressed
 from src.exceptions.data_exception import FileNotFound, IncorrectDataStructure
+from src.exceptions.development_exception import NoProperOptionInIf
 from src.utils.application_config import ApplicationConfig
 
+# Row filter predicates in pyarrow's disjunctive normal form: a list of (column, operator, value) tuples combined with
+# AND, or a list of such lists combined with OR. Example: [("year", ">=", 2020), ("price", "<", 10.0)].
+ParquetFilters = list[tuple[str, str, Any]] | list[list[tuple[str, str, Any]]]
+
+MANIFEST_EXTENSION = ".manifest.json"
+
+
+class FileManifest(NamedTuple):
+    """
+    Sidecar written next to a saved file with manifest=True.
+    - size: int. Size of the file in bytes, checked by every load.
+    - sha256: str. SHA-256 of the file, checked by verify_file.
+    """
+
+    size: int
+    sha256: str
+
+
+class FileResult(NamedTuple):
+    """
+    Outcome of one file of SaverAndLoader.load_many / save_many.
+    - file_name: str. File name as passed in.
+    - data: Any. Loaded data, None for a save or a failed load.
+    - error: FileNotFound | IncorrectDataStructure | None. Why the file failed, None on success.
+    """
+
+    file_name: str
+    data: Any
+    error: FileNotFound | IncorrectDataStructure | None
+
 
 def get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:
     """
@@ -32,9 +77,299 @@ def get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -
     return str((Path(dir_path) / (file_name + extension)).resolve())
 
 
+def get_manifest_path(path: str | Path) -> Path:
+    """
+    Returns the path of the manifest sidecar of a file, e.g. data.pkl.manifest.json for data.pkl.
+
+    :param path: str | Path. Path of the data file.
+    :return: Path. Path of its manifest.
+    """
+    path_obj = Path(path)
+    return path_obj.with_name(path_obj.name + MANIFEST_EXTENSION)
+
+
+def file_checksum(path: str | Path) -> str:
+    """
+    Computes the SHA-256 checksum of a file.
+
+    :param path: str | Path. File to be hashed.
+    :return: str. Hex digest.
+    """
+    with Path(path).open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+class _HashingFile(BufferedIOBase):
+    """
+    Binary file opened for writing which hashes the bytes on their way to disk, so the checksum of a saved file is
+    known without reading it back. It is not seekable - every byte is written once, in order.
+
+    :param path: Path. File to be written.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self._file = path.open("wb")
+        self._hash = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            super().close()
+        finally:
+            self._file.close()
+
+    def hexdigest(self) -> str:
+        """
+        Returns the SHA-256 of the bytes written so far.
+
+        :return: str. Hex digest.
+        """
+        return self._hash.hexdigest()
+
+
+def _fsync_directory(directory: Path) -> None:
+    """
+    Flushes a directory entry change (a rename) to disk. Directories can not be opened on Windows, where the rename
+    itself is journaled by NTFS, so the step is skipped there.
+
+    :param directory: Path. Directory to be flushed.
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _replace_durably(temp_path: Path, path: Path) -> None:
+    """
+    Flushes temp_path to disk and renames it over path, so path holds either the old or the new content in full.
+
+    :param temp_path: Path. Fully written temporary file in the directory of path.
+    :param path: Path. Final path.
+    """
+    fd = os.open(temp_path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    temp_path.replace(path)
+    _fsync_directory(path.parent)
+
+
+@contextmanager
+def _atomic_write(path: str, manifest: bool = False) -> Iterator[_HashingFile]:
+    """
+    Yields a temporary file in the directory of path to be written instead of it.
+
+    After the block succeeds, the temporary file is closed, fsynced and renamed over path and optionally a
+    FileManifest is written next to it. If the block fails - or the process is killed inside it - path is left
+    untouched and only a hidden .tmp file can remain. A stale manifest is removed before the rename, so a crash
+    between the rename and the new manifest leaves an unverified file rather than a false mismatch. The file is hashed
+    while it is written, its hexdigest() is the checksum of the saved file for the manifest and the catalog.
+
+    :param path: str. Final path of the file.
+    :param manifest: bool. If True, a FileManifest sidecar with the size and SHA-256 of the file is written.
+    :return: Iterator[_HashingFile]. Temporary file to be written, the block may close it.
+    """
+    path_obj = Path(path)
+    fd, temp_name = mkstemp(prefix=f".{path_obj.name}.", suffix=".tmp", dir=path_obj.parent)
+    os.close(fd)
+    temp_path = Path(temp_name)
+    temp_file = _HashingFile(temp_path)
+    try:
+        with temp_file:
+            yield temp_file
+        get_manifest_path(path_obj).unlink(missing_ok=True)
+        _replace_durably(temp_path, path_obj)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    if manifest:
+        manifest_data = FileManifest(size=path_obj.stat().st_size, sha256=temp_file.hexdigest())
+        manifest_path = get_manifest_path(path_obj)
+        fd, temp_name = mkstemp(prefix=f".{manifest_path.name}.", suffix=".tmp", dir=path_obj.parent)
+        with os.fdopen(fd, "w", encoding="utf8") as outfile:
+            json.dump(typedload.dump(manifest_data), outfile)
+        _replace_durably(Path(temp_name), manifest_path)
+
+
+def _read_manifest(path_obj: Path) -> FileManifest | None:
+    """
+    Reads the manifest of a file.
+
+    :param path_obj: Path. Data file.
+    :return: FileManifest | None. None if the file has no manifest.
+    """
+    manifest_path = get_manifest_path(path_obj)
+    if not manifest_path.exists():
+        return None
+    manifest_data: FileManifest = typedload.load(json.loads(manifest_path.read_text(encoding="utf8")), FileManifest)
+    return manifest_data
+
+
+def _record_in_catalog(
+    where: str, path: str, sha256: str, description: tuple[int | None, list[str], list[str]]
+) -> None:
+    """
+    Records a saved file in the catalog of its location, if the location has one (see SaverAndLoader.get_catalog).
+
+    :param where: str. Name of the path from the config file.
+    :param path: str. Resolved path of the saved file.
+    :param sha256: str. Checksum of the file, computed while it was written (see _atomic_write).
+    :param description: tuple[int | None, list[str], list[str]]. Row count, columns and dtypes, see catalog.describe.
+    """
+    folder = Path(get_path("", where, ""))
+    if not DatasetCatalog.exists(folder):
+        return
+    path_obj = Path(path)
+    file = path_obj.relative_to(folder).as_posix() if path_obj.is_relative_to(folder) else path_obj.as_posix()
+    DatasetCatalog(folder).record(file, path_obj.stat().st_size, sha256, *description)
+
+
+def _remove_from_catalog(where: str, path: str) -> None:
+    """
+    Removes a deleted file from the catalog of its location, if the location has one.
+
+    :param where: str. Name of the path from the config file.
+    :param path: str. Resolved path of the deleted file.
+    """
+    folder = Path(get_path("", where, ""))
+    if DatasetCatalog.exists(folder):
+        path_obj = Path(path)
+        DatasetCatalog(folder).remove(
+            path_obj.relative_to(folder).as_posix() if path_obj.is_relative_to(folder) else path_obj.as_posix()
+        )
+
+
+def _check_manifest(path_obj: Path) -> None:
+    """
+    Compares the size of the file with its manifest, if it has one. This costs two stat calls, not a read of the
+    file, so every loader can afford it. Use SaverAndLoader.verify_file for the full checksum comparison.
+
+    :param path_obj: Path. Existing data file.
+    """
+    manifest_data = _read_manifest(path_obj)
+    if manifest_data is None:
+        return
+    actual_size = path_obj.stat().st_size
+    if actual_size != manifest_data.size:
+        error_msg = (
+            f"File {path_obj} does not match its manifest: {actual_size} bytes found, {manifest_data.size} bytes "
+            "expected. The file may be truncated or corrupt."
+        )
+        raise IncorrectDataStructure(description=error_msg)
+
+
+def _resolve_compressed_path(
+    file_name: str, where: str, extension: str, compression: str | None
+) -> tuple[str, str | None]:
+    """
+    Resolves the path and the codec of a file to be loaded.
+
+    With compression None, the uncompressed file is preferred, then the first existing compressed variant (e.g.
+    data.pkl.zst); the codec is detected from the extension or the header, so a compressed file saved under the
+    plain name loads as well.
+    :param file_name: str. File name without extension.
+    :param where: str. Name of the path from the config file.
+    :param extension: str. File extension without the compression suffix.
+    :param compression: str | None. Name of the codec, see src.data.compression.CODECS. None detects it.
+    :return: tuple[str, str | None]. Path (the uncompressed one if no variant exists) and name of the codec.
+    """
+    if compression is not None:
+        return get_path(file_name, where, extension + compression_extension(compression)), compression
+    path = get_path(file_name, where, extension)
+    candidates = [path] + [get_path(file_name, where, extension + codec.extension) for codec in CODECS.values()]
+    for candidate in candidates:
+        if Path(candidate).exists():
+            return candidate, detect_compression(candidate)
+    return path, None
+
+
+def _iter_and_close(handle: BufferedIOBase, chunks: Iterator[DataFrame]) -> Iterator[DataFrame]:
+    """
+    Yields the chunks read from handle and closes it once they are exhausted (or the generator is closed).
+
+    :param handle: BufferedIOBase. File the chunks are read from.
+    :param chunks: Iterator[DataFrame]. Chunks.
+    :return: Iterator[DataFrame]. The same chunks.
+    """
+    with handle:
+        yield from chunks
+
+
+def _run_file_operation(function: Callable[..., Any], file_name: str, args: tuple[Any, ...], kwargs: Any) -> FileResult:
+    """
+    Runs one load or save of load_many / save_many and captures its failure instead of raising it.
+
+    Module level, so a process pool can pickle it.
+    :param function: Callable[..., Any]. SaverAndLoader method.
+    :param file_name: str. File name, passed after args.
+    :param args: tuple[Any, ...]. Positional arguments before the file name - the data for a save.
+    :param kwargs: Any. Keyword arguments of the method.
+    :return: FileResult.
+    """
+    try:
+        return FileResult(file_name=file_name, data=function(*args, file_name, **kwargs), error=None)
+    except (FileNotFound, IncorrectDataStructure) as exc:
+        return FileResult(file_name=file_name, data=None, error=exc)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError) as exc:
+        # unreadable content - truncated stream, broken pickle, bad codec frame - is reported as a bad file too
+        error = IncorrectDataStructure(description=f"File {file_name} could not be processed: {exc!r}.")
+        return FileResult(file_name=file_name, data=None, error=error)
+
+
+def _validated_path(path: str, min_size: int) -> Path:
+    """
+    Checks that the file exists, is bigger than min_size and matches the size in its manifest, so the loaders fail
+    early on missing or truncated files.
+
+    :param path: str. Resolved path of the file to be loaded.
+    :param min_size: int. Minimum size of the file.
+    :return: Path. Path object of the validated file.
+    """
+    path_obj = Path(path)
+    if not path_obj.exists():
+        raise FileNotFound(description=f"File {path} was not found on selected path.")
+    actual_size = path_obj.stat().st_size
+    if actual_size <= min_size:
+        error_msg = (
+            f"File {path} is undersized: {actual_size} bytes found, more than {min_size} bytes required. "
+            "The file may be truncated or corrupt."
+        )
+        raise IncorrectDataStructure(description=error_msg)
+    _check_manifest(path_obj)
+    return path_obj
+
+
 class SaverAndLoader:
     """
     Class for simplification of saving and loading.
+
+    Every save writes a temporary file in the target directory, fsyncs it and renames it over the target, so a
+    process killed mid-write (e.g. by the watchdog) never leaves a truncated file behind. With manifest=True, a
+    FileManifest sidecar lets the loaders reject a file of unexpected size without reading it, and verify_file
+    compare its checksum. A location with a catalog (see get_catalog) gets every saved file recorded in it.
+
+    Pickle and csv files can be stream-compressed by any codec of src.data.compression (compression="lz4" for hot
+    data, "zstd" with a compression_level for archival); the codec suffix is appended to the file name and the
+    loaders detect it. Parquet and feather files use the native codecs of their formats instead.
     """
 
     def __init__(self) -> None:
@@ -54,6 +389,23 @@ class SaverAndLoader:
         """
         return Path(get_path(file_name, where, extension)).exists()
 
+    @staticmethod
+    def verify_file(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> None:
+        """
+        Compares the size and the SHA-256 of a file with its manifest. Reads the whole file.
+
+        :param file_name: str. File name without extension.
+        :param where: str. Name of the path from the config file.
+        :param extension: str. File extension. Default is .pkl.
+        """
+        path = get_path(file_name, where, extension)
+        path_obj = _validated_path(path, -1)
+        manifest_data = _read_manifest(path_obj)
+        if manifest_data is None:
+            raise FileNotFound(description=f"Manifest {get_manifest_path(path_obj)} was not found on selected path.")
+        if file_checksum(path_obj) != manifest_data.sha256:
+            raise IncorrectDataStructure(description=f"File {path} does not match the checksum in its manifest.")
+
     def set_csv_params(self, decimal: str, sep: str) -> None:
         """
         Sets the parameters for read_csv function.
@@ -64,139 +416,464 @@ class SaverAndLoader:
         self._decimal = decimal
         self._sep = sep
 
-    def save_dataframe_to_csv(self, df: DataFrame, file_name: str, where: str = "raw_data") -> None:
+    def save_dataframe_to_csv(
+        self,
+        df: DataFrame,
+        file_name: str,
+        where: str = "raw_data",
+        manifest: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> None:
         """
         Saves a DataFrame to a csv file.
 
         :param df: DataFrame to be saved.
         :param file_name: str. File name without .csv
         :param where: str. Name of the path from the config file.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        :param compression: str | None. Name of the codec, see src.data.compression.CODECS. None does not compress.
+        :param compression_level: int | None. Level of the codec. None uses its default level.
         """
-        path = get_path(file_name, where, ".csv")
-        df.to_csv(path, index=False, decimal=self._decimal, sep=self._sep, date_format=self._csv_date_time_format)
+        path = get_path(file_name, where, ".csv" + compression_extension(compression))
+        with (
+            _atomic_write(path, manifest) as temp_file,
+            open_compressed(temp_file, "wb", compression, compression_level) as handle,
+        ):
+            df.to_csv(
+                handle,
+                mode="wb",
+                index=False,
+                decimal=self._decimal,
+                sep=self._sep,
+                date_format=self._csv_date_time_format,
+            )
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(df))
 
-    def load_dataframe_from_csv(self, file_name: str, where: str = "raw_data", min_size: int = 2) -> DataFrame:
+    def load_dataframe_from_csv(
+        self, file_name: str, where: str = "raw_data", min_size: int = 2, compression: str | None = None
+    ) -> DataFrame:
         """
         Loads a DataFrame from a csv file.
 
         :param file_name: str. File name without .csv
         :param where: str. Name of the path from the config file.
         :param min_size: int. Minimum size of the file.
+        :param compression: str | None. Name of the codec. None detects it from the extension or the header.
         :return: DataFrame
         """
-        path = get_path(file_name, where, ".csv")
-        path_obj = Path(path)
-        if path_obj.exists():
-            # zero len doesn't work with csv files in some cases when small
-            actual_size = path_obj.stat().st_size
-            if actual_size > min_size:
-                return read_csv(path, decimal=self._decimal, sep=self._sep)
-            error_msg = (
-                f"File {path} is undersized: {actual_size} bytes found, more than {min_size} bytes required. "
-                "The file may be truncated or corrupt."
-            )
-            raise IncorrectDataStructure(description=error_msg)
-        raise FileNotFound(description=f"File {path} was not found on selected path.")
+        path, compression = _resolve_compressed_path(file_name, where, ".csv", compression)
+        # zero len doesn't work with csv files in some cases when small
+        _validated_path(path, min_size)
+        with open_compressed(path, "rb", compression) as handle:
+            return read_csv(handle, decimal=self._decimal, sep=self._sep)
+
+    def iter_dataframe_chunks_from_csv(
+        self,
+        file_name: str,
+        where: str = "raw_data",
+        chunk_rows: int = 100_000,
+        dtype: dict[str, Any] | None = None,
+        parse_dates: list[str] | None = None,
+        min_size: int = 2,
+        compression: str | None = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Iterates over a csv file in DataFrame chunks of at most chunk_rows rows, so only one chunk is in memory.
+
+        The configured decimal and sep are used. Without dtype, the types are inferred per chunk and can differ
+        between chunks (e.g. int64 in one, float64 in another one where values are missing).
+        :param file_name: str. File name without .csv
+        :param where: str. Name of the path from the config file.
+        :param chunk_rows: int. Maximum number of rows in one chunk.
+        :param dtype: dict[str, Any] | None. Column types passed to read_csv. None infers them.
+        :param parse_dates: list[str] | None. Columns to be parsed as datetimes in the csv date time format.
+        :param min_size: int. Minimum size of the file.
+        :param compression: str | None. Name of the codec. None detects it from the extension or the header.
+        :return: Iterator[DataFrame]. Chunks in file order. The file is closed once the iterator is exhausted.
+        """
+        path, compression = _resolve_compressed_path(file_name, where, ".csv", compression)
+        _validated_path(path, min_size)
+        handle = open_compressed(path, "rb", compression)
+        chunks: Iterator[DataFrame] = read_csv(
+            handle,
+            decimal=self._decimal,
+            sep=self._sep,
+            chunksize=chunk_rows,
+            dtype=dtype,
+            parse_dates=parse_dates,
+            date_format=self._csv_date_time_format if parse_dates else None,
+        )
+        return _iter_and_close(handle, chunks)
+
+    def convert_csv_to_columnar(
+        self,
+        file_name: str,
+        where: str = "raw_data",
+        target_where: str | None = None,
+        columnar_format: str = "parquet",
+        chunk_rows: int = 100_000,
+        dtype: dict[str, Any] | None = None,
+        parse_dates: list[str] | None = None,
+        manifest: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> int:
+        """
+        Streams a csv file into a parquet or feather file of the same name chunk by chunk, in constant memory.
+
+        Every chunk becomes one parquet row group / one Arrow record batch. The schema is taken from the first
+        chunk, so pass dtype whenever the inferred types could differ between chunks. The target file appears only
+        once the conversion is complete. A compressed csv file is detected and decompressed on the fly.
+        :param file_name: str. File name without .csv
+        :param where: str. Name of the path from the config file the csv file is read from.
+        :param target_where: str | None. Name of the path from the config file the columnar file is written to.
+            None writes next to the csv file.
+        :param columnar_format: str. "parquet" or "feather".
+        :param chunk_rows: int. Maximum number of rows in one chunk.
+        :param dtype: dict[str, Any] | None. Column types passed to read_csv. None infers them.
+        :param parse_dates: list[str] | None. Columns to be parsed as datetimes in the csv date time format.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        :param compression: str | None. Native codec of the columnar file ("snappy", "zstd", "lz4", "gzip", ...).
+            None uses snappy for parquet and lz4 for feather.
+        :param compression_level: int | None. Level of the codec. None uses its default level.
+        :return: int. Number of converted rows.
+        """
+        if columnar_format not in ("parquet", "feather"):
+            raise NoProperOptionInIf(description=f"Unknown columnar format {columnar_format}.")
+        target_path = get_path(file_name, where if target_where is None else target_where, "." + columnar_format)
+
+        n_rows = 0
+        writer: ParquetWriter | RecordBatchFileWriter | None = None
+        schema: Schema | None = None
+        with _atomic_write(target_path, manifest) as temp_file:
+            try:
+                for chunk in self.iter_dataframe_chunks_from_csv(file_name, where, chunk_rows, dtype, parse_dates):
+                    table = Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                    if writer is None:
+                        schema = table.schema
+                        writer = (
+                            ParquetWriter(
+                                temp_file,
+                                schema,
+                                compression=compression or "snappy",
+                                compression_level=compression_level,
+                            )
+                            if columnar_format == "parquet"
+                            else ipc.new_file(
+                                temp_file,
+                                schema,
+                                options=ipc.IpcWriteOptions(compression=Codec(compression or "lz4", compression_level)),
+                            )
+                        )
+                    writer.write_table(table)
+                    n_rows += table.num_rows
+            finally:
+                if writer is not None:
+                    writer.close()
+        columns, dtypes = ([], []) if schema is None else describe(schema.empty_table().to_pandas())[1:]
+        _record_in_catalog(target_where or where, target_path, temp_file.hexdigest(), (n_rows, columns, dtypes))
+        return n_rows
 
     @staticmethod
-    def save_dataframe_to_pickle(df: DataFrame, file_name: str, where: str = "raw_data") -> None:
+    def save_dataframe_to_pickle(
+        df: DataFrame,
+        file_name: str,
+        where: str = "raw_data",
+        manifest: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> None:
         """
         Saves a DataFrame to a pickle file.
 
         :param df: DataFrame to be saved.
         :param file_name: str. File name without .pkl.
         :param where: str. Name of the path from the config file.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        :param compression: str | None. Name of the codec, see src.data.compression.CODECS. None does not compress.
+        :param compression_level: int | None. Level of the codec. None uses its default level.
         """
-        path = get_path(file_name, where)
-        df.to_pickle(path, protocol=pickle.HIGHEST_PROTOCOL)
+        path = get_path(file_name, where, ".pkl" + compression_extension(compression))
+        with (
+            _atomic_write(path, manifest) as temp_file,
+            open_compressed(temp_file, "wb", compression, compression_level) as handle,
+        ):
+            df.to_pickle(handle, compression=None, protocol=pickle.HIGHEST_PROTOCOL)
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(df))
 
     @staticmethod
-    def load_dataframe_from_pickle(file_name: str, where: str = "raw_data", min_size: int = 0) -> DataFrame:
+    def load_dataframe_from_pickle(
+        file_name: str, where: str = "raw_data", min_size: int = 0, compression: str | None = None
+    ) -> DataFrame:
         """
         Loads a DataFrame from a pickle file.
 
         :param file_name: str. File name without .pkl.
         :param where: str. Name of the path from the config file.
         :param min_size: int. Minimum size of the file.
+        :param compression: str | None. Name of the codec. None detects it from the extension or the header.
         :return: DataFrame. Loaded data frame.
         """
-        path = get_path(file_name, where)
-        path_obj = Path(path)
-        if path_obj.exists():
-            actual_size = path_obj.stat().st_size
-            if actual_size > min_size:
-                return read_pickle(path)  # noqa: S301  # nosec B301
-            error_msg = (
-                f"File {path} is undersized: {actual_size} bytes found, more than {min_size} bytes required. "
-                "The file may be truncated or corrupt."
+        path, compression = _resolve_compressed_path(file_name, where, ".pkl", compression)
+        _validated_path(path, min_size)
+        with open_compressed(path, "rb", compression) as handle:
+            loaded: DataFrame = read_pickle(handle, compression=None)  # noqa: S301  # nosec B301
+        return loaded
+
+    @staticmethod
+    def save_dataframe_to_parquet(
+        df: DataFrame,
+        file_name: str,
+        where: str = "raw_data",
+        row_group_size: int | None = None,
+        manifest: bool = False,
+        compression: str | None = "snappy",
+        compression_level: int | None = None,
+    ) -> None:
+        """
+        Saves a DataFrame to a parquet file.
+
+        Smaller row groups make the row filter predicates of load_dataframe_from_parquet more selective, because
+        whole row groups are skipped based on their min/max statistics.
+        :param df: DataFrame to be saved.
+        :param file_name: str. File name without .parquet.
+        :param where: str. Name of the path from the config file.
+        :param row_group_size: int | None. Maximum number of rows in one row group. None uses the pyarrow default.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        :param compression: str | None. Native parquet codec ("snappy", "zstd", "lz4", "gzip", "brotli"). None does
+            not compress. The loader detects it from the file.
+        :param compression_level: int | None. Level of the codec. None uses its default level.
+        """
+        path = get_path(file_name, where, ".parquet")
+        with _atomic_write(path, manifest) as temp_file:
+            df.to_parquet(
+                temp_file,
+                engine="pyarrow",
+                row_group_size=row_group_size,
+                compression=compression,
+                compression_level=compression_level,
             )
-            raise IncorrectDataStructure(description=error_msg)
-        raise FileNotFound(description=f"File {path} was not found on selected path.")
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(df))
 
     @staticmethod
-    def save_to_pickle(data: Any, file_name: str, where: str = "raw_data") -> None:
+    def load_dataframe_from_parquet(
+        file_name: str,
+        where: str = "raw_data",
+        columns: list[str] | None = None,
+        filters: ParquetFilters | None = None,
+        min_size: int = 0,
+    ) -> DataFrame:
+        """
+        Loads a DataFrame from a parquet file, decoding only the requested columns and row groups.
+
+        :param file_name: str. File name without .parquet.
+        :param where: str. Name of the path from the config file.
+        :param columns: list[str] | None. Columns to be loaded. None loads all of them.
+        :param filters: ParquetFilters | None. Row filter predicates, see ParquetFilters. Row groups which can not
+            contain matching rows are not decoded at all. None loads all rows.
+        :param min_size: int. Minimum size of the file.
+        :return: DataFrame. Loaded data frame.
+        """
+        path = get_path(file_name, where, ".parquet")
+        _validated_path(path, min_size)
+        return read_parquet(path, engine="pyarrow", columns=columns, filters=filters)
+
+    @staticmethod
+    def save_dataframe_to_feather(
+        df: DataFrame,
+        file_name: str,
+        where: str = "raw_data",
+        manifest: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> None:
+        """
+        Saves a DataFrame to a feather (Arrow IPC) file. The index is stored as well.
+
+        :param df: DataFrame to be saved.
+        :param file_name: str. File name without .feather.
+        :param where: str. Name of the path from the config file.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        :param compression: str | None. Native Arrow IPC codec ("lz4", "zstd" or "uncompressed"). None uses lz4. The
+            record batches are decompressed on load, so memory-mapping then only saves the reads of other columns.
+        :param compression_level: int | None. Level of the codec. None uses its default level.
+        """
+        path = get_path(file_name, where, ".feather")
+        table = Table.from_pandas(df)
+        codec = None if compression == "uncompressed" else Codec(compression or "lz4", compression_level)
+        with (
+            _atomic_write(path, manifest) as temp_file,
+            ipc.new_file(temp_file, table.schema, options=ipc.IpcWriteOptions(compression=codec)) as writer,
+        ):
+            writer.write_table(table)
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(df))
+
+    @staticmethod
+    def load_dataframe_from_feather(
+        file_name: str,
+        where: str = "raw_data",
+        columns: list[str] | None = None,
+        filters: ParquetFilters | None = None,
+        min_size: int = 0,
+    ) -> DataFrame:
+        """
+        Loads a DataFrame from a feather (Arrow IPC) file.
+
+        The file is memory-mapped and only the requested columns, the stored index and the columns of the filters are
+        read and decompressed, the other ones are not touched. The stored index is always loaded together with the
+        requested columns.
+        :param file_name: str. File name without .feather.
+        :param where: str. Name of the path from the config file.
+        :param columns: list[str] | None. Columns to be loaded. None loads all of them.
+        :param filters: ParquetFilters | None. Row filter predicates, see ParquetFilters. None loads all rows.
+        :param min_size: int. Minimum size of the file.
+        :return: DataFrame. Loaded data frame.
+        """
+        path = get_path(file_name, where, ".feather")
+        _validated_path(path, min_size)
+        with memory_map(path) as source:
+            options = ipc.IpcReadOptions()
+            if columns is not None:
+                schema = ipc.open_file(source).schema
+                index_columns = [
+                    name for name in (schema.pandas_metadata or {}).get("index_columns", []) if isinstance(name, str)
+                ]
+                columns = columns + [name for name in index_columns if name not in columns]
+                filter_columns = [
+                    predicate[0]
+                    for group in filters or []
+                    for predicate in (group if isinstance(group, list) else [group])
+                ]
+                # decompressing a column is the cost of a compressed file, so the other columns are not even read
+                options = ipc.IpcReadOptions(
+                    included_fields=[
+                        position for position, name in enumerate(schema.names) if name in {*columns, *filter_columns}
+                    ]
+                )
+            table = ipc.open_file(source, options=options).read_all()
+            if filters is not None:
+                table = table.filter(filters_to_expression(filters))
+            if columns is not None:
+                table = table.select(columns)
+            loaded: DataFrame = table.to_pandas()
+        return loaded
+
+    @staticmethod
+    def save_array(
+        array: ndarray[Any, dtype[Any]], file_name: str, where: str = "raw_data", manifest: bool = False
+    ) -> None:
+        """
+        Saves a numeric array to a .npy file - the raw buffer behind a small header with dtype, shape and order.
+
+        Unlike save_to_pickle, the file can be memory-mapped by load_array, so several processes share one copy of
+        the data in the page cache instead of each deserialising a private one.
+        :param array: ndarray[Any, dtype[Any]]. Array to be saved. Object arrays are not supported.
+        :param file_name: str. File name without .npy.
+        :param where: str. Name of the path from the config file.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        """
+        if array.dtype.hasobject:
+            raise IncorrectDataStructure(description=f"Array {file_name} of dtype object can not be saved as .npy.")
+        path = get_path(file_name, where, ".npy")
+        with _atomic_write(path, manifest) as temp_file:
+            save(temp_file, array, allow_pickle=False)
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(array))
+
+    @staticmethod
+    def load_array(
+        file_name: str, where: str = "raw_data", mmap: bool = True, min_size: int = 0
+    ) -> ndarray[Any, dtype[Any]]:
+        """
+        Loads an array saved by save_array.
+
+        :param file_name: str. File name without .npy.
+        :param where: str. Name of the path from the config file.
+        :param mmap: bool. If True, the file is memory-mapped read-only and pages are read lazily on access. If False,
+            the whole array is read into a private, writable copy.
+        :param min_size: int. Minimum size of the file.
+        :return: ndarray[Any, dtype[Any]]. Loaded array, a read-only numpy.memmap when mmap is True.
+        """
+        path = get_path(file_name, where, ".npy")
+        _validated_path(path, min_size)
+        loaded: ndarray[Any, dtype[Any]] = load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return loaded
+
+    @staticmethod
+    def save_to_pickle(
+        data: Any,
+        file_name: str,
+        where: str = "raw_data",
+        manifest: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> None:
         """
         Saves data to pickle file.
 
         :param data: Any. Python data to be saved.
         :param file_name: str. File name without .pkl.
         :param where: str. Name of the path from the config file.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
+        :param compression: str | None. Name of the codec, see src.data.compression.CODECS. None does not compress.
+        :param compression_level: int | None. Level of the codec. None uses its default level.
         """
-        path = get_path(file_name, where)
+        path = get_path(file_name, where, ".pkl" + compression_extension(compression))
 
-        with Path(path).open("wb") as handle:
+        with (
+            _atomic_write(path, manifest) as temp_file,
+            open_compressed(temp_file, "wb", compression, compression_level) as handle,
+        ):
             pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(data))
 
     @staticmethod
-    def load_from_pickle(file_name: str, where: str = "raw_data", min_size: int = 0) -> Any:
+    def load_from_pickle(
+        file_name: str, where: str = "raw_data", min_size: int = 0, compression: str | None = None
+    ) -> Any:
         """
         Loads a pickle file.
 
         :param file_name: str. File name without .pkl.
         :param where: str. Name of the path from the config file.
         :param min_size: int. Minimum size of the file.
+        :param compression: str | None. Name of the codec. None detects it from the extension or the header.
         :return: Any. Loaded data from the pickle file.
         """
-        path = get_path(file_name, where)
-        path_obj = Path(path)
-        if path_obj.exists():
-            actual_size = path_obj.stat().st_size
-            if actual_size > min_size:
-                with path_obj.open("rb") as handle:
-                    return pickle.load(handle)  # noqa: S301  # nosec B301
-            error_msg = (
-                f"File {path} is undersized: {actual_size} bytes found, more than {min_size} bytes required. "
-                "The file may be truncated or corrupt."
-            )
-            raise IncorrectDataStructure(description=error_msg)
-        raise FileNotFound(description=f"File {path} was not found on selected path.")
+        path, compression = _resolve_compressed_path(file_name, where, ".pkl", compression)
+        with open_compressed(_validated_path(path, min_size), "rb", compression) as handle:
+            return pickle.load(handle)  # noqa: S301  # nosec B301
 
     @staticmethod
     def delete_pickle(file_name: str, where: str = "raw_data") -> None:
         """
-        Deletes a pickle file.
+        Deletes a pickle file, together with its compressed variants.
 
         :param file_name: str. File name without .pkl.
         :param where: str. Name of the path from the config file.
         """
-        path = get_path(file_name, where)
-        path_obj = Path(path)
-        if path_obj.exists():
-            path_obj.unlink()
+        for suffix in ["", *(codec.extension for codec in CODECS.values())]:
+            path_obj = Path(get_path(file_name, where, ".pkl" + suffix))
+            if path_obj.exists():
+                path_obj.unlink()
+                _remove_from_catalog(where, str(path_obj))
+            get_manifest_path(path_obj).unlink(missing_ok=True)
 
     @staticmethod
-    def save_config_data(config_data: Any, file_name: str, where: str = "raw_data") -> None:
+    def save_config_data(config_data: Any, file_name: str, where: str = "raw_data", manifest: bool = False) -> None:
         """
         Converts the config data to a dictionary and saves it as .json file.
 
         :param config_data: Any. Configuration's named tuple (see FEConfig, MMTradingConfig, ...)
         :param file_name: str. File name without .pkl.
         :param where: str. Name of the path from the config file.
+        :param manifest: bool. If True, a FileManifest sidecar is written next to the file.
         """
         path = get_path(file_name, where, ".json")
         data = typedload.dump(config_data)
-        with Path(path).open("w", encoding="utf8") as outfile:
-            json.dump(data, outfile)
+        with _atomic_write(path, manifest) as temp_file:
+            temp_file.write(json.dumps(data).encode("utf8"))
+        _record_in_catalog(where, path, temp_file.hexdigest(), describe(config_data))
 
     @staticmethod
     def load_config_data(file_name: str, config_data_structure: Any, where: str = "raw_data") -> Any:
@@ -210,6 +887,7 @@ class SaverAndLoader:
         path = get_path(file_name, where, ".json")
         path_obj = Path(path)
         if path_obj.exists():
+            _check_manifest(path_obj)
             with path_obj.open("r", encoding="utf8") as infile:
                 data = json.load(infile)
             return typedload.load(data, config_data_structure)
@@ -225,6 +903,115 @@ class SaverAndLoader:
         """
         path = get_path(file_name, where, "")
         Path(path).unlink()
+        get_manifest_path(path).unlink(missing_ok=True)
+        _remove_from_catalog(where, path)
+
+    @staticmethod
+    def get_catalog(where: str = "raw_data") -> DatasetCatalog:
+        """
+        Returns the catalog of a location, creating it if needed. Once it exists, every save into the location is
+        recorded in it and every delete removes the file from it; files already stored are not added retroactively.
+
+        :param where: str. Name of the path from the config file.
+        :return: DatasetCatalog.
+        """
+        return DatasetCatalog(get_path("", where, ""))
+
+    def _run_many(
+        self,
+        prefix: str,
+        method: str,
+        calls: list[tuple[str, tuple[Any, ...]]],
+        executor: str,
+        max_workers: int | None,
+        ordered: bool,
+        kwargs: dict[str, Any],
+    ) -> Iterator[FileResult]:
+        """
+        Submits one method call per file to a new pool and returns their results.
+
+        :param prefix: str. Required prefix of the method name, "load_" or "save_".
+        :param method: str. Name of the SaverAndLoader method.
+        :param calls: list[tuple[str, tuple[Any, ...]]]. File name and positional arguments before it, per call.
+        :param executor: str. "thread" or "process".
+        :param max_workers: int | None. Size of the pool. None uses the executor default.
+        :param ordered: bool. If True, results are yielded in the order of calls, otherwise as they complete.
+        :param kwargs: dict[str, Any]. Keyword arguments of every call.
+        :return: Iterator[FileResult].
+        """
+        if not method.startswith(prefix) or not callable(getattr(self, method, None)):
+            raise NoProperOptionInIf(description=f"Method {method} is not a {prefix}* method of SaverAndLoader.")
+        pool: Executor
+        if executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+        elif executor == "process":
+            # spawn, as on Windows: forking this possibly multi-threaded process could deadlock the children
+            pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+        else:
+            raise NoProperOptionInIf(description=f"Unknown executor {executor}, use thread or process.")
+        function = getattr(self, method)
+        futures: list[Future[FileResult]] = [
+            pool.submit(_run_file_operation, function, file_name, args, kwargs) for file_name, args in calls
+        ]
+        # the submitted calls keep running, the pool only stops accepting new ones and exits when they are done
+        pool.shutdown(wait=False)
+        return (future.result() for future in (futures if ordered else as_completed(futures)))
+
+    def load_many(
+        self,
+        file_names: list[str],
+        where: str = "raw_data",
+        method: str = "load_dataframe_from_pickle",
+        executor: str = "thread",
+        max_workers: int | None = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[FileResult]:
+        """
+        Loads many files concurrently with one load_* method, reporting failures per file instead of raising.
+
+        All loads are submitted immediately. Threads overlap the file reads, and decompression and parquet decoding
+        release the GIL, so they suit most formats. Processes also parallelise pure-Python deserialisation (large
+        pickles of Python objects), at the cost of pickling every result back to this process.
+        :param file_names: list[str]. File names without extension.
+        :param where: str. Name of the path from the config file.
+        :param method: str. Name of the load method, e.g. "load_dataframe_from_parquet".
+        :param executor: str. "thread" or "process".
+        :param max_workers: int | None. Size of the pool. None uses the executor default.
+        :param ordered: bool. If True, results are yielded in the order of file_names, otherwise as they complete.
+        :param kwargs: Any. Further keyword arguments of the load method, e.g. columns=.
+        :return: Iterator[FileResult]. One result per file. A failed file has error set to FileNotFound or
+            IncorrectDataStructure.
+        """
+        calls = [(file_name, ()) for file_name in file_names]
+        return self._run_many("load_", method, calls, executor, max_workers, ordered, {"where": where, **kwargs})
+
+    def save_many(
+        self,
+        data: Mapping[str, Any],
+        where: str = "raw_data",
+        method: str = "save_dataframe_to_pickle",
+        executor: str = "thread",
+        max_workers: int | None = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> list[FileResult]:
+        """
+        Saves many objects concurrently with one save_* method, reporting failures per file instead of raising.
+
+        Returns once all saves are finished. Every save stays atomic. With processes, each object is pickled to its
+        worker first.
+        :param data: Mapping[str, Any]. Object to be saved per file name (without extension).
+        :param where: str. Name of the path from the config file.
+        :param method: str. Name of the save method, e.g. "save_dataframe_to_parquet".
+        :param executor: str. "thread" or "process".
+        :param max_workers: int | None. Size of the pool. None uses the executor default.
+        :param ordered: bool. If True, results are listed in the order of data, otherwise as they completed.
+        :param kwargs: Any. Further keyword arguments of the save method, e.g. compression=.
+        :return: list[FileResult]. One result per file, with data None.
+        """
+        calls = [(file_name, (item,)) for file_name, item in data.items()]
+        return list(self._run_many("save_", method, calls, executor, max_workers, ordered, {"where": where, **kwargs}))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+"""
+Shared-memory heartbeat table of the watchdog.
+
+Instead of touching a heartbeat file that the watchdog stats (slow on network filesystems, with the coarse mtime
+granularity of some of them), a worker writes its heartbeat into its slot of a table in shared memory allocated by
+the watchdog. A slot holds:
+- timestamp: float64. time.monotonic() of the last heartbeat (system-wide clock, the same in all processes).
+- progress: uint64. Counter of the heartbeats, or any progress the worker reports.
+
+The table starts with a header (magic bytes and the number of slots) and the watchdog reads the ages of all the
+workers in one vectorised scan of the timestamps.
+
+(.venv) > python run_cmd_status_print_01.py ... --heartbeat-table <name> --heartbeat-slot <slot>
+
+Usage can be found at the end of the file.
+"""
+
+import struct
+import time
+from collections.abc import Mapping
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from numpy import dtype, float64, inf, ndarray, uint64
+
+from src.scripts_production.heartbeat_watcher import DEADLINE_SLACK, PollingHeartbeatWatcher
+
+TABLE_MAGIC = b"HBTABLE1"
+HEADER = struct.Struct("<8sQ")  # magic, number of slots
+SLOT_DTYPE = dtype([("timestamp", float64), ("progress", uint64)])
+
+
+def _buffer(memory: SharedMemory) -> memoryview:
+    """
+    Returns the buffer of an open shared memory block.
+
+    :param memory: SharedMemory.
+    :return: memoryview.
+    :raises ValueError: If the block is closed.
+    """
+    if memory.buf is None:
+        raise ValueError(f"Shared memory {memory.name} is closed.")
+    return memory.buf
+
+
+class HeartbeatTable:
+    """
+    Table of heartbeat slots in shared memory. The watchdog creates it (and unlinks it on close), workers attach to
+    it by name.
+    """
+
+    def __init__(self, memory: SharedMemory, owner: bool) -> None:
+        """
+        Wraps a shared memory block holding a table. Use create or attach.
+
+        :param memory: SharedMemory. Block with the header and the slots.
+        :param owner: bool. Whether close unlinks the block.
+        :raises ValueError: If the block does not hold a heartbeat table.
+        """
+        self._memory = memory
+        self._owner = owner
+        magic, n_slots = HEADER.unpack_from(_buffer(memory))
+        if magic != TABLE_MAGIC or memory.size < HEADER.size + n_slots * SLOT_DTYPE.itemsize:
+            memory.close()
+            raise ValueError(f"Shared memory {memory.name} is not a heartbeat table.")
+        self._slots: ndarray[Any, dtype[Any]] = ndarray(
+            (n_slots,), dtype=SLOT_DTYPE, buffer=memory.buf, offset=HEADER.size
+        )
+
+    @classmethod
+    def create(cls, n_slots: int) -> "HeartbeatTable":
+        """
+        Allocates a table with slots that were never written (infinite age).
+
+        :param n_slots: int. Number of workers.
+        :return: HeartbeatTable.
+        """
+        memory = SharedMemory(create=True, size=HEADER.size + max(n_slots, 1) * SLOT_DTYPE.itemsize)
+        HEADER.pack_into(_buffer(memory), 0, TABLE_MAGIC, n_slots)
+        table = cls(memory, owner=True)
+        table._slots["timestamp"] = -inf
+        table._slots["progress"] = 0
+        return table
+
+    @classmethod
+    def attach(cls, name: str) -> "HeartbeatTable":
+        """
+        Attaches to the table of the watchdog.
+
+        :param name: str. Name of the shared memory block, HeartbeatTable.name of the watchdog.
+        :return: HeartbeatTable.
+        """
+        # the watchdog owns the block, the resource tracker of a worker must not unlink it when the worker exits
+        return cls(SharedMemory(name=name, track=False), owner=False)
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the shared memory block, passed to the workers.
+
+        :return: str.
+        """
+        return self._memory.name
+
+    def __len__(self) -> int:
+        """
+        Returns the number of slots.
+
+        :return: int.
+        """
+        return len(self._slots)
+
+    def beat(self, slot: int, progress: int | None = None) -> None:
+        """
+        Writes a heartbeat of a worker.
+
+        :param slot: int. Slot of the worker.
+        :param progress: int | None. Progress to report. None increments the counter.
+        """
+        progresses = self._slots["progress"]
+        progresses[slot] = progresses[slot] + 1 if progress is None else progress
+        self._slots["timestamp"][slot] = time.monotonic()
+
+    def reset(self, slot: int) -> None:
+        """
+        Sets the heartbeat of a worker to now, without changing its progress - used by the watchdog on restart.
+
+        :param slot: int. Slot of the worker.
+        """
+        self._slots["timestamp"][slot] = time.monotonic()
+
+    def ages(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the heartbeat ages of all the slots in one scan.
+
+        :return: ndarray[Any, dtype[Any]]. Seconds since the last heartbeat per slot, infinity if never written.
+        """
+        ages: ndarray[Any, dtype[Any]] = time.monotonic() - self._slots["timestamp"]
+        return ages
+
+    def progress(self, slot: int) -> int:
+        """
+        Returns the progress counter of a worker.
+
+        :param slot: int. Slot of the worker.
+        :return: int.
+        """
+        return int(self._slots["progress"][slot])
+
+    def close(self) -> None:
+        """
+        Detaches from the table. The owner also frees it.
+        """
+        del self._slots
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+class SharedMemoryHeartbeatWatcher(PollingHeartbeatWatcher):
+    """
+    Heartbeat watcher reading the ages of all the workers from a heartbeat table in one scan per check.
+    """
+
+    def __init__(self, table: HeartbeatTable, slots: Mapping[str, int], timeouts: Mapping[str, float]) -> None:
+        """
+        Initialises the watcher.
+
+        :param table: HeartbeatTable. Table the workers write into, closed by its owner.
+        :param slots: Mapping[str, int]. Slot per worker name.
+        :param timeouts: Mapping[str, float]. Heartbeat timeout in seconds per worker name.
+        """
+        self._table = table
+        self._slots = dict(slots)
+        self._timeouts = dict(timeouts)
+        self._ages = table.ages()
+
+    def refresh(self) -> None:
+        """
+        Reads the ages of all the workers.
+        """
+        self._ages = self._table.ages()
+
+    def heartbeat_age_seconds(self, worker_name: str) -> float:
+        """
+        Returns the age of the worker heartbeat in seconds, as of the last refresh.
+
+        :param worker_name: str. Unique worker instance name.
+        :return: float. Seconds since last heartbeat update, or infinity if never written.
+        """
+        return float(self._ages[self._slots[worker_name]])
+
+    def wait(self, max_seconds: float) -> None:
+        """
+        Sleeps max_seconds, or less if the heartbeat of a worker, fresh now, gets older than its timeout first.
+
+        :param max_seconds: float. Longest wait, the check interval.
+        """
+        ages = self._table.ages()
+        until_deadlines = [
+            self._timeouts[name] - ages[slot]
+            for name, slot in self._slots.items()
+            if ages[slot] <= self._timeouts[name]
+        ]
+        time.sleep(min([max_seconds, *(until + DEADLINE_SLACK for until in until_deadlines)]))
+        self.refresh()
+
+
+if __name__ == "__main__":
+    demo_table = HeartbeatTable.create(2)
+    demo_worker_view = HeartbeatTable.attach(demo_table.name)
+    demo_worker_view.beat(1)
+    demo_worker_view.close()
+    demo_watcher = SharedMemoryHeartbeatWatcher(demo_table, {"worker0": 0, "worker1": 1}, {"worker0": 5, "worker1": 5})
+    print(demo_table.name, demo_table.ages(), demo_table.progress(1))
+    print(demo_watcher.heartbeat_age_seconds("worker0"), demo_watcher.heartbeat_age_seconds("worker1"))
+    demo_table.close()
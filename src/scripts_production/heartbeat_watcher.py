@@ -0,0 +1,277 @@
+"""
+Heartbeat watchers of the watchdog.
+
+Every worker touches its heartbeat file ({worker name}.hb in the heartbeat folder) and the watchdog restarts a
+worker whose heartbeat is older than its timeout. Two watchers answer "how old is the heartbeat":
+
+- PollingHeartbeatWatcher stats the heartbeat file of every worker on every check and sleeps between checks, so a
+  frozen worker is found up to a whole check interval late.
+- InotifyHeartbeatWatcher (Linux) watches the heartbeat folder with inotify. A touch (IN_ATTRIB) or a write
+  (IN_CLOSE_WRITE) of a heartbeat file updates its time in memory and arms the deadline of the worker (heartbeat
+  time + timeout). wait returns as soon as the earliest deadline passes, so the check runs right when a worker
+  freezes, and a check costs no system call per worker - only a heartbeat costs one stat.
+
+create_heartbeat_watcher returns the inotify watcher where available and falls back to polling otherwise.
+
+Usage can be found at the end of the file.
+"""
+
+import ctypes
+import ctypes.util
+import heapq
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from src.utils.logger import Logger
+
+HEARTBEAT_SUFFIX = ".hb"
+
+# inotify(7) constants
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+HEARTBEAT_EVENTS = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len of the name
+EVENT_BUFFER_SIZE = 64 * 1024
+# a deadline is reported slightly after it passes, so the heartbeat is then strictly older than the timeout
+DEADLINE_SLACK = 0.01
+
+
+def _heartbeat_mtime(path: Path) -> float | None:
+    """
+    Returns the modification time of a heartbeat file.
+
+    :param path: Path. Heartbeat file.
+    :return: float | None. Modification time, None if the file does not exist.
+    """
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+class PollingHeartbeatWatcher:
+    """
+    Heartbeat watcher reading the modification time of the heartbeat file on every check.
+    """
+
+    def __init__(self, heartbeat_dir: Path, timeouts: Mapping[str, float]) -> None:
+        """
+        Initialises the watcher.
+
+        :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+        :param timeouts: Mapping[str, float]. Heartbeat timeout in seconds per worker name.
+        """
+        self._heartbeat_dir = heartbeat_dir
+        self._timeouts = dict(timeouts)
+
+    def _path(self, worker_name: str) -> Path:
+        """
+        Returns the heartbeat file of a worker.
+
+        :param worker_name: str.
+        :return: Path.
+        """
+        return self._heartbeat_dir / f"{worker_name}{HEARTBEAT_SUFFIX}"
+
+    def fileno(self) -> int | None:
+        """
+        Returns the descriptor that becomes readable when a heartbeat changes, for an event loop to call refresh.
+
+        :return: int | None. None, polling has no descriptor.
+        """
+        return None
+
+    def refresh(self) -> None:
+        """
+        Brings the heartbeat times up to date before a check. Polling reads them in heartbeat_age_seconds.
+        """
+
+    def heartbeat_age_seconds(self, worker_name: str) -> float:
+        """
+        Returns the age of the worker heartbeat in seconds.
+
+        :param worker_name: str. Unique worker instance name.
+        :return: float. Seconds since last heartbeat update, or infinity if missing.
+        """
+        mtime = _heartbeat_mtime(self._path(worker_name))
+        return float("inf") if mtime is None else time.time() - mtime
+
+    def wait(self, max_seconds: float) -> None:
+        """
+        Waits until the next check.
+
+        :param max_seconds: float. Longest wait, the check interval.
+        """
+        time.sleep(max_seconds)
+
+    def close(self) -> None:
+        """
+        Releases the resources of the watcher.
+        """
+
+
+class InotifyHeartbeatWatcher(PollingHeartbeatWatcher):
+    """
+    Heartbeat watcher keeping the heartbeat times in memory from inotify events, with a deadline per worker.
+    """
+
+    def __init__(self, heartbeat_dir: Path, timeouts: Mapping[str, float]) -> None:
+        """
+        Starts watching the heartbeat folder and reads the current heartbeat times once.
+
+        :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+        :param timeouts: Mapping[str, float]. Heartbeat timeout in seconds per worker name.
+        :raises OSError: If inotify is not available.
+        """
+        PollingHeartbeatWatcher.__init__(self, heartbeat_dir, timeouts)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd: int = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(heartbeat_dir), HEARTBEAT_EVENTS) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch of {heartbeat_dir} failed")
+        self._mtimes: dict[str, float | None] = {}
+        self._deadlines: list[tuple[float, str, float]] = []  # heap of (deadline, worker name, heartbeat time)
+        for worker_name in self._timeouts:
+            self._update(worker_name)
+
+    def _update(self, worker_name: str) -> None:
+        """
+        Reads the heartbeat time of a worker and arms its deadline. The previous deadline stays in the heap, stale.
+
+        :param worker_name: str.
+        """
+        mtime = _heartbeat_mtime(self._path(worker_name))
+        self._mtimes[worker_name] = mtime
+        if mtime is not None:
+            heapq.heappush(self._deadlines, (mtime + self._timeouts[worker_name], worker_name, mtime))
+
+    def fileno(self) -> int | None:
+        """
+        Returns the inotify descriptor.
+
+        :return: int | None.
+        """
+        return self._fd
+
+    def refresh(self) -> None:
+        """
+        Reads all the pending events and updates the heartbeat times of the touched files.
+        """
+        touched: set[str] = set()
+        overflow = False
+        while True:
+            try:
+                buffer = os.read(self._fd, EVENT_BUFFER_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                _, mask, _, name_length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = buffer[offset : offset + name_length].rstrip(b"\0").decode(errors="replace")
+                offset += name_length
+                overflow = overflow or bool(mask & IN_Q_OVERFLOW)
+                worker_name = name.removesuffix(HEARTBEAT_SUFFIX)
+                if name.endswith(HEARTBEAT_SUFFIX) and worker_name in self._timeouts:
+                    touched.add(worker_name)
+        if overflow:
+            Logger().warning("Heartbeat event queue overflowed, re-reading all the heartbeat files.")
+            touched = set(self._timeouts)
+        for worker_name in touched:
+            self._update(worker_name)
+
+    def heartbeat_age_seconds(self, worker_name: str) -> float:
+        """
+        Returns the age of the worker heartbeat in seconds, from the time kept in memory.
+
+        :param worker_name: str. Unique worker instance name.
+        :return: float. Seconds since last heartbeat update, or infinity if missing.
+        """
+        if worker_name not in self._timeouts:
+            return PollingHeartbeatWatcher.heartbeat_age_seconds(self, worker_name)
+        mtime = self._mtimes[worker_name]
+        return float("inf") if mtime is None else time.time() - mtime
+
+    def _next_deadline(self) -> float:
+        """
+        Returns the earliest armed deadline, dropping the deadlines of superseded heartbeats.
+
+        :return: float. Time of the deadline, infinity if none is armed.
+        """
+        while self._deadlines and self._mtimes[self._deadlines[0][1]] != self._deadlines[0][2]:
+            heapq.heappop(self._deadlines)
+        return self._deadlines[0][0] if self._deadlines else float("inf")
+
+    def wait(self, max_seconds: float) -> None:
+        """
+        Waits until the next check: max_seconds, or less if the deadline of a worker passes first. A passed deadline
+        is reported once - it is armed again by the next heartbeat of the worker.
+
+        :param max_seconds: float. Longest wait, the check interval.
+        """
+        end = time.time() + max_seconds
+        while True:
+            deadline = self._next_deadline() + DEADLINE_SLACK
+            now = time.time()
+            if deadline <= now:
+                heapq.heappop(self._deadlines)
+                break
+            remaining = min(end, deadline) - now
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if ready:
+                self.refresh()
+        self.refresh()
+
+    def close(self) -> None:
+        """
+        Stops watching.
+        """
+        os.close(self._fd)
+
+
+def create_heartbeat_watcher(
+    heartbeat_dir: Path, timeouts: Mapping[str, float], use_events: bool = True
+) -> PollingHeartbeatWatcher:
+    """
+    Creates the inotify watcher on Linux if use_events is set, the polling watcher otherwise or if inotify fails.
+
+    :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+    :param timeouts: Mapping[str, float]. Heartbeat timeout in seconds per worker name.
+    :param use_events: bool. Whether to use inotify where available.
+    :return: PollingHeartbeatWatcher.
+    """
+    if use_events and sys.platform == "linux":
+        try:
+            return InotifyHeartbeatWatcher(heartbeat_dir, timeouts)
+        except (OSError, AttributeError) as exc:
+            Logger().warning(f"inotify is not available ({exc}), polling the heartbeat files.")
+    return PollingHeartbeatWatcher(heartbeat_dir, timeouts)
+
+
+if __name__ == "__main__":
+    from tempfile import TemporaryDirectory
+
+    with TemporaryDirectory() as demo_dir:
+        demo_watcher = create_heartbeat_watcher(Path(demo_dir), {"worker": 0.5})
+        (Path(demo_dir) / f"worker{HEARTBEAT_SUFFIX}").touch()
+        demo_start = time.time()
+        demo_watcher.wait(0.0)
+        demo_watcher.wait(5.0)
+        print(type(demo_watcher).__name__, f"woke after {time.time() - demo_start:.2f}s")
+        print(f"heartbeat age {demo_watcher.heartbeat_age_seconds('worker'):.2f}s")
+        demo_watcher.close()
@@ -16,6 +16,7 @@ from dotenv import load_dotenv
 sys.path += [str(Path.cwd() / ".."), str(Path.cwd() / "../..")]  # one and two up
 
 from src.scripts_production.heartbeat import HealthcheckHeartbeat, HealthcheckHeartbeatConfig
+from src.scripts_production.heartbeat_table import HeartbeatTable
 from src.scripts_production.watchdog import resolve_ping_url, write_pid
 
 _ENV_PATH = Path(__file__).resolve().parent.parent.parent / ".env"
@@ -54,9 +55,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--heartbeat-folder", required=True, type=str)
     parser.add_argument("--delay", required=True, type=int)
     parser.add_argument("--healthcheck-url-key", required=True, type=str)
+    parser.add_argument("--heartbeat-table", default=None, type=str)
+    parser.add_argument("--heartbeat-slot", default=None, type=int)
     parser.add_argument("--hello", required=True, type=str)
     parser.add_argument("--minute", required=True, type=int)
-    return parser.parse_args()
+    args = parser.parse_args()
+    if (args.heartbeat_table is None) != (args.heartbeat_slot is None):
+        parser.error("--heartbeat-table and --heartbeat-slot have to be given together.")
+    return args
 
 
 def update_heartbeat(heartbeat_file: Path) -> None:
@@ -83,6 +89,7 @@ def main() -> None:
 
     args = parse_args()
     heartbeat_file = Path(args.heartbeat_file)
+    heartbeat_table = HeartbeatTable.attach(args.heartbeat_table) if args.heartbeat_table else None
     write_pid(args.worker_name, Path(args.heartbeat_folder))
 
     ping_url = resolve_ping_url(args.healthcheck_url_key)
@@ -104,12 +111,17 @@ def main() -> None:
                 f"{datetime.now()}: Worker={args.worker_name} PID={os.getpid():06d} delay={args.delay} hello={args.hello}"
             )
 
-            update_heartbeat(heartbeat_file)
+            if heartbeat_table is not None:
+                heartbeat_table.beat(args.heartbeat_slot)
+            else:
+                update_heartbeat(heartbeat_file)
             _STOP_EVENT.wait(args.delay * 60)
         print(f"{datetime.now()}: Worker={args.worker_name} received stop signal, shutting down cleanly.")
     finally:
         if hc_heartbeat is not None:
             hc_heartbeat.stop()
+        if heartbeat_table is not None:
+            heartbeat_table.close()
 
 
 if __name__ == "__main__":
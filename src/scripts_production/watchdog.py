@@ -6,6 +6,8 @@ Watchdog process that monitors and restarts crashed or frozen worker processes.
 """
 
 import argparse
+import asyncio
+import contextlib
 import json
 import logging
 import os
@@ -35,6 +37,15 @@ sys.path += [str(_SCRIPT_DIR / ".."), str(_SCRIPT_DIR / "../..")]
 from src.configurations.watchdog_config import WatchdogConfig  # noqa: E402
 from src.configurations.watchdog_config_data import SupervisionTimingData, WorkerData  # noqa: E402
 from src.scripts_production.heartbeat import HealthcheckHeartbeat, HealthcheckHeartbeatConfig  # noqa: E402
+from src.scripts_production.heartbeat_table import HeartbeatTable, SharedMemoryHeartbeatWatcher  # noqa: E402
+from src.scripts_production.heartbeat_watcher import (  # noqa: E402
+    DEADLINE_SLACK,
+    HEARTBEAT_SUFFIX,
+    PollingHeartbeatWatcher,
+    create_heartbeat_watcher,
+)
+from src.scripts_production.watchdog_metrics import WatchdogMetrics  # noqa: E402
+from src.scripts_production.worker_telemetry import WorkerTelemetry, limit_breach  # noqa: E402
 from src.utils.envs import Envs  # noqa: E402
 from src.utils.logger import Logger  # noqa: E402
 
@@ -48,6 +59,8 @@ PYTHON_EXE = sys.executable
 CONFIG_NAME_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
 
 PROCESSES: dict[str, subprocess.Popen[bytes]] = {}
+# Worker processes of the asyncio supervisor (SupervisionTimingData.asyncio_supervisor), see watchdog_async().
+ASYNC_PROCESSES: dict[str, asyncio.subprocess.Process] = {}
 HC_HEARTBEAT: HealthcheckHeartbeat | None = None
 # Supervision timing tunables (see ADR 0007), read from the watchdog TOML's optional
 # [supervision] table and overwritten from config_data.supervision in __main__ before
@@ -60,6 +73,15 @@ SUPERVISION: SupervisionTimingData = SupervisionTimingData()
 CONSECUTIVE_FAILURES: dict[str, int] = {}
 RESTART_TIMES: dict[str, list[float]] = {}
 NEXT_RESTART_TIME: dict[str, float] = {}
+# Shared-memory heartbeat table (SupervisionTimingData.shared_memory_heartbeats) and the slot of every worker in it,
+# None when the workers touch heartbeat files.
+HEARTBEAT_TABLE: HeartbeatTable | None = None
+HEARTBEAT_SLOTS: dict[str, int] = {}
+# /proc resource samples of the live workers, taken every check (Linux; a no-op elsewhere).
+TELEMETRY = WorkerTelemetry()
+# Supervision metrics, always recorded; exposed over HTTP (SupervisionTimingData.metrics_port) and/or as a textfile
+# (SupervisionTimingData.metrics_textfile).
+METRICS = WatchdogMetrics()
 
 
 def _add_script_file_handler(config_name: str) -> None:
@@ -155,7 +177,7 @@ def heartbeat_path(worker_name: str, heartbeat_dir: Path) -> Path:
     :param heartbeat_dir: Path. Directory where heartbeat files are stored.
     :return: Path. Heartbeat file path.
     """
-    return heartbeat_dir / f"{worker_name}.hb"
+    return heartbeat_dir / f"{worker_name}{HEARTBEAT_SUFFIX}"
 
 
 def write_pid(name: str, heartbeat_dir: Path) -> None:
@@ -188,6 +210,8 @@ def build_command(
     args: list[Any],
     heartbeat_dir: Path,
     healthcheck_url_key: str,
+    *,
+    heartbeat_slot: tuple[str, int] | None = None,
 ) -> list[str]:
     """
     Build the command line for a worker process.
@@ -197,10 +221,17 @@ def build_command(
     :param args: list[Any]. Additional command-line arguments for the worker.
     :param heartbeat_dir: Path. Directory where heartbeat files are stored.
     :param healthcheck_url_key: str. Key to look up the ping URL in HEALTHCHECK_PING_URL.
+    :param heartbeat_slot: tuple[str, int] | None. Name of the shared-memory heartbeat table and the worker's slot
+        in it, passed as --heartbeat-table/--heartbeat-slot. None when the worker touches its heartbeat file.
     :return: list[str]. Full subprocess command.
     """
     script_path = str(_resolve_worker_script(script))
     hb_path = str(heartbeat_path(worker_name, heartbeat_dir))
+    table_args = (
+        []
+        if heartbeat_slot is None
+        else ["--heartbeat-table", heartbeat_slot[0], "--heartbeat-slot", str(heartbeat_slot[1])]
+    )
 
     return [
         PYTHON_EXE,
@@ -214,10 +245,63 @@ def build_command(
         str(heartbeat_dir),
         "--healthcheck-url-key",
         healthcheck_url_key,
+        *table_args,
         *[str(a) for a in args],
     ]
 
 
+def _heartbeat_slot(worker_name: str) -> tuple[str, int] | None:
+    """
+    Return the shared-memory heartbeat table name and slot of a worker.
+
+    :param worker_name: str. Unique worker instance name.
+    :return: tuple[str, int] | None. None when the workers touch heartbeat files.
+    """
+    if HEARTBEAT_TABLE is None:
+        return None
+    return HEARTBEAT_TABLE.name, HEARTBEAT_SLOTS[worker_name]
+
+
+def _open_heartbeat_table(workers: list[WorkerData]) -> None:
+    """
+    Allocate the shared-memory heartbeat table with one slot per worker if ``SUPERVISION.shared_memory_heartbeats``.
+
+    :param workers: list[WorkerData]. List of worker configurations to manage.
+    :return: None.
+    """
+    global HEARTBEAT_TABLE, HEARTBEAT_SLOTS  # noqa: PLW0603
+    if SUPERVISION.shared_memory_heartbeats:
+        HEARTBEAT_TABLE = HeartbeatTable.create(len(workers))
+        HEARTBEAT_SLOTS = {config.name: slot for slot, config in enumerate(workers)}
+        Logger().info(f"Heartbeat table {HEARTBEAT_TABLE.name} allocated for {len(workers)} workers.")
+
+
+def _close_heartbeat_table() -> None:
+    """
+    Free the shared-memory heartbeat table, if any.
+
+    :return: None.
+    """
+    global HEARTBEAT_TABLE  # noqa: PLW0603
+    if HEARTBEAT_TABLE is not None:
+        HEARTBEAT_TABLE.close()
+        HEARTBEAT_TABLE = None
+
+
+def _create_heartbeat_watcher(workers: list[WorkerData], heartbeat_dir: Path) -> PollingHeartbeatWatcher:
+    """
+    Create the heartbeat watcher: the shared-memory table scan if it is allocated, heartbeat files otherwise.
+
+    :param workers: list[WorkerData]. List of worker configurations to manage.
+    :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+    :return: PollingHeartbeatWatcher. Heartbeat watcher of the workers.
+    """
+    timeouts = {config.name: config.timeout for config in workers}
+    if HEARTBEAT_TABLE is not None:
+        return SharedMemoryHeartbeatWatcher(HEARTBEAT_TABLE, HEARTBEAT_SLOTS, timeouts)
+    return create_heartbeat_watcher(heartbeat_dir, timeouts, SUPERVISION.heartbeat_events)
+
+
 def start_worker(config: WorkerData, heartbeat_dir: Path) -> subprocess.Popen[bytes]:
     """
     Start a worker process from configuration.
@@ -236,6 +320,7 @@ def start_worker(config: WorkerData, heartbeat_dir: Path) -> subprocess.Popen[by
         args=config.args,
         heartbeat_dir=heartbeat_dir,
         healthcheck_url_key=config.healthcheck_url_key,
+        heartbeat_slot=_heartbeat_slot(config.name),
     )
     Logger().info(f"Starting {config.name}: {' '.join(command)}")
     if sys.platform == "win32":
@@ -407,7 +492,7 @@ def acquire_single_instance_lock(config_name: str) -> IO[bytes]:
 
 def _reset_heartbeat_on_restart(name: str, heartbeat_dir: Path) -> None:
     """
-    Resets a worker's heartbeat file to "now" immediately after (re)starting it.
+    Resets a worker's heartbeat file (or shared-memory slot) to "now" immediately after (re)starting it.
 
     Without this, a freshly restarted worker that is slow to write its first heartbeat would
     be judged against the previous process's stale ``.hb`` mtime and could be re-flagged as
@@ -417,7 +502,10 @@ def _reset_heartbeat_on_restart(name: str, heartbeat_dir: Path) -> None:
     :param heartbeat_dir: Path. Directory where heartbeat files are stored.
     :return: None.
     """
-    heartbeat_path(name, heartbeat_dir).touch()
+    if HEARTBEAT_TABLE is not None:
+        HEARTBEAT_TABLE.reset(HEARTBEAT_SLOTS[name])
+    else:
+        heartbeat_path(name, heartbeat_dir).touch()
 
 
 def _attempt_restart(config: WorkerData, heartbeat_dir: Path, now: float) -> None:
@@ -448,7 +536,20 @@ def _attempt_restart(config: WorkerData, heartbeat_dir: Path, now: float) -> Non
         return
 
     _reset_heartbeat_on_restart(name, heartbeat_dir)
+    _record_restart(name, now)
 
+
+def _record_restart(name: str, now: float) -> None:
+    """
+    Records a successful restart in the per-worker crash-loop backoff bookkeeping.
+
+    Shared by the sequential (:func:`_attempt_restart`) and asyncio
+    (:func:`_attempt_restart_async`) supervisors.
+
+    :param name: str. Unique worker instance name.
+    :param now: float. Time of the restart (``time.time()``).
+    :return: None.
+    """
     crash_loop_window = SUPERVISION.crash_loop_window
 
     restarts = [*RESTART_TIMES.get(name, []), now]
@@ -459,7 +560,9 @@ def _attempt_restart(config: WorkerData, heartbeat_dir: Path, now: float) -> Non
     delay = compute_backoff_delay(CONSECUTIVE_FAILURES[name], SUPERVISION.backoff_base, SUPERVISION.backoff_cap)
     NEXT_RESTART_TIME[name] = now + delay
 
-    if is_crash_loop(restarts, now, SUPERVISION.crash_loop_count, crash_loop_window):
+    crash_looping = is_crash_loop(restarts, now, SUPERVISION.crash_loop_count, crash_loop_window)
+    METRICS.worker_restarted(name, CONSECUTIVE_FAILURES[name], delay, crash_looping)
+    if crash_looping:
         Logger().critical(
             f"{name} is crash-looping ({len(restarts)} restarts within {crash_loop_window:.0f}s). "
             f"Its healthcheck ping will lapse while the watchdog backs off; retrying every "
@@ -476,17 +579,87 @@ def watchdog(workers: list[WorkerData], heartbeat_dir: Path) -> None:
     :return: None.
     """
     write_pid("watchdog", heartbeat_dir)
+    _open_heartbeat_table(workers)
+    _start_metrics_endpoint()
+    try:
+        for config in workers:
+            try:
+                PROCESSES[config.name] = start_worker(config, heartbeat_dir)
+                METRICS.worker_started(config.name)
+            except Exception as e:
+                Logger().get().error(f"Failed to start worker {config.name} on startup: {e}", exc_info=True)
 
-    for config in workers:
+        Logger().info(f"All workers started. Waiting {SUPERVISION.startup_grace_period:.0f}s before first check...")
+        time.sleep(SUPERVISION.startup_grace_period)
+
+        # The watcher answers the heartbeat ages and ends the wait between passes early when a heartbeat deadline
+        # passes.
+        watcher = _create_heartbeat_watcher(workers, heartbeat_dir)
         try:
-            PROCESSES[config.name] = start_worker(config, heartbeat_dir)
-        except Exception as e:
-            Logger().get().error(f"Failed to start worker {config.name} on startup: {e}", exc_info=True)
+            _supervise(workers, heartbeat_dir, watcher)
+        finally:
+            watcher.close()
+    finally:
+        METRICS.close()
+        _close_heartbeat_table()
+
+
+def _start_metrics_endpoint() -> None:
+    """
+    Start the HTTP metrics endpoint if ``SUPERVISION.metrics_port`` is set.
+
+    :return: None.
+    """
+    if SUPERVISION.metrics_port:
+        port = METRICS.serve(SUPERVISION.metrics_port, SUPERVISION.metrics_host)
+        Logger().info(f"Metrics served at http://{SUPERVISION.metrics_host}:{port}/metrics")
+
+
+def _export_metrics() -> None:
+    """
+    Write the metrics textfile if ``SUPERVISION.metrics_textfile`` is set.
+
+    :return: None.
+    """
+    if SUPERVISION.metrics_textfile:
+        try:
+            METRICS.write_textfile(Path(SUPERVISION.metrics_textfile))
+        except OSError as e:
+            Logger().warning(f"Could not write metrics to {SUPERVISION.metrics_textfile}: {e}")
+
+
+def _resource_limit_breach(config: WorkerData, pid: int) -> str | None:
+    """
+    Sample the resources of a live worker into ``TELEMETRY`` and check its limits.
+
+    The sample also logs a leak-like steady growth of the worker's memory or file descriptors
+    (see :class:`WorkerTelemetry`). A breached ``max_rss_mb``/``max_cpu_pct`` takes the same
+    graceful stop and backoff restart path as a frozen worker, so a leaking worker is recycled
+    before the OOM killer picks a victim.
+
+    :param config: WorkerData. Worker configuration named tuple.
+    :param pid: int. Process ID of the worker.
+    :return: str | None. Description of the exceeded limit, None if within the limits or not sampled.
+    """
+    sample = TELEMETRY.sample(config.name, pid)
+    if sample is None:
+        return None
+    METRICS.worker_sampled(config.name, sample)
+    return limit_breach(config, sample)
 
-    Logger().info(f"All workers started. Waiting {SUPERVISION.startup_grace_period:.0f}s before first check...")
-    time.sleep(SUPERVISION.startup_grace_period)
 
+def _supervise(workers: list[WorkerData], heartbeat_dir: Path, watcher: PollingHeartbeatWatcher) -> None:
+    """
+    Runs the health-check passes of the watchdog forever.
+
+    :param workers: list[WorkerData]. List of worker configurations to manage.
+    :param heartbeat_dir: Path. Directory where heartbeat and PID files are stored.
+    :param watcher: PollingHeartbeatWatcher. Heartbeat watcher of the workers.
+    :return: None.
+    """
     while True:
+        pass_start = time.perf_counter()
+        watcher.refresh()
         for config in workers:
             name = config.name
             timeout = config.timeout
@@ -499,7 +672,9 @@ def watchdog(workers: list[WorkerData], heartbeat_dir: Path) -> None:
 
             try:
                 crashed = not process_alive(process)
-                frozen = heartbeat_age_seconds(name, heartbeat_dir) > timeout
+                heartbeat_age = watcher.heartbeat_age_seconds(name)
+                frozen = heartbeat_age > timeout
+                METRICS.worker_checked(name, alive=not crashed, heartbeat_age=heartbeat_age)
 
                 if crashed:
                     Logger().warning(f"{name} crashed. Restarting...")
@@ -511,12 +686,277 @@ def watchdog(workers: list[WorkerData], heartbeat_dir: Path) -> None:
                     Logger().warning(f"{name} frozen. Restarting...")
                     stop_worker(process, name)
                     _attempt_restart(config, heartbeat_dir, now)
+                    continue
+
+                breach = _resource_limit_breach(config, process.pid)
+                if breach is not None:
+                    Logger().warning(f"{name} {breach}. Restarting...")
+                    stop_worker(process, name)
+                    _attempt_restart(config, heartbeat_dir, now)
 
             except Exception as e:
                 Logger().get().error(f"Error managing worker {name}: {e}", exc_info=True)
 
-        (heartbeat_dir / "watchdog.hb").touch()
-        time.sleep(SUPERVISION.check_interval)
+        METRICS.check_finished(time.perf_counter() - pass_start)
+        _export_metrics()
+        heartbeat_path("watchdog", heartbeat_dir).touch()
+        watcher.wait(SUPERVISION.check_interval)
+
+
+# ---------------------------------------------------------------------------
+# asyncio supervisor
+# ---------------------------------------------------------------------------
+async def start_worker_async(config: WorkerData, heartbeat_dir: Path) -> asyncio.subprocess.Process:
+    """
+    Start a worker process from configuration with ``asyncio.create_subprocess_exec``.
+
+    Same command and Windows process group as :func:`start_worker`. The event loop reports the
+    exit of the child (pidfd where the platform supports it, otherwise a waitpid thread), so an
+    awaiting ``process.wait()`` returns as soon as the worker dies.
+
+    :param config: WorkerData. Worker configuration named tuple.
+    :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+    :return: asyncio.subprocess.Process. Started process handle.
+    """
+    command = build_command(
+        script=config.script,
+        worker_name=config.name,
+        args=config.args,
+        heartbeat_dir=heartbeat_dir,
+        healthcheck_url_key=config.healthcheck_url_key,
+        heartbeat_slot=_heartbeat_slot(config.name),
+    )
+    Logger().info(f"Starting {config.name}: {' '.join(command)}")
+    if sys.platform == "win32":
+        return await asyncio.create_subprocess_exec(
+            *command, cwd=str(BASE_DIR), creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:  # noqa: RET505 - branch kept explicit so mypy's sys.platform narrowing checks both sides
+        return await asyncio.create_subprocess_exec(*command, cwd=str(BASE_DIR))
+
+
+async def stop_worker_async(process: asyncio.subprocess.Process, name: str) -> None:
+    """
+    Stop a worker process gracefully, falling back to a hard kill - the asyncio :func:`stop_worker`.
+
+    Only this worker's task waits the ``SUPERVISION.stop_grace_period``, so stops of several
+    workers (and the checks of all the others) run concurrently.
+
+    :param process: asyncio.subprocess.Process. Process handle.
+    :param name: str. Worker name for logging.
+    :return: None.
+    """
+    if process.returncode is not None:
+        Logger().info(f"Worker {name} is already terminated (exit code: {process.returncode}).")
+        return
+
+    Logger().info(f"Stopping {name} (graceful)...")
+    if sys.platform == "win32":
+        os.kill(process.pid, signal.CTRL_BREAK_EVENT)
+    else:
+        process.send_signal(signal.SIGTERM)
+    try:
+        await asyncio.wait_for(process.wait(), timeout=SUPERVISION.stop_grace_period)
+        Logger().info(f"Worker {name} terminated gracefully.")
+    except TimeoutError:
+        Logger().warning(f"Worker {name} did not exit in time, forcing kill...")
+        process.kill()
+        await process.wait()
+
+
+async def _attempt_restart_async(config: WorkerData, heartbeat_dir: Path) -> None:
+    """
+    Restarts a worker once its crash-loop backoff window has elapsed - the asyncio :func:`_attempt_restart`.
+
+    Instead of skipping the restart until a later pass, the worker's task sleeps out the backoff,
+    which blocks no other worker. A failed start drops the handle of the dead process, so nothing
+    samples its pid, which the system may reuse, and is retried after ``SUPERVISION.check_interval``.
+
+    :param config: WorkerData. Worker configuration named tuple.
+    :param heartbeat_dir: Path. Directory where heartbeat and PID files are stored.
+    :return: None.
+    """
+    name = config.name
+    backoff = NEXT_RESTART_TIME.get(name, 0.0) - time.time()
+    if backoff > 0:
+        await asyncio.sleep(backoff)
+
+    try:
+        ASYNC_PROCESSES[name] = await start_worker_async(config, heartbeat_dir)
+    except Exception as e:
+        ASYNC_PROCESSES.pop(name, None)
+        Logger().get().error(f"Failed to restart worker {name}: {e}", exc_info=True)
+        await asyncio.sleep(SUPERVISION.check_interval)
+        return
+
+    _reset_heartbeat_on_restart(name, heartbeat_dir)
+    _record_restart(name, time.time())
+
+
+async def _supervise_worker_async(config: WorkerData, heartbeat_dir: Path, watcher: PollingHeartbeatWatcher) -> None:
+    """
+    Supervises one worker forever: waits for the exit of its process until its heartbeat deadline.
+
+    A crash ends the wait at once. Otherwise the wait ends when the heartbeat gets older than
+    ``config.timeout`` - then the worker is frozen - or after ``SUPERVISION.check_interval``, to
+    read the heartbeat again if the watcher polls.
+
+    :param config: WorkerData. Worker configuration named tuple.
+    :param heartbeat_dir: Path. Directory where heartbeat and PID files are stored.
+    :param watcher: PollingHeartbeatWatcher. Heartbeat watcher of the workers.
+    :return: None.
+    """
+    name = config.name
+    while True:
+        try:
+            process = ASYNC_PROCESSES.get(name)
+            if process is None:
+                await _attempt_restart_async(config, heartbeat_dir)
+                continue
+
+            check_start = time.perf_counter()
+            watcher.refresh()
+            heartbeat_age = watcher.heartbeat_age_seconds(name)
+            METRICS.worker_checked(name, alive=process.returncode is None, heartbeat_age=heartbeat_age)
+            until_frozen = config.timeout - heartbeat_age
+            if until_frozen < 0:
+                Logger().warning(f"{name} frozen. Restarting...")
+                await stop_worker_async(process, name)
+                await _attempt_restart_async(config, heartbeat_dir)
+                continue
+
+            # an exited process is not sampled, its pid may already belong to another process
+            breach = _resource_limit_breach(config, process.pid) if process.returncode is None else None
+            METRICS.check_finished(time.perf_counter() - check_start)
+            if breach is not None:
+                Logger().warning(f"{name} {breach}. Restarting...")
+                await stop_worker_async(process, name)
+                await _attempt_restart_async(config, heartbeat_dir)
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    process.wait(), timeout=min(until_frozen + DEADLINE_SLACK, SUPERVISION.check_interval)
+                )
+            except TimeoutError:
+                continue
+            METRICS.worker_checked(name, alive=False, heartbeat_age=watcher.heartbeat_age_seconds(name))
+            Logger().warning(f"{name} crashed. Restarting...")
+            await _attempt_restart_async(config, heartbeat_dir)
+
+        except Exception as e:
+            Logger().get().error(f"Error managing worker {name}: {e}", exc_info=True)
+            await asyncio.sleep(SUPERVISION.check_interval)
+
+
+async def _touch_watchdog_heartbeat(heartbeat_dir: Path) -> None:
+    """
+    Touches the watchdog's own heartbeat file and exports the metrics textfile every ``SUPERVISION.check_interval``
+    forever.
+
+    :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+    :return: None.
+    """
+    while True:
+        _export_metrics()
+        heartbeat_path("watchdog", heartbeat_dir).touch()
+        await asyncio.sleep(SUPERVISION.check_interval)
+
+
+async def _start_worker_on_startup(config: WorkerData, heartbeat_dir: Path) -> None:
+    """
+    Starts a worker when the watchdog starts, logging a failure (the worker's task retries it).
+
+    :param config: WorkerData. Worker configuration named tuple.
+    :param heartbeat_dir: Path. Directory where heartbeat files are stored.
+    :return: None.
+    """
+    try:
+        ASYNC_PROCESSES[config.name] = await start_worker_async(config, heartbeat_dir)
+        METRICS.worker_started(config.name)
+    except Exception as e:
+        Logger().get().error(f"Failed to start worker {config.name} on startup: {e}", exc_info=True)
+
+
+def _register_stop_signals(stop: asyncio.Event) -> None:
+    """
+    Sets the stop event on SIGINT and SIGTERM.
+
+    :param stop: asyncio.Event. Event ending watchdog_async.
+    :return: None.
+    """
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        if sys.platform == "win32":
+            signal.signal(signal_number, lambda _signum, _frame: loop.call_soon_threadsafe(stop.set))
+        else:
+            loop.add_signal_handler(signal_number, stop.set)
+
+
+async def watchdog_async(workers: list[WorkerData], heartbeat_dir: Path, stop: asyncio.Event | None = None) -> None:
+    """
+    Monitor all configured workers with one asyncio task per worker and restart crashed or frozen ones.
+
+    Unlike :func:`watchdog`, one slow stop or backoff does not delay the checks of the other
+    workers, crashes are seen when they happen, and workers are started, stopped and restarted
+    concurrently. Heartbeat events of the watcher (inotify) are read by the event loop. On stop
+    (SIGINT/SIGTERM, or the given event) all the workers are stopped concurrently.
+
+    :param workers: list[WorkerData]. List of worker configurations to manage.
+    :param heartbeat_dir: Path. Directory where heartbeat and PID files are stored.
+    :param stop: asyncio.Event | None. Event ending the supervision. None to register SIGINT and SIGTERM handlers.
+    :return: None.
+    """
+    if stop is None:
+        stop = asyncio.Event()
+        _register_stop_signals(stop)
+    write_pid("watchdog", heartbeat_dir)
+    _open_heartbeat_table(workers)
+    _start_metrics_endpoint()
+    try:
+        await _watchdog_async(workers, heartbeat_dir, stop)
+    finally:
+        METRICS.close()
+        _close_heartbeat_table()
+
+
+async def _watchdog_async(workers: list[WorkerData], heartbeat_dir: Path, stop: asyncio.Event) -> None:
+    """
+    Starts the workers, supervises them until the stop event and stops them - the body of :func:`watchdog_async`.
+
+    :param workers: list[WorkerData]. List of worker configurations to manage.
+    :param heartbeat_dir: Path. Directory where heartbeat and PID files are stored.
+    :param stop: asyncio.Event. Event ending the supervision.
+    :return: None.
+    """
+    await asyncio.gather(*(_start_worker_on_startup(config, heartbeat_dir) for config in workers))
+    Logger().info(f"All workers started. Waiting {SUPERVISION.startup_grace_period:.0f}s before first check...")
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(stop.wait(), timeout=SUPERVISION.startup_grace_period)
+
+    watcher = _create_heartbeat_watcher(workers, heartbeat_dir)
+    loop = asyncio.get_running_loop()
+    watcher_fd = watcher.fileno()
+    if watcher_fd is not None:
+        loop.add_reader(watcher_fd, watcher.refresh)
+    tasks = [asyncio.create_task(_touch_watchdog_heartbeat(heartbeat_dir))] + [
+        asyncio.create_task(_supervise_worker_async(config, heartbeat_dir, watcher)) for config in workers
+    ]
+    try:
+        await stop.wait()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if watcher_fd is not None:
+            loop.remove_reader(watcher_fd)
+        watcher.close()
+
+    Logger().info("Shutdown signal received. Stopping all workers...")
+    await asyncio.gather(*(stop_worker_async(process, name) for name, process in ASYNC_PROCESSES.items()))
+    if HC_HEARTBEAT is not None:
+        HC_HEARTBEAT.stop()
+    Logger().info("All workers stopped. Exiting.")
 
 
 if __name__ == "__main__":
@@ -551,8 +991,11 @@ if __name__ == "__main__":
         )
         HC_HEARTBEAT.start()
 
+    Logger().info(f"Watchdog Name: {config_data.name}, PID: {os.getpid()}")
+    if SUPERVISION.asyncio_supervisor:
+        asyncio.run(watchdog_async(config_data.workers, heartbeat_dir))
+        sys.exit(0)
+
     signal.signal(signal.SIGINT, shutdown_handler)
     signal.signal(signal.SIGTERM, shutdown_handler)
-
-    Logger().info(f"Watchdog Name: {config_data.name}, PID: {os.getpid()}")
     watchdog(config_data.workers, heartbeat_dir)
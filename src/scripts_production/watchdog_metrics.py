@@ -0,0 +1,297 @@
+"""
+Supervision metrics of the watchdog in the Prometheus text / OpenMetrics format.
+
+The watchdog records into WatchdogMetrics what it otherwise only logs - starts and restarts, consecutive failures,
+backoff, crash loops, heartbeat ages, the resources of the workers and the duration of the checks - and exposes it:
+- over HTTP: serve starts a local endpoint (GET /metrics) in a daemon thread, answering OpenMetrics to scrapers
+  asking for it (Accept: application/openmetrics-text) and the Prometheus text format otherwise,
+- as a textfile: write_textfile atomically replaces a .prom file for the node_exporter textfile collector.
+
+Per worker (label worker):
+- watchdog_worker_up: 1 if the process was alive at its last check.
+- watchdog_worker_uptime_seconds: since the start of the current process.
+- watchdog_worker_restarts_total: restarts since the watchdog started (counter).
+- watchdog_worker_consecutive_failures: restarts in a row the backoff is based on.
+- watchdog_worker_backoff_seconds: current restart backoff delay.
+- watchdog_worker_crash_looping: 1 if the worker is in a crash loop.
+- watchdog_worker_heartbeat_age_seconds: at the last check, +Inf if missing.
+- watchdog_worker_resident_memory_bytes, watchdog_worker_cpu_percent, watchdog_worker_open_fds: last /proc sample.
+Of the watchdog:
+- watchdog_check_duration_seconds: duration of the last check pass (the last worker check of the asyncio supervisor).
+- watchdog_checks_total: number of check passes (worker checks of the asyncio supervisor) (counter).
+
+Usage can be found at the end of the file.
+"""
+
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import NamedTuple
+
+from src.scripts_production.worker_telemetry import ResourceSample
+
+METRICS_PATH = "/metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPEN_METRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+KB = 1024
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+
+
+class MetricDefinition(NamedTuple):
+    """
+    Tuple for storing the description of one metric.
+    - name: str. Without the _total suffix of counters.
+    - kind: str. "gauge" or "counter".
+    - help: str. Description of the metric.
+    """
+
+    name: str
+    kind: str
+    help: str
+
+
+WORKER_METRICS = (
+    MetricDefinition("watchdog_worker_up", "gauge", "1 if the worker process was alive at its last check."),
+    MetricDefinition("watchdog_worker_uptime_seconds", "gauge", "Seconds since the start of the worker process."),
+    MetricDefinition("watchdog_worker_restarts", "counter", "Restarts of the worker since the watchdog started."),
+    MetricDefinition("watchdog_worker_consecutive_failures", "gauge", "Restarts in a row the backoff is based on."),
+    MetricDefinition("watchdog_worker_backoff_seconds", "gauge", "Current restart backoff delay of the worker."),
+    MetricDefinition("watchdog_worker_crash_looping", "gauge", "1 if the worker is in a crash loop."),
+    MetricDefinition("watchdog_worker_heartbeat_age_seconds", "gauge", "Heartbeat age at the last check."),
+    MetricDefinition("watchdog_worker_resident_memory_bytes", "gauge", "Resident memory at the last sample."),
+    MetricDefinition("watchdog_worker_cpu_percent", "gauge", "CPU use since the previous sample, 100 per core."),
+    MetricDefinition("watchdog_worker_open_fds", "gauge", "Open file descriptors at the last sample."),
+)
+WATCHDOG_METRICS = (
+    MetricDefinition("watchdog_check_duration_seconds", "gauge", "Duration of the last check."),
+    MetricDefinition("watchdog_checks", "counter", "Number of checks."),
+)
+
+
+def _format_value(value: float) -> str:
+    """
+    Formats a sample value.
+
+    :param value: float.
+    :return: str. E.g. "1.5", "+Inf", "NaN".
+    """
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escapes a label value.
+
+    :param value: str.
+    :return: str. With backslash, double quote and new line escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class WatchdogMetrics:
+    """
+    Thread-safe recorder of the supervision metrics and their exposition.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialises empty metrics.
+        """
+        self._lock = threading.Lock()
+        self._workers: dict[str, dict[str, float]] = {}
+        self._check_duration = 0.0
+        self._checks = 0
+        self._server: ThreadingHTTPServer | None = None
+
+    def _worker(self, name: str) -> dict[str, float]:
+        """
+        Returns the values of a worker, creating them at zero. Must be called under the lock.
+
+        :param name: str. Worker name.
+        :return: Dict[str, float]. Values per metric name; started_at is the start time of the process.
+        """
+        if name not in self._workers:
+            self._workers[name] = {definition.name: 0.0 for definition in WORKER_METRICS} | {"started_at": math.nan}
+        return self._workers[name]
+
+    def worker_started(self, name: str) -> None:
+        """
+        Records a start of a worker process.
+
+        :param name: str. Worker name.
+        """
+        with self._lock:
+            worker = self._worker(name)
+            worker["started_at"] = time.time()
+            worker["watchdog_worker_up"] = 1.0
+
+    def worker_restarted(self, name: str, consecutive_failures: int, backoff: float, crash_looping: bool) -> None:
+        """
+        Records a restart of a worker and its backoff state.
+
+        :param name: str. Worker name.
+        :param consecutive_failures: int. Restarts in a row.
+        :param backoff: float. Backoff delay before the next restart is allowed.
+        :param crash_looping: bool. Whether the worker is in a crash loop.
+        """
+        self.worker_started(name)
+        with self._lock:
+            worker = self._worker(name)
+            worker["watchdog_worker_restarts"] += 1
+            worker["watchdog_worker_consecutive_failures"] = consecutive_failures
+            worker["watchdog_worker_backoff_seconds"] = backoff
+            worker["watchdog_worker_crash_looping"] = float(crash_looping)
+
+    def worker_checked(self, name: str, alive: bool, heartbeat_age: float) -> None:
+        """
+        Records a check of a worker.
+
+        :param name: str. Worker name.
+        :param alive: bool. Whether the process was alive.
+        :param heartbeat_age: float. Heartbeat age in seconds.
+        """
+        with self._lock:
+            worker = self._worker(name)
+            worker["watchdog_worker_up"] = float(alive)
+            worker["watchdog_worker_heartbeat_age_seconds"] = heartbeat_age
+
+    def worker_sampled(self, name: str, sample: ResourceSample) -> None:
+        """
+        Records a resource sample of a worker.
+
+        :param name: str. Worker name.
+        :param sample: ResourceSample.
+        """
+        with self._lock:
+            worker = self._worker(name)
+            worker["watchdog_worker_resident_memory_bytes"] = sample.rss_mb * KB * KB
+            worker["watchdog_worker_cpu_percent"] = sample.cpu_percent
+            worker["watchdog_worker_open_fds"] = sample.n_fds
+
+    def check_finished(self, duration: float) -> None:
+        """
+        Records a finished check.
+
+        :param duration: float. Duration of the check in seconds.
+        """
+        with self._lock:
+            self._check_duration = duration
+            self._checks += 1
+
+    def render(self, open_metrics: bool = False) -> str:
+        """
+        Renders all the metrics.
+
+        :param open_metrics: bool. OpenMetrics (counter families without _total, # EOF at the end) instead of the
+            Prometheus text format.
+        :return: str.
+        """
+        now = time.time()
+        lines: list[str] = []
+        with self._lock:
+            values = {
+                name: worker
+                | {
+                    "watchdog_worker_uptime_seconds": 0.0
+                    if math.isnan(worker["started_at"])
+                    else now - worker["started_at"]
+                }
+                for name, worker in sorted(self._workers.items())
+            }
+            watchdog_values = {"watchdog_check_duration_seconds": self._check_duration, "watchdog_checks": self._checks}
+        for definition in (*WORKER_METRICS, *WATCHDOG_METRICS):
+            sample_name = definition.name + ("_total" if definition.kind == "counter" else "")
+            family = definition.name if open_metrics else sample_name
+            lines += [f"# HELP {family} {definition.help}", f"# TYPE {family} {definition.kind}"]
+            if definition in WORKER_METRICS:
+                lines += [
+                    f'{sample_name}{{worker="{_escape_label(name)}"}} {_format_value(worker[definition.name])}'
+                    for name, worker in values.items()
+                ]
+            else:
+                lines.append(f"{sample_name} {_format_value(watchdog_values[definition.name])}")
+        if open_metrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """
+        Writes the metrics in the Prometheus text format for the textfile collector, replacing the file atomically.
+
+        :param path: Path. E.g. /var/lib/node_exporter/textfile_collector/watchdog.prom.
+        """
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(self.render(), encoding="utf-8")
+        temporary.replace(path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """
+        Starts the HTTP endpoint GET /metrics in a daemon thread.
+
+        :param port: int. Port, 0 for any free one.
+        :param host: str. Interface to listen on, loopback by default.
+        :return: int. Port listened on.
+        """
+        metrics = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            """
+            Answers GET /metrics.
+            """
+
+            def do_GET(self) -> None:
+                """
+                Sends the metrics, in OpenMetrics if the scraper accepts it.
+                """
+                if self.path.split("?")[0] != METRICS_PATH:
+                    self.send_error(HTTP_NOT_FOUND)
+                    return
+                open_metrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = metrics.render(open_metrics).encode("utf-8")
+                self.send_response(HTTP_OK)
+                self.send_header("Content-Type", OPEN_METRICS_CONTENT_TYPE if open_metrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                """
+                Does not log the scrapes.
+                """
+
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="watchdog-metrics", daemon=True).start()
+        return self._server.server_address[1]
+
+    def close(self) -> None:
+        """
+        Stops the HTTP endpoint, if started.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+if __name__ == "__main__":
+    from urllib.request import urlopen
+
+    demo_metrics = WatchdogMetrics()
+    demo_metrics.worker_started("worker-1")
+    demo_metrics.worker_checked("worker-1", alive=True, heartbeat_age=2.5)
+    demo_metrics.worker_restarted("worker-2", consecutive_failures=3, backoff=16.0, crash_looping=False)
+    demo_metrics.worker_checked("worker-2", alive=True, heartbeat_age=math.inf)
+    demo_metrics.check_finished(0.004)
+    demo_port = demo_metrics.serve(0)
+    with urlopen(f"http://127.0.0.1:{demo_port}{METRICS_PATH}") as demo_response:  # nosec
+        print(demo_response.read().decode("utf-8"))
+    demo_metrics.close()
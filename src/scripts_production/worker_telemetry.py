@@ -0,0 +1,223 @@
+"""
+Resource telemetry of the watchdog workers.
+
+Every check the watchdog samples the resources of each live worker from /proc (Linux):
+- /proc/<pid>/stat: CPU time (utime + stime), from which the CPU % since the previous sample is computed,
+- /proc/<pid>/status: resident memory (VmRSS) and number of threads,
+- /proc/<pid>/io: bytes read and written by the storage layer (0 if not readable),
+- /proc/<pid>/fd: number of open file descriptors.
+
+The samples of each worker are kept in a ring buffer (deque of HISTORY_LENGTH samples, reset when the worker gets a
+new PID). A steady growth of the memory or of the file descriptors over the whole buffer - the signature of a slowly
+leaking worker - is logged once per episode. limit_breach compares a sample with the max_rss_mb / max_cpu_pct
+limits of the worker, so the watchdog restarts it gracefully before the OOM killer does.
+
+On platforms without /proc sampling returns None and the telemetry is a no-op.
+
+Usage can be found at the end of the file.
+"""
+
+import os
+import time
+from collections import deque
+from itertools import pairwise
+from pathlib import Path
+from typing import NamedTuple
+
+from src.configurations.watchdog_config_data import WorkerData
+from src.utils.logger import Logger
+
+PROC_DIR = Path("/proc")
+HISTORY_LENGTH = 60
+# growth of a resource over the whole (full) history, every sample at least the previous one, reported as a leak
+LEAK_GROWTH = 0.5
+KB_PER_MB = 1024
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+STAT_UTIME_INDEX = 11  # fields of /proc/<pid>/stat after "pid (comm) ", utime is the 14th field
+STAT_STIME_INDEX = 12
+
+
+class ResourceSample(NamedTuple):
+    """
+    Tuple for storing one resource sample of a worker.
+    - time: float. time.monotonic() of the sample.
+    - cpu_seconds: float. CPU time used by the process so far (user + system).
+    - cpu_percent: float. CPU use since the previous sample of the same process, 100 for one full core. 0 for the
+      first sample.
+    - rss_mb: float. Resident memory.
+    - n_threads: int.
+    - n_fds: int. Open file descriptors.
+    - read_bytes: int. Bytes read from storage (0 if /proc/<pid>/io is not readable).
+    - write_bytes: int. Bytes written to storage (0 if /proc/<pid>/io is not readable).
+    """
+
+    time: float
+    cpu_seconds: float
+    cpu_percent: float
+    rss_mb: float
+    n_threads: int
+    n_fds: int
+    read_bytes: int
+    write_bytes: int
+
+
+def _read_key_values(path: Path) -> dict[str, str]:
+    """
+    Reads a /proc file of "key: value" lines.
+
+    :param path: Path. E.g. /proc/<pid>/status.
+    :return: Dict[str, str]. Values stripped of whitespace, empty if the file is not readable.
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+    return {key.strip(): value.strip() for key, _, value in (line.partition(":") for line in lines)}
+
+
+def read_process_resources(pid: int, previous: ResourceSample | None = None) -> ResourceSample | None:
+    """
+    Reads the resources of a process from /proc.
+
+    :param pid: int. Process ID.
+    :param previous: ResourceSample | None. Previous sample of the same process, for the CPU %.
+    :return: ResourceSample | None. None if the process (or /proc) does not exist.
+    """
+    process_dir = PROC_DIR / str(pid)
+    now = time.monotonic()
+    try:
+        stat = (process_dir / "stat").read_text(encoding="utf-8")
+        n_fds = sum(1 for _ in (process_dir / "fd").iterdir())
+    except OSError:
+        return None
+    # the command name may contain spaces and parentheses, the fields start after its last ")"
+    fields = stat[stat.rindex(")") + 2 :].split()
+    cpu_seconds = (int(fields[STAT_UTIME_INDEX]) + int(fields[STAT_STIME_INDEX])) / CLOCK_TICKS
+    status = _read_key_values(process_dir / "status")
+    io = _read_key_values(process_dir / "io")
+    cpu_percent = 0.0
+    if previous is not None and now > previous.time:
+        cpu_percent = 100.0 * (cpu_seconds - previous.cpu_seconds) / (now - previous.time)
+    return ResourceSample(
+        time=now,
+        cpu_seconds=cpu_seconds,
+        cpu_percent=cpu_percent,
+        rss_mb=int(status.get("VmRSS", "0 kB").split()[0]) / KB_PER_MB,
+        n_threads=int(status.get("Threads", "0")),
+        n_fds=n_fds,
+        read_bytes=int(io.get("read_bytes", "0")),
+        write_bytes=int(io.get("write_bytes", "0")),
+    )
+
+
+def limit_breach(config: WorkerData, sample: ResourceSample) -> str | None:
+    """
+    Compares a sample with the resource limits of a worker.
+
+    :param config: WorkerData. Worker configuration with optional max_rss_mb and max_cpu_pct.
+    :param sample: ResourceSample.
+    :return: str | None. Description of the exceeded limit, None if within the limits.
+    """
+    if config.max_rss_mb is not None and sample.rss_mb > config.max_rss_mb:
+        return f"RSS {sample.rss_mb:.0f} MB over the limit of {config.max_rss_mb:.0f} MB"
+    if config.max_cpu_pct is not None and sample.cpu_percent > config.max_cpu_pct:
+        return f"CPU {sample.cpu_percent:.0f} % over the limit of {config.max_cpu_pct:.0f} %"
+    return None
+
+
+def _steady_growth(values: list[float], growth: float) -> bool:
+    """
+    Checks whether values never decrease and the last one is above the first one by more than growth.
+
+    :param values: List[float].
+    :param growth: float. Relative growth, e.g. 0.5 for 50 %.
+    :return: bool.
+    """
+    never_decreasing = all(later >= earlier for earlier, later in pairwise(values))
+    return never_decreasing and values[-1] > values[0] * (1 + growth)
+
+
+class WorkerTelemetry:
+    """
+    Samples the resources of the workers and keeps their recent history.
+    """
+
+    def __init__(self, history_length: int = HISTORY_LENGTH) -> None:
+        """
+        Initialises empty histories.
+
+        :param history_length: int. Number of samples kept per worker.
+        """
+        self._history_length = history_length
+        self._pids: dict[str, int] = {}
+        self._history: dict[str, deque[ResourceSample]] = {}
+        self._reported: set[tuple[str, str]] = set()
+
+    def sample(self, name: str, pid: int) -> ResourceSample | None:
+        """
+        Samples a worker and logs the start of a leak-like growth of its memory or file descriptors.
+
+        :param name: str. Worker name.
+        :param pid: int. Current process ID of the worker, a new one resets its history.
+        :return: ResourceSample | None. None if the process cannot be sampled.
+        """
+        if self._pids.get(name) != pid:
+            self._pids[name] = pid
+            self._history[name] = deque(maxlen=self._history_length)
+        history = self._history[name]
+        sample = read_process_resources(pid, history[-1] if history else None)
+        if sample is not None:
+            history.append(sample)
+            self._log_anomalies(name)
+        return sample
+
+    def history(self, name: str) -> list[ResourceSample]:
+        """
+        Returns the samples of the current process of a worker, the oldest first.
+
+        :param name: str. Worker name.
+        :return: List[ResourceSample].
+        """
+        return list(self._history.get(name, ()))
+
+    def anomalies(self, name: str) -> list[str]:
+        """
+        Returns the resources of a worker that grew steadily over its whole (full) history.
+
+        :param name: str. Worker name.
+        :return: List[str]. Subset of "rss_mb" and "n_fds".
+        """
+        history = self._history.get(name)
+        if history is None or len(history) < self._history_length:
+            return []
+        return [
+            resource
+            for resource in ("rss_mb", "n_fds")
+            if _steady_growth([float(getattr(sample, resource)) for sample in history], LEAK_GROWTH)
+        ]
+
+    def _log_anomalies(self, name: str) -> None:
+        """
+        Logs an anomaly of a worker once, when it appears; it is logged again only after it disappears.
+
+        :param name: str. Worker name.
+        """
+        anomalies = set(self.anomalies(name))
+        for resource in anomalies:
+            if (name, resource) not in self._reported:
+                first, last = self._history[name][0], self._history[name][-1]
+                Logger().warning(
+                    f"{name} {resource} grew steadily from {getattr(first, resource):.0f} to "
+                    f"{getattr(last, resource):.0f} over {last.time - first.time:.0f}s - possible leak."
+                )
+        self._reported = {key for key in self._reported if key[0] != name} | {
+            (name, resource) for resource in anomalies
+        }
+
+
+if __name__ == "__main__":
+    demo_telemetry = WorkerTelemetry()
+    demo_telemetry.sample("self", os.getpid())
+    sum(range(10_000_000))
+    print(demo_telemetry.sample("self", os.getpid()))
+    print(limit_breach(WorkerData("self", "", [], 30.0, max_rss_mb=1.0), demo_telemetry.history("self")[-1]))
@@ -5,14 +5,42 @@ Transformers are classes for data transformation and manipulation. They are not
 
 IMPORTANT NOTE: Data consistency is not checked here, the data input can be any and needs to be specified in child
 classes. Solution which would handle it in general in python environment would be too time-consuming.
+
+The output dtype of a transformer created without dtype follows the project policy of ApplicationConfig
+(transformation_dtypes): the dtype of its kind of output - indicator (0/1), integer or real - see resolve_output_dtype.
+
+predict_parallel splits the rows of the input into contiguous blocks and runs predict_into of every block in a thread
+or process pool, each block writing its own rows of one preallocated output, so the result does not depend on the
+order in which the blocks finish.
 """
 
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import pairwise
+from math import ceil
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
 from typing import Any
 
+from numpy import dtype, linspace, ndarray, result_type
+from numpy.typing import DTypeLike
+from scipy.sparse import issparse, vstack
+
+from src.exceptions.development_exception import IncorrectValue, NoProperOptionInIf, NotReadyFunctionality
+from src.exceptions.exception_executioner import ExceptionExecutioner
+from src.transformations.transformer_state import load_state, save_state
+from src.utils.application_config import ApplicationConfig
 from src.utils.monitored_base import TRANSFORMER_TYPE_NAME, MonitoredBase, TransformerDescription
 
-__all__ = ["BaseTransformer", "TransformerDescription"]
+__all__ = ["BaseTransformer", "TransformerDescription", "resolve_output_dtype"]
+
+# numpy dtype kinds allowed per kind of output: b bool, u unsigned, i signed integer, f float
+OUTPUT_DTYPE_KINDS = {"indicator": "buif", "integer": "uif", "real": "f"}
+
+EXECUTOR_OPTIONS = ("thread", "process")
+MIN_BLOCK_ROWS = 10_000  # smaller blocks cost more in pool overhead than they gain
 
 
 class BaseTransformer(MonitoredBase):
@@ -54,6 +82,143 @@ class BaseTransformer(MonitoredBase):
         Does the inverse transformation.
         """
 
+    def partial_fit(self, data: Any) -> None:  # noqa: ARG002
+        """
+        Updates the fit with one more chunk of data, so data too big for memory can be fitted chunk by chunk. After
+        the last chunk the transformer is fitted as if fit had been called on all the chunks together.
+        Child classes supporting it override this; the default raises NotReadyFunctionality.
+        :param data: Any. Chunk of data, not specified here.
+        """
+        ExceptionExecutioner(NotReadyFunctionality).log_and_raise(
+            description=f"{self._class_info.class_name} does not support partial_fit."
+        )
+
+    def predict_iter(self, chunks: Iterable[Any]) -> Iterator[Any]:
+        """
+        Predicts chunk by chunk, yielding the prediction of every chunk as soon as the chunk arrives. Only one chunk
+        and its prediction are held at a time, so it pipelines with a chunked loader.
+        :param chunks: Iterable[Any]. Chunks of data, e.g. a generator.
+        :return: Iterator[Any]. Predictions of the chunks in their order.
+        """
+        for chunk in chunks:
+            yield self.predict(chunk)
+
+    def predict_into(self, data: Any, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Does the transformation writing the result into a preallocated array, e.g. a column slice of a bigger output
+        (see TransformerUnion). The default copies the result of predict; child classes able to write their output
+        directly override it.
+        :param data: Any. Not specified here.
+        :param out: ndarray[Any, dtype[Any]]. Preallocated output of the shape of the prediction.
+        """
+        out[...] = self.predict(data)
+
+    def is_row_wise(self) -> bool:
+        """
+        Returns whether every output row depends on the same input row only, so the rows can be predicted in blocks
+        independently. Child classes looking at other rows (lags, windows) override it to return False.
+        :return: bool.
+        """
+        return True
+
+    def get_encoded_attribute_names(self) -> list[str]:
+        """
+        Returns the names of the output columns of the fitted transformer, one per column of its 2D output. Child
+        classes with a 2D output override it; the default raises NotReadyFunctionality.
+        :return: List[str].
+        """
+        ExceptionExecutioner(NotReadyFunctionality).log_and_raise(
+            description=f"{self._class_info.class_name} does not describe its output columns."
+        )
+
+    def get_output_dtype(self) -> dtype[Any]:
+        """
+        Returns the dtype of the output. Child classes with a 2D output override it; the default raises
+        NotReadyFunctionality.
+        :return: dtype[Any].
+        """
+        ExceptionExecutioner(NotReadyFunctionality).log_and_raise(
+            description=f"{self._class_info.class_name} does not describe its output dtype."
+        )
+
+    def is_sparse_output(self) -> bool:
+        """
+        Returns whether the output is a scipy sparse matrix. Child classes with a sparse output override it.
+        :return: bool.
+        """
+        return False
+
+    def predict_parallel(
+        self, data: Any, n_jobs: int = -1, executor: str = "thread", shared_memory: SharedMemory | None = None
+    ) -> Any:
+        """
+        Predicts contiguous row blocks of the data in a pool, every block written into its rows of one preallocated
+        output by predict_into. The result equals predict(data).
+
+        Threads suit transformers spending their time in numpy, which releases the GIL. Processes also parallelise
+        pure-Python work: the transformer and every block are pickled to a worker, which writes its rows into shared
+        memory. A transformer which is not row-wise (see is_row_wise) or data too small to split are predicted in one
+        block. Sparse predictions are predicted per block and stacked.
+        :param data: Any. Input of predict, sliceable by rows (array, DatetimeIndex, DataFrame).
+        :param n_jobs: int. Number of blocks and workers, -1 for the number of CPUs.
+        :param executor: str. "thread" or "process".
+        :param shared_memory: SharedMemory | None. Block of at least the size of the output to write it into, the
+            result is then a view of it valid while it is open. If None, with processes a temporary block is used and
+            copied out.
+        :return: Any. Prediction.
+        """
+        n_workers = _resolve_n_jobs(n_jobs)
+        if executor not in EXECUTOR_OPTIONS:
+            ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+                description=f"Unknown executor {executor}, use thread or process."
+            )
+        n_rows = len(data)
+        n_blocks = min(n_workers, ceil(n_rows / MIN_BLOCK_ROWS)) if self.is_row_wise() else 1
+        if n_blocks <= 1:
+            prediction = self.predict(data)
+            if shared_memory is None or issparse(prediction):
+                return prediction
+            shared: ndarray[Any, dtype[Any]] = ndarray(prediction.shape, prediction.dtype, buffer=shared_memory.buf)
+            shared[...] = prediction
+            return shared
+        blocks = list(pairwise(linspace(0, n_rows, n_blocks + 1).astype(int).tolist()))
+        probe = self.predict(_take_rows(data, 0, 1))
+        if issparse(probe):
+            with _create_pool(executor, n_blocks) as pool:
+                futures = [pool.submit(self.predict, _take_rows(data, start, stop)) for start, stop in blocks]
+                return vstack([future.result() for future in futures], format="csr")
+        shape = (n_rows, *probe.shape[1:])
+        out_dtype = result_type(probe)
+        temporary = None
+        if shared_memory is None and executor == "process":
+            temporary = SharedMemory(create=True, size=_size_of(shape, out_dtype))
+        memory = shared_memory if shared_memory is not None else temporary
+        out: ndarray[Any, dtype[Any]] = ndarray(shape, out_dtype, buffer=None if memory is None else memory.buf)
+        try:
+            with _create_pool(executor, n_blocks) as pool:
+                futures_done: list[Future[None]] = [
+                    pool.submit(self.predict_into, _take_rows(data, start, stop), out[start:stop])
+                    if memory is None or executor == "thread"
+                    else pool.submit(
+                        _predict_block_into_shared_memory,
+                        self,
+                        _take_rows(data, start, stop),
+                        (memory.name, shape, out_dtype.str, start),
+                    )
+                    for start, stop in blocks
+                ]
+                for future in futures_done:
+                    future.result()
+            if temporary is None:
+                return out
+            copied: ndarray[Any, dtype[Any]] = out.copy()
+            return copied
+        finally:
+            if temporary is not None:
+                del out
+                temporary.close()
+                temporary.unlink()
+
     def restore_from_params(self, params: dict[str, Any]) -> None:
         """
         Sets the params for transformer.
@@ -68,3 +233,114 @@ class BaseTransformer(MonitoredBase):
         :return: Dict[str, Any]. Params.
         """
         return self._params
+
+    def save_state(self, file_name: str, where: str = "data") -> None:
+        """
+        Saves the params in the compact versioned transformer state format (.json and .npy), see transformer_state.py.
+        :param file_name: str. File name without extension.
+        :param where: str. Name of the path from the config file.
+        """
+        save_state(self._class_info.class_name, self.get_params(), file_name, where)
+
+    def load_state(self, file_name: str, where: str = "data") -> None:
+        """
+        Restores the params saved by save_state of a transformer of the same class.
+        :param file_name: str. File name without extension.
+        :param where: str. Name of the path from the config file.
+        """
+        self.restore_from_params(load_state(self._class_info.class_name, file_name, where))
+
+
+def resolve_output_dtype(output_dtype: DTypeLike | None, kind: str) -> dtype[Any]:
+    """
+    Returns the output dtype of a transformer: the given one, or for None the one of the project policy in
+    ApplicationConfig (transformation_dtypes).
+    :param output_dtype: DTypeLike | None. Dtype given to the transformer, e.g. float32, "uint8" or None.
+    :param kind: str. Kind of the output, one of OUTPUT_DTYPE_KINDS: "indicator" for 0/1 values, "integer" for small
+        integers and "real" for real numbers.
+    :return: dtype[Any].
+    """
+    if kind not in OUTPUT_DTYPE_KINDS:
+        ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+            description=f"Output kind has to be one of {tuple(OUTPUT_DTYPE_KINDS)}, not {kind}."
+        )
+    if output_dtype is None:
+        output_dtype = getattr(ApplicationConfig().get_data().transformation_dtypes, kind)
+    resolved = result_type(output_dtype)
+    if resolved.kind not in OUTPUT_DTYPE_KINDS[kind]:
+        ExceptionExecutioner(IncorrectValue).log_and_raise(
+            description=f"Dtype {resolved} can not hold {kind} output, its kind has to be one of "
+            f"{tuple(OUTPUT_DTYPE_KINDS[kind])}."
+        )
+    return resolved
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """
+    Returns the number of workers for n_jobs.
+    :param n_jobs: int. Positive number of workers, or -1 for the number of CPUs.
+    :return: int.
+    """
+    if n_jobs == -1:
+        return cpu_count() or 1
+    if n_jobs < 1:
+        ExceptionExecutioner(IncorrectValue).log_and_raise(description=f"n_jobs must be positive or -1, got {n_jobs}.")
+    return n_jobs
+
+
+def _create_pool(executor: str, max_workers: int) -> Executor:
+    """
+    Creates the pool for predict_parallel.
+    :param executor: str. One of EXECUTOR_OPTIONS.
+    :param max_workers: int.
+    :return: Executor.
+    """
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    # spawn, as on Windows: forking this possibly multi-threaded process could deadlock the children
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+
+
+def _take_rows(data: Any, start: int, stop: int) -> Any:
+    """
+    Returns the rows start - stop of the data, positionally.
+    :param data: Any. Array, DatetimeIndex, DataFrame, ...
+    :param start: int.
+    :param stop: int.
+    :return: Any.
+    """
+    return data.iloc[start:stop] if hasattr(data, "iloc") else data[start:stop]
+
+
+def _size_of(shape: tuple[int, ...], data_type: dtype[Any]) -> int:
+    """
+    Returns the size in bytes of an array.
+    :param shape: Tuple[int, ...].
+    :param data_type: dtype[Any].
+    :return: int.
+    """
+    size = data_type.itemsize
+    for length in shape:
+        size *= length
+    return size
+
+
+def _predict_block_into_shared_memory(
+    transformer: BaseTransformer, block: Any, output: tuple[str, tuple[int, ...], str, int]
+) -> None:
+    """
+    Process worker of predict_parallel: attaches the shared output and predicts the block into its rows.
+    :param transformer: BaseTransformer. Fitted transformer.
+    :param block: Any. Rows start - start + len(block) of the data.
+    :param output: Tuple[str, Tuple[int, ...], str, int]. Name of the shared memory block, shape of the whole output,
+        its dtype (e.g. "|u1") and the first row of the block.
+    """
+    name, shape, dtype_str, start = output
+    # the creating process owns the block, the worker must not register it for cleanup
+    memory = SharedMemory(name=name, track=False)
+    try:
+        out: ndarray[Any, dtype[Any]] = ndarray(shape, dtype=result_type(dtype_str), buffer=memory.buf)
+        transformer.predict_into(block, out[start : start + len(block)])
+        del out
+    finally:
+        memory.close()
@@ -0,0 +1,169 @@
+"""
+Calendar table.
+
+Calendar attributes of timestamps (day of week, weekend, month, year, day of year) depend on the day only, and
+minute-resolution data repeats every day 1440 times. Instead of calendar arithmetic for every timestamp, the
+attributes are computed once per day into a table covering whole years, cached, and looked up by one integer gather
+over the day number of the timestamps (their integer value divided by the length of a day). The time of day needs no
+table, it is the remainder of the same division.
+
+The table is cached per range of years, so repeated predicts over data of the same years reuse it. Its arrays are
+read-only, because they are shared.
+
+Usage can be found at the end of the file.
+"""
+
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from numpy import arange, datetime64, dtype, int8, int16, int64, ndarray, timedelta64
+from pandas import DatetimeIndex
+
+from src.exceptions.development_exception import IncorrectValue
+from src.exceptions.exception_executioner import ExceptionExecutioner
+
+CALENDAR_CACHE_SIZE = 32
+
+
+class CalendarTable(NamedTuple):
+    """
+    Calendar attributes of consecutive days.
+    - first_day: int. Day number (days since 1970-01-01) of the first item.
+    - day_of_week: ndarray. Monday=0, Sunday=6, int8.
+    - weekend: ndarray. 1 for Saturday and Sunday, 0 otherwise, int8.
+    - month: ndarray. January=1, December=12, int8.
+    - year: ndarray. yyyy, int16.
+    - day_of_year: ndarray. 1 - 366, int16.
+    """
+
+    first_day: int
+    day_of_week: ndarray[Any, dtype[Any]]
+    weekend: ndarray[Any, dtype[Any]]
+    month: ndarray[Any, dtype[Any]]
+    year: ndarray[Any, dtype[Any]]
+    day_of_year: ndarray[Any, dtype[Any]]
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def get_calendar_table(first_year: int, last_year: int) -> CalendarTable:
+    """
+    Returns the calendar table of all the days of the years first_year - last_year (both included).
+    :param first_year: int.
+    :param last_year: int.
+    :return: CalendarTable.
+    """
+    first_day = int(datetime64(f"{first_year:04d}-01-01", "D").astype(int64))
+    end_day = int(datetime64(f"{last_year + 1:04d}-01-01", "D").astype(int64))
+    days = DatetimeIndex(arange(first_day, end_day).astype("datetime64[D]"))
+    day_of_week = days.dayofweek.to_numpy(dtype=int8)
+    table = CalendarTable(
+        first_day=first_day,
+        day_of_week=day_of_week,
+        weekend=(day_of_week >= 5).astype(int8),
+        month=days.month.to_numpy(dtype=int8),
+        year=days.year.to_numpy(dtype=int16),
+        day_of_year=days.dayofyear.to_numpy(dtype=int16),
+    )
+    for array in table[1:]:
+        array.flags.writeable = False
+    return table
+
+
+class DatetimeCalendar:
+    """
+    Calendar attributes of a DatetimeIndex, read from the cached calendar table. The wall time is used, in the time
+    zone of the index if it has one (as the pandas accessors do). NaT is not supported, an index with NaT raises
+    IncorrectValue.
+    """
+
+    def __init__(self, dt_index: DatetimeIndex) -> None:
+        """
+        Splits the timestamps into day numbers and time of day, and looks up the table of their years.
+        :param dt_index: DatetimeIndex. Without NaT.
+        """
+        if dt_index.hasnans:
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description="Calendar attributes of NaT are not defined, drop or fill the missing timestamps first."
+            )
+        wall_time = dt_index if dt_index.tz is None else dt_index.tz_localize(None)
+        ticks_per_day = timedelta64(1, "D") // timedelta64(1, wall_time.unit)
+        self._ticks_per_minute = ticks_per_day // (24 * 60)
+        ticks = wall_time.asi8
+        days = ticks // ticks_per_day
+        self._ticks_of_day = ticks - days * ticks_per_day
+        if len(days):
+            first_year = int(days.min().astype("datetime64[D]").astype("datetime64[Y]").astype(int64)) + 1970
+            last_year = int(days.max().astype("datetime64[D]").astype("datetime64[Y]").astype(int64)) + 1970
+        else:
+            first_year = last_year = 1970
+        self._table = get_calendar_table(first_year, last_year)
+        self._positions: ndarray[Any, dtype[Any]] = days - self._table.first_day
+
+    def _gather(self, table_column: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the values of a table column for the days of the timestamps.
+        :param table_column: ndarray[Any, dtype[Any]]. Column of the calendar table.
+        :return: ndarray[Any, dtype[Any]].
+        """
+        gathered: ndarray[Any, dtype[Any]] = table_column[self._positions]
+        return gathered
+
+    def minute_of_day(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the minute of the day, 0 - 1439.
+        :return: ndarray[Any, dtype[Any]]. int64.
+        """
+        minute_of_day: ndarray[Any, dtype[Any]] = self._ticks_of_day // self._ticks_per_minute
+        return minute_of_day
+
+    def hour(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the hour, 0 - 23.
+        :return: ndarray[Any, dtype[Any]]. int64.
+        """
+        hour: ndarray[Any, dtype[Any]] = self._ticks_of_day // (self._ticks_per_minute * 60)
+        return hour
+
+    def day_of_week(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the day of week, Monday=0, Sunday=6.
+        :return: ndarray[Any, dtype[Any]]. int8.
+        """
+        return self._gather(self._table.day_of_week)
+
+    def weekend(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns 1 for Saturday and Sunday, 0 otherwise.
+        :return: ndarray[Any, dtype[Any]]. int8.
+        """
+        return self._gather(self._table.weekend)
+
+    def month(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the month, January=1, December=12.
+        :return: ndarray[Any, dtype[Any]]. int8.
+        """
+        return self._gather(self._table.month)
+
+    def year(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the year.
+        :return: ndarray[Any, dtype[Any]]. int16.
+        """
+        return self._gather(self._table.year)
+
+    def day_of_year(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the day of year, 1 - 366.
+        :return: ndarray[Any, dtype[Any]]. int16.
+        """
+        return self._gather(self._table.day_of_year)
+
+
+if __name__ == "__main__":
+    from pandas import date_range
+
+    demo_index = date_range("2024-12-30 22:00", periods=6, freq="h", tz="Europe/Prague")
+    demo_calendar = DatetimeCalendar(demo_index)
+    print(demo_calendar.hour(), demo_calendar.day_of_week(), demo_calendar.month(), demo_calendar.year())
+    print(get_calendar_table.cache_info())
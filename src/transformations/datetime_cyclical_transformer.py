@@ -0,0 +1,216 @@
+"""
+Transformer
+
+Creates cyclical (sine/cosine) encoding from datetime format depending on definition.
+
+A periodic attribute is mapped to the angle 2 * pi * value / period and encoded by its sine and cosine, so the end of
+the period is next to its start (23:59 next to 00:00, Sunday next to Monday), with two columns instead of a one-hot
+block:
+hours: hour of the day including minutes (period 24 hours),
+days_of_week: Monday=0, Sunday=6 (period 7 days),
+days_of_year: 1 - 366, shifted to start from 0 (period 365 or 366 days, depending on the year).
+
+The attributes are gathered from the cached calendar table and the sines and cosines are computed in place in the
+output, which can be preallocated (predict_into) and float32.
+
+Usage can be found at the end of the file.
+"""
+
+from math import pi
+from typing import Any, NamedTuple
+
+from numpy import arctan2, cos, dtype, empty, float64, multiply, ndarray, result_type, rint, sin, where
+from numpy.typing import DTypeLike
+from pandas import DatetimeIndex
+
+from src.exceptions.development_exception import IncorrectValue, NoProperOptionInIf
+from src.exceptions.exception_executioner import ExceptionExecutioner
+from src.transformations.base_transformer import BaseTransformer, TransformerDescription, resolve_output_dtype
+from src.transformations.calendar_table import DatetimeCalendar
+
+MINUTES_PER_DAY = 24 * 60
+DAYS_PER_WEEK = 7
+
+
+class CyclicalAttributes(NamedTuple):
+    """
+    Tuple for storing which attributes should be encoded.
+    """
+
+    hours: bool
+    days_of_week: bool
+    days_of_year: bool
+
+
+class DatetimeCyclicalTransformer(BaseTransformer):
+    """
+    Transforms a DatetimeIndex array to sine/cosine columns, two per attribute, in this order:
+    - attribute HOUR: hour of the day including minutes, period 24 hours,
+    - attribute DAY_OF_WEEK: Monday=0, Sunday=6, period 7 days,
+    - attribute DAY_OF_YEAR: 0 - 365, period the length of the year.
+
+    The attributes are read through DatetimeCalendar, so predicting a DatetimeIndex with NaT raises IncorrectValue.
+
+    The captions for columns are in format <optional date time index attribute name>_<TIME_ATTRIBUTE_NAME>_<SIN|COS>.
+    Example:
+        'SOME_TIME_ATTRIBUTE_HOUR_SIN', 'SOME_TIME_ATTRIBUTE_HOUR_COS'
+    """
+
+    def __init__(self, cyclical_attributes: CyclicalAttributes, dtype: DTypeLike | None = None) -> None:
+        """
+        Initialises the transformer with the attributes to encode.
+        :param cyclical_attributes: CyclicalAttributes. Which attributes have to be encoded.
+        :param dtype: DTypeLike | None. Floating data type of the output, e.g. float32. Default None is the real dtype
+            of the project policy.
+        """
+        transformer_description = TransformerDescription(
+            input_type=[DatetimeIndex], input_elements_type=[None], output_type=[ndarray], output_elements_type=[float]
+        )
+        BaseTransformer.__init__(self, class_name="DatetimeCyclical", transformer_description=transformer_description)
+        self._do_attribute = cyclical_attributes
+        self._dtype = resolve_output_dtype(dtype, "real")
+        self._dt_attr_names: list[str] = []
+        self._configure(cyclical_attributes, self._dtype.str)
+
+    def _configure(self, cyclical_attributes: CyclicalAttributes, dtype_str: str) -> None:
+        """
+        Sets the attributes to encode and the output dtype.
+        :param cyclical_attributes: CyclicalAttributes.
+        :param dtype_str: str. Output dtype, e.g. "<f4".
+        """
+        self._do_attribute = cyclical_attributes
+        self._dtype = result_type(dtype_str)
+        self._dt_attr_names = [
+            name
+            for name, selected in zip(("HOUR", "DAY_OF_WEEK", "DAY_OF_YEAR"), cyclical_attributes, strict=True)
+            if selected
+        ]
+        if not self._dt_attr_names:
+            ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+                description=self._class_info.class_type + " " + self._class_info.class_name
+            )
+
+    def get_encoded_attribute_names(self, attr_name: str | None = None) -> list[str]:
+        """
+        Returns the names of the output columns.
+        :param attr_name: str. Name of general attribute to be added at the beginning. Otherwise nothing is added.
+        :return: List[str].
+        """
+        prefix = "" if attr_name is None else attr_name + "_"
+        return [prefix + name + "_" + function for name in self._dt_attr_names for function in ("SIN", "COS")]
+
+    def get_output_dtype(self) -> dtype[Any]:
+        """
+        Returns the dtype of the output.
+        :return: dtype[Any].
+        """
+        return self._dtype
+
+    def fit(self, dt_index: DatetimeIndex) -> None:  # noqa: ARG002
+        """
+        The encoding has nothing to learn, fit only stores the configuration into params.
+        :param dt_index: DatetimeIndex.
+        """
+        self._params = {"cyclical_attributes": self._do_attribute, "dtype": self._dtype.str}
+
+    def fit_predict(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]]:
+        """
+        Fits and predicts.
+        :param dt_index: DatetimeIndex.
+        :return: ndarray[Any, dtype[Any]].
+        """
+        self.fit(dt_index)
+        return self.predict(dt_index)
+
+    def predict(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]]:
+        """
+        Predicts.
+        :param dt_index: DatetimeIndex.
+        :return: ndarray[Any, dtype[Any]]. Matrix of shape (len(dt_index), 2 * number of attributes).
+        """
+        prediction: ndarray[Any, dtype[Any]] = empty((len(dt_index), 2 * len(self._dt_attr_names)), dtype=self._dtype)
+        self._write(dt_index, prediction)
+        return prediction
+
+    def predict_into(self, dt_index: DatetimeIndex, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Writes the prediction into out.
+        :param dt_index: DatetimeIndex.
+        :param out: ndarray[Any, dtype[Any]]. Preallocated floating output of shape (len(dt_index), 2 * number of
+            attributes), may be a column slice of a bigger array.
+        """
+        if out.shape != (len(dt_index), 2 * len(self._dt_attr_names)):
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Expected output of shape {(len(dt_index), 2 * len(self._dt_attr_names))}, got {out.shape}."
+            )
+        self._write(dt_index, out)
+
+    def _write(self, dt_index: DatetimeIndex, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Computes the angle of every attribute as one contiguous array in the output dtype and its sine and cosine
+        straight into the output columns.
+        :param dt_index: DatetimeIndex.
+        :param out: ndarray[Any, dtype[Any]]. Output.
+        """
+        calendar = DatetimeCalendar(dt_index)
+        angles: list[ndarray[Any, dtype[Any]]] = []
+        if self._do_attribute.hours:
+            angles.append(multiply(calendar.minute_of_day(), 2 * pi / MINUTES_PER_DAY, dtype=out.dtype))
+        if self._do_attribute.days_of_week:
+            angles.append(multiply(calendar.day_of_week(), 2 * pi / DAYS_PER_WEEK, dtype=out.dtype))
+        if self._do_attribute.days_of_year:
+            period = _days_in_year(calendar.year())
+            angles.append(multiply(calendar.day_of_year() - 1, 2 * pi / period, dtype=out.dtype))
+        for j, angle in enumerate(angles):
+            sin(angle, out=out[:, 2 * j])
+            cos(angle, out=out[:, 2 * j + 1])
+
+    def inverse(self, data: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+        """
+        Does the inverse transformation.
+        NOTE: the original DatetimeIndex is NOT recoverable. This returns the attribute columns as numbers: hours as
+        fractional hours (minutes included), days of week 0 - 6 and days of year 1 - 365. The year length is not in
+        the encoding, so the day of year is inverted with the period of a non-leap year and is exact only for those.
+        :param data: ndarray[Any, dtype[Any]]. Sine/cosine columns.
+        :return: ndarray[Any, dtype[Any]]. One float64 column per attribute.
+        """
+        angles = arctan2(data[:, 0::2], data[:, 1::2])
+        fractions = where(angles < 0, angles + 2 * pi, angles) / (2 * pi)
+        periods = {"HOUR": 24.0, "DAY_OF_WEEK": float(DAYS_PER_WEEK), "DAY_OF_YEAR": 365.0}
+        inverted: ndarray[Any, dtype[Any]] = empty(fractions.shape, dtype=float64)
+        for j, name in enumerate(self._dt_attr_names):
+            inverted[:, j] = fractions[:, j] * periods[name]
+            if name == "DAY_OF_WEEK":
+                inverted[:, j] = rint(inverted[:, j]) % DAYS_PER_WEEK
+            elif name == "DAY_OF_YEAR":
+                inverted[:, j] = rint(inverted[:, j]) + 1
+        return inverted
+
+    def restore_from_params(self, params: dict[str, Any]) -> None:
+        """
+        Restores the configuration from params.
+        :param params: Dict[str, Any]. Params as produced by get_params() after a fit.
+        """
+        self._configure(params["cyclical_attributes"], params["dtype"])
+        self._params = params
+
+
+def _days_in_year(year: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+    """
+    Returns 366 for leap years and 365 otherwise.
+    :param year: ndarray[Any, dtype[Any]]. Years.
+    :return: ndarray[Any, dtype[Any]].
+    """
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days: ndarray[Any, dtype[Any]] = 365 + leap
+    return days
+
+
+if __name__ == "__main__":
+    from numpy import float32
+    from pandas import date_range
+
+    demo_transformer = DatetimeCyclicalTransformer(CyclicalAttributes(True, True, True), dtype=float32)
+    demo_data = date_range("2024-01-01", periods=6, freq="4h")
+    print(demo_transformer.get_encoded_attribute_names())
+    print(demo_transformer.fit_predict(demo_data))
@@ -16,13 +16,39 @@ Does not test validity of input except empty configuration - raises error.
 
 from typing import Any, NamedTuple
 
-from numpy import array, concatenate, dtype, ndarray, zeros
+from numpy import (
+    arange,
+    bincount,
+    concatenate,
+    cumsum,
+    dtype,
+    empty,
+    flatnonzero,
+    float64,
+    full,
+    int64,
+    intp,
+    ndarray,
+    ones,
+    repeat,
+    union1d,
+    where,
+    zeros,
+)
+from numpy.typing import DTypeLike
 from pandas import DatetimeIndex
-from sklearn.preprocessing import OneHotEncoder
+from scipy.sparse import csr_array, issparse
 
-from src.exceptions.development_exception import NoProperOptionInIf
+from src.exceptions.development_exception import IncorrectValue, NoProperOptionInIf
 from src.exceptions.exception_executioner import ExceptionExecutioner
-from src.transformations.base_transformer import BaseTransformer, TransformerDescription
+from src.transformations.base_transformer import BaseTransformer, TransformerDescription, resolve_output_dtype
+from src.transformations.calendar_table import DatetimeCalendar
+
+HANDLE_UNKNOWN_OPTIONS = ("ignore", "error")
+OUTPUT_OPTIONS = ("dense", "sparse")
+MINUTES_PER_DAY = 24 * 60
+# size of the value domain [0, size) of the attributes with a fixed one, month values start from 1
+FIXED_DOMAIN_SIZES = {"HOUR": 24, "DAY_OF_WEEK": 7, "WEEKEND": 2, "MONTH": 13}
 
 
 class TimeAttributes(NamedTuple):
@@ -38,6 +64,74 @@ class TimeAttributes(NamedTuple):
     min_interval: int
 
 
+class _Lookup(NamedTuple):
+    """
+    Lookup table from an attribute value to the position of its category.
+    - low: int. Value of the first table item.
+    - table: ndarray. Position of the category of value low + i at index i, -1 if the value was not seen in fit.
+    - bounded: bool. If values outside the table are possible and have to be checked.
+    - complete: bool. If every value of the table was seen in fit.
+    """
+
+    low: int
+    table: ndarray[Any, dtype[Any]]
+    bounded: bool
+    complete: bool
+
+
+def _distinct_values(column: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+    """
+    Returns the sorted distinct values of an integer column. Counting is linear, unlike the sort in numpy.unique,
+    and the values of every attribute span a small range.
+    :param column: ndarray[Any, dtype[Any]]. Integer column.
+    :return: ndarray[Any, dtype[Any]].
+    """
+    if not len(column):
+        return column
+    low = column.min()
+    distinct: ndarray[Any, dtype[Any]] = flatnonzero(bincount(column - low)) + low
+    return distinct
+
+
+def _look_up(lookup: _Lookup, column: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+    """
+    Returns the category position of every value of an attribute column, -1 for a value not seen in fit.
+    :param lookup: _Lookup. Lookup table of the attribute.
+    :param column: ndarray[Any, dtype[Any]]. Integer column of the attribute values.
+    :return: ndarray[Any, dtype[Any]].
+    """
+    positions: ndarray[Any, dtype[Any]]
+    if not lookup.bounded:
+        positions = lookup.table[column]
+        return positions
+    if not len(lookup.table):
+        return full(len(column), -1, dtype=intp)
+    shifted = column - lookup.low
+    inside = (shifted >= 0) & (shifted < len(lookup.table))
+    positions = where(inside, lookup.table[where(inside, shifted, 0)], -1)
+    return positions
+
+
+def _scatter_ones(encoded: ndarray[Any, dtype[Any]], all_known: bool, out: ndarray[Any, dtype[Any]]) -> None:
+    """
+    Writes ones into the zeroed out at the encoded output columns of every row.
+    :param encoded: ndarray[Any, dtype[Any]]. Output columns, one column per attribute, -1 for an ignored value.
+        Overwritten.
+    :param all_known: bool. If encoded has no -1.
+    :param out: ndarray[Any, dtype[Any]]. Zeroed output.
+    """
+    if out.flags.c_contiguous:
+        known = None if all_known else encoded >= 0
+        # the flat view: row start + output column, computed in place
+        encoded += (arange(len(encoded), dtype=intp) * out.shape[1])[:, None]
+        out.reshape(-1)[encoded if known is None else encoded[known]] = 1
+    elif all_known:
+        out[arange(len(encoded), dtype=intp)[:, None], encoded] = 1
+    else:
+        rows, attributes = (encoded >= 0).nonzero()
+        out[rows, encoded[rows, attributes]] = 1
+
+
 class DatetimeOneHotEncoderTransformer(BaseTransformer):
     """
     Transforms a DatetimeIndex array to one-hot array. Options are:
@@ -48,31 +142,76 @@ class DatetimeOneHotEncoderTransformer(BaseTransformer):
     - attribute YEAR: yyyy format.
     - attribute MINxx - For 60 minutes the same as for hours. In general division of the day per min_interval window.
 
+    The categories of every attribute are the values seen in fit. All attributes are small integers, so every
+    attribute gets a lookup table from value to output column, and predict writes the ones straight into a
+    preallocated output matrix with one fancy-indexing assignment.
+
+    The output is a dense ndarray, or with output="sparse" a scipy CSR array holding one stored value per attribute
+    and row - a fraction of the memory of the dense matrix with its dozens of columns. Its dtype is set by dtype=,
+    by default the indicator dtype of the project policy (uint8, one byte per value), and the numerical attributes
+    returned by inverse have the integer dtype of the policy (int16), see resolve_output_dtype.
+
+    The attributes are read through DatetimeCalendar, so a DatetimeIndex with NaT raises IncorrectValue in fit and
+    predict, whatever handle_unknown is. Drop or fill the missing timestamps first.
+
     In addition, the class can return the captions for columns in format:
     <optional date time index attribute name>_<TIME_ATTRIBUTE_NAME>(HOUR, DAY_OF_WEEK, ... as specified above)_<number>.
     Example:
         'SOME_TIME_ATTRIBUTE_HOUR_0.0', 'SOME_TIME_ATTRIBUTE_HOUR_1.0', 'SOME_TIME_ATTRIBUTE_HOUR_2.0',
     """
 
-    def __init__(self, time_attributes: TimeAttributes, handle_unknown: str = "ignore") -> None:
+    def __init__(
+        self,
+        time_attributes: TimeAttributes,
+        handle_unknown: str = "ignore",
+        output: str = "dense",
+        dtype: DTypeLike | None = None,
+        attribute_dtype: DTypeLike | None = None,
+    ) -> None:
         """
         Initialises the transformer with the time attributes to encode and the encoder configuration.
         :param time_attributes: TimeAttributes. Which one-hot attributes have to be created.
-        :param handle_unknown: str. Passed through to the underlying OneHotEncoder. Default is "ignore".
+        :param handle_unknown: str. What predict does with a value not seen in fit: "ignore" leaves all the columns of
+            the attribute zero, "error" raises IncorrectValue. Default is "ignore".
+        :param output: str. "dense" for an ndarray, "sparse" for a scipy csr_array. Default is "dense".
+        :param dtype: DTypeLike | None. Data type of the output values, e.g. uint8, bool or float64. Default None is
+            the indicator dtype of the project policy.
+        :param attribute_dtype: DTypeLike | None. Data type of the numerical attributes returned by inverse. Default
+            None is the integer dtype of the project policy.
         """
         transformer_description = TransformerDescription(
-            input_type=[DatetimeIndex], input_elements_type=[None], output_type=[ndarray], output_elements_type=[int]
+            input_type=[DatetimeIndex],
+            input_elements_type=[None],
+            output_type=[csr_array if output == "sparse" else ndarray],
+            output_elements_type=[int],
         )
         BaseTransformer.__init__(
             self, class_name="DatetimeOneHotEncoder", transformer_description=transformer_description
         )
 
+        if handle_unknown not in HANDLE_UNKNOWN_OPTIONS:
+            ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+                description=f"handle_unknown has to be one of {HANDLE_UNKNOWN_OPTIONS}, not {handle_unknown}."
+            )
+        if output not in OUTPUT_OPTIONS:
+            ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+                description=f"output has to be one of {OUTPUT_OPTIONS}, not {output}."
+            )
         self._do_attribute: TimeAttributes = time_attributes
+        self._handle_unknown = handle_unknown
+        self._output = output
+        self._dtype = resolve_output_dtype(dtype, "indicator")
+        self._attribute_dtype = resolve_output_dtype(attribute_dtype, "integer")
         self._dt_attr_names: list[str] = []
 
-        self._encoder = OneHotEncoder(handle_unknown=handle_unknown)
+        self._categories: list[ndarray[Any, Any]] = []  # dtype is shadowed by the parameter here
+        self._lookups: list[_Lookup] = []
+        self._offsets: list[int] = []
+        self._n_encoded = 0
 
-    def _convert_datetime_index_to_numerical_attributes(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]]:
+    def _convert_datetime_index_to_numerical_attributes(
+        self, dt_index: DatetimeIndex
+    ) -> list[ndarray[Any, dtype[Any]]]:
         """
         Converts the datetime index array into columns of numerical values for requested time attributes:
         hours: 0-23,
@@ -81,137 +220,261 @@ class DatetimeOneHotEncoderTransformer(BaseTransformer):
         months: January=1, December=12,
         years: yyyy format.
         min_interval - For 60 minutes the same as for hours. In general division of the day per min_interval window.
+        The day-level attributes are gathered from the cached calendar table, see calendar_table.py.
         :param dt_index: DatetimeIndex.
-        :return: ndarray[Any, dtype[Any]].
+        :return: List[ndarray[Any, dtype[Any]]]. One integer column per requested attribute.
         """
-        self._dt_attr_names = []
-        numerical_values = zeros((len(dt_index), 1))
-        x: ndarray[Any, dtype[Any]]
+        dt_attr_names: list[str] = []
+        columns: list[ndarray[Any, dtype[Any]]] = []
+        calendar = DatetimeCalendar(dt_index)
         if self._do_attribute.hours:
-            x = array(dt_index.hour).reshape(-1, 1)
-            numerical_values = concatenate([numerical_values, x], axis=1)
-            self._dt_attr_names.append("HOUR")
+            columns.append(calendar.hour())
+            dt_attr_names.append("HOUR")
         if self._do_attribute.days_of_week:
-            x = array(dt_index.dayofweek).reshape(-1, 1)
-            numerical_values = concatenate([numerical_values, x], axis=1)
-            self._dt_attr_names.append("DAY_OF_WEEK")
+            columns.append(calendar.day_of_week())
+            dt_attr_names.append("DAY_OF_WEEK")
         if self._do_attribute.weekend:
-            x = dt_index.dayofweek.isin([5, 6]).reshape((-1, 1))
-            numerical_values = concatenate([numerical_values, x], axis=1)
-            self._dt_attr_names.append("WEEKEND")
+            columns.append(calendar.weekend())
+            dt_attr_names.append("WEEKEND")
         if self._do_attribute.months:
-            x = array(dt_index.month).reshape(-1, 1)
-            numerical_values = concatenate([numerical_values, x], axis=1)
-            self._dt_attr_names.append("MONTH")
+            columns.append(calendar.month())
+            dt_attr_names.append("MONTH")
         if self._do_attribute.years:
-            x = array(dt_index.year).reshape(-1, 1)
-            numerical_values = concatenate([numerical_values, x], axis=1)
-            self._dt_attr_names.append("YEAR")
+            columns.append(calendar.year())
+            dt_attr_names.append("YEAR")
         if self._do_attribute.min_interval != 0:
-            x = array((dt_index.hour * 60 + dt_index.minute) // self._do_attribute.min_interval).reshape(-1, 1)
-            numerical_values = concatenate([numerical_values, x], axis=1)
-            self._dt_attr_names.append("MIN" + str(self._do_attribute.min_interval))
+            columns.append(calendar.minute_of_day() // self._do_attribute.min_interval)
+            dt_attr_names.append("MIN" + str(self._do_attribute.min_interval))
 
-        if numerical_values.shape[1] == 1:
+        if not columns:
             ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
                 description=self._class_info.class_type + " " + self._class_info.class_name
             )
+        # assigned once, not built in place: predict may run on several threads at once (predict_parallel)
+        self._dt_attr_names = dt_attr_names
+
+        return columns
+
+    def _domain_size(self, dt_attr_name: str) -> int | None:
+        """
+        Returns the size of the fixed value domain [0, size) of an attribute, None for YEAR which has none.
+        :param dt_attr_name: str. Attribute name, e.g. "HOUR".
+        :return: int | None.
+        """
+        if dt_attr_name.startswith("MIN"):
+            return -(-MINUTES_PER_DAY // self._do_attribute.min_interval)
+        return FIXED_DOMAIN_SIZES.get(dt_attr_name)
 
-        return numerical_values[:, 1:]
+    def _set_categories(self, categories: list[ndarray[Any, dtype[Any]]]) -> None:
+        """
+        Sets the categories of the attributes and derives the output layout from them: the first output column of
+        every attribute and a lookup table from the attribute value to the position of its category, -1 for the values
+        not seen in fit. The table covers the whole fixed domain of the attribute, so a value is looked up without any
+        bounds check; only YEAR gets a table over [smallest, largest] category which predict has to check against.
+        :param categories: List[ndarray[Any, dtype[Any]]]. Sorted categories of every attribute.
+        """
+        self._categories = categories
+        self._lookups = []
+        self._offsets = []
+        offset = 0
+        for dt_attr_name, attribute_categories in zip(self._dt_attr_names, categories, strict=True):
+            values = attribute_categories.astype(int64)
+            domain_size = self._domain_size(dt_attr_name)
+            low = 0 if domain_size is not None or not len(values) else int(values[0])
+            size = domain_size if domain_size is not None else (int(values[-1]) - low + 1 if len(values) else 0)
+            lookup = full(size, -1, dtype=intp)
+            lookup[values - low] = arange(len(values))
+            self._lookups.append(
+                _Lookup(low=low, table=lookup, bounded=domain_size is None, complete=bool((lookup >= 0).all()))
+            )
+            self._offsets.append(offset)
+            offset += len(values)
+        self._n_encoded = offset
 
     def get_encoded_attribute_names(self, attr_name: str | None = None) -> list[str]:
         """
-        Returns the encoded attribute names of the fitted data.
-        One-hot encoder's get_feature_names_out() method returns ['x0_0', 'x0_1', 'x1_0', 'x1_1', 'x1_2', 'x1_3']
-        for following array for lets say
-         [[0, 1],
-          [1, 0],
-          [0, 2],
-          [0, 3]].
-        This class converts it to <attr_name>
+        Returns the encoded attribute names of the fitted data in the format <attr_name>_<TIME_ATTRIBUTE>_<category>,
+        e.g. ['DATE_HOUR_0.0', 'DATE_HOUR_1.0', ..., 'DATE_MONTH_12.0'], in the order of the output columns.
         :param attr_name: str. Name of general attribute to be added at the beginning. Otherwise nothing is added.
         :return: List[str].
         """
         prefix = "" if attr_name is None else attr_name + "_"
-        encoded_attributes: list[str] = self._encoder.get_feature_names_out()
-        for i, dt_attr_name in enumerate(self._dt_attr_names):
-            encoded_attributes = [attr.replace("x" + str(i), prefix + dt_attr_name) for attr in encoded_attributes]
-        return encoded_attributes
+        return [
+            prefix + dt_attr_name + "_" + str(category)
+            for dt_attr_name, attribute_categories in zip(self._dt_attr_names, self._categories, strict=True)
+            for category in attribute_categories.tolist()
+        ]
+
+    def get_output_dtype(self) -> dtype[Any]:
+        """
+        Returns the dtype of the output.
+        :return: dtype[Any].
+        """
+        return self._dtype
+
+    def is_sparse_output(self) -> bool:
+        """
+        Returns whether the output is a scipy CSR array, see output in the constructor.
+        :return: bool.
+        """
+        return self._output == "sparse"
 
     def fit(self, dt_index: DatetimeIndex) -> None:
         """
-        Fits the one-hot encoder on the numerical attributes derived from dt_index, using the TimeAttributes
-        supplied at construction.
+        Fits the one-hot encoding on the numerical attributes derived from dt_index, using the TimeAttributes
+        supplied at construction. The categories of an attribute are its sorted distinct values.
         :param dt_index: DatetimeIndex.
         """
-        numerical_attributes = self._convert_datetime_index_to_numerical_attributes(dt_index)
-        self._encoder.fit(numerical_attributes)
+        self._categories = []
+        self.partial_fit(dt_index)
+
+    def partial_fit(self, dt_index: DatetimeIndex) -> None:
+        """
+        Adds the distinct values of one more chunk to the categories, so that the categories after the last chunk are
+        the same as after a fit on all the chunks. Every call may add output columns, so predict after the last one.
+        :param dt_index: DatetimeIndex. Chunk of the data.
+        """
+        columns = self._convert_datetime_index_to_numerical_attributes(dt_index)
+        categories = [_distinct_values(column).astype(float64) for column in columns]
+        if self._categories:
+            categories = [union1d(fitted, chunk) for fitted, chunk in zip(self._categories, categories, strict=True)]
+        self._set_categories(categories)
         self._store_params()
 
-    def fit_predict(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]]:
+    def fit_predict(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]] | csr_array:
         """
-        Fits the one-hot encoder on dt_index and returns the one-hot encoded prediction for the same data.
+        Fits the one-hot encoding on dt_index and returns the one-hot encoded prediction for the same data.
         :param dt_index: DatetimeIndex.
-        :return: ndarray[Any, dtype[Any]].
+        :return: ndarray[Any, dtype[Any]] | csr_array.
         """
         self.fit(dt_index)
         return self.predict(dt_index)
 
-    def predict(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]]:
+    def _encode_columns(self, dt_index: DatetimeIndex) -> tuple[ndarray[Any, dtype[Any]], bool]:
+        """
+        Returns the output column of every attribute value: offset of the attribute plus position of the category.
+        :param dt_index: DatetimeIndex.
+        :return: Tuple[ndarray[Any, dtype[Any]], bool]. Matrix of the output columns with one column per attribute,
+            -1 for an ignored unknown value, and if all the values are known.
+        """
+        columns = self._convert_datetime_index_to_numerical_attributes(dt_index)
+        encoded = empty((len(dt_index), len(columns)), dtype=intp)
+        all_known = True
+        for j, (dt_attr_name, column, lookup, offset) in enumerate(
+            zip(self._dt_attr_names, columns, self._lookups, self._offsets, strict=True)
+        ):
+            positions = _look_up(lookup, column)
+            encoded[:, j] = positions + offset
+            if lookup.complete and not lookup.bounded:
+                continue
+            unknown = positions < 0
+            if not unknown.any():
+                continue
+            if self._handle_unknown == "error":
+                ExceptionExecutioner(IncorrectValue).log_and_raise(
+                    description=f"Value {column[unknown][0]} of {dt_attr_name} was not seen in fit."
+                )
+            encoded[unknown, j] = -1
+            all_known = False
+        return encoded, all_known
+
+    def predict(self, dt_index: DatetimeIndex) -> ndarray[Any, dtype[Any]] | csr_array:
         """
         Predicts.
         :param dt_index: DatetimeIndex.
-        :return: ndarray[Any, dtype[Any]].
+        :return: ndarray[Any, dtype[Any]] | csr_array. Dense or sparse one-hot matrix, see output in the constructor.
         """
-        numerical_attributes = self._convert_datetime_index_to_numerical_attributes(dt_index)
-        prediction: ndarray[Any, dtype[Any]]
-        prediction = self._encoder.transform(numerical_attributes).toarray()
+        encoded, all_known = self._encode_columns(dt_index)
+        n_rows = len(dt_index)
+        if self._output == "sparse":
+            if all_known:
+                indices = encoded.reshape(-1)
+                indptr = arange(0, encoded.size + 1, encoded.shape[1], dtype=intp)
+            else:
+                known = encoded >= 0
+                indices = encoded[known]
+                indptr = zeros(n_rows + 1, dtype=intp)
+                cumsum(known.sum(axis=1), out=indptr[1:])
+            return csr_array((ones(len(indices), dtype=self._dtype), indices, indptr), shape=(n_rows, self._n_encoded))
+        prediction: ndarray[Any, dtype[Any]] = zeros((n_rows, self._n_encoded), dtype=self._dtype)
+        _scatter_ones(encoded, all_known, prediction)
         return prediction
 
-    def inverse(self, data: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:
+    def predict_into(self, dt_index: DatetimeIndex, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Writes the dense one-hot matrix into out, whatever the output option.
+        :param dt_index: DatetimeIndex.
+        :param out: ndarray[Any, dtype[Any]]. Preallocated output of shape (len(dt_index), number of encoded columns),
+            may be a column slice of a bigger array.
+        """
+        if out.shape != (len(dt_index), self._n_encoded):
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Expected output of shape {(len(dt_index), self._n_encoded)}, got {out.shape}."
+            )
+        encoded, all_known = self._encode_columns(dt_index)
+        out[...] = 0
+        _scatter_ones(encoded, all_known, out)
+
+    def inverse(self, data: ndarray[Any, dtype[Any]] | csr_array) -> ndarray[Any, dtype[Any]]:
         """
         Does the inverse transformation.
         NOTE: the original DatetimeIndex is NOT recoverable from the one-hot encoded attributes. This returns the
-        pre-one-hot numerical attribute columns (e.g. hour, day of week, ... as numbers), not datetimes.
-        :param data: ndarray[Any, dtype[Any]]. One-hot encoded data to invert.
-        :return: ndarray[Any, dtype[Any]]. The numerical attribute matrix that was one-hot encoded.
+        pre-one-hot numerical attribute columns (e.g. hour, day of week, ... as numbers), not datetimes. An attribute
+        whose columns are all zero (an ignored unknown value) is returned as None in an object array.
+        :param data: ndarray[Any, dtype[Any]] | csr_array. One-hot encoded data to invert, dense or sparse.
+        :return: ndarray[Any, dtype[Any]]. The numerical attribute matrix that was one-hot encoded, in attribute_dtype.
         """
-        inverted: ndarray[Any, dtype[Any]] = self._encoder.inverse_transform(data)
+        if data.ndim != 2 or data.shape[1] != self._n_encoded or not self._categories:
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Expected data with {self._n_encoded} columns, got shape {data.shape}."
+            )
+        inverted: ndarray[Any, dtype[Any]] = zeros((data.shape[0], len(self._categories)), dtype=self._attribute_dtype)
+        if issparse(data):
+            # every stored value marks its category: attribute and category value come from its column
+            attribute_of_column = repeat(arange(len(self._categories)), [len(c) for c in self._categories])
+            value_of_column = concatenate(self._categories)
+            rows, encoded_columns = data.nonzero()
+            unknown = ones(inverted.shape, dtype=bool)
+            inverted[rows, attribute_of_column[encoded_columns]] = value_of_column[encoded_columns]
+            unknown[rows, attribute_of_column[encoded_columns]] = False
+        else:
+            unknown = zeros(inverted.shape, dtype=bool)
+            for j, (attribute_categories, offset) in enumerate(zip(self._categories, self._offsets, strict=True)):
+                block = data[:, offset : offset + len(attribute_categories)]
+                inverted[:, j] = attribute_categories[block.argmax(axis=1)]
+                unknown[:, j] = ~block.any(axis=1)
+        if unknown.any():
+            inverted = inverted.astype(object)
+            inverted[unknown] = None
         return inverted
 
     def _store_params(self) -> None:
         """
         Stores everything needed to round-trip a fitted encoder into self._params: the TimeAttributes instance,
-        the derived attribute names, and the fitted encoder's learned categories.
+        the derived attribute names, and the learned categories of every attribute.
         """
         self._params = {
             "time_attributes": self._do_attribute,
             "dt_attr_names": self._dt_attr_names,
-            "categories_": self._encoder.categories_,
+            "categories_": self._categories,
         }
 
     def restore_from_params(self, params: dict[str, Any]) -> None:
         """
-        Restores a fitted state from previously saved params, rebuilding a working OneHotEncoder from the saved
-        categories without re-fitting.
+        Restores a fitted state from previously saved params without re-fitting.
         :param params: Dict[str, Any]. Params as produced by get_params() after a fit.
         """
         self._params = params
         self._do_attribute = params["time_attributes"]
         self._dt_attr_names = params["dt_attr_names"]
-
-        categories = params["categories_"]
-        self._encoder.categories_ = categories
-        self._encoder.n_features_in_ = len(categories)
-        self._encoder._n_features_outs = [len(category) for category in categories]
-        self._encoder._infrequent_enabled = False
-        self._encoder.drop_idx_ = None
-        self._encoder._drop_idx_after_grouping = None
+        self._set_categories(list(params["categories_"]))
 
 
 if __name__ == "__main__":
     from datetime import datetime
 
+    from pandas import date_range
+
     demo_time_attributes = TimeAttributes(
         hours=True, days_of_week=True, weekend=True, months=True, years=False, min_interval=0
     )
@@ -220,3 +483,10 @@ if __name__ == "__main__":
     demo_output = demo_transformer.fit_predict(demo_data)
     print(demo_output)
     print(demo_transformer.get_encoded_attribute_names())
+
+    demo_chunks = [date_range(start, periods=24 * 31, freq="h") for start in ("2024-01-01", "2024-02-01", "2024-03-03")]
+    demo_chunked_transformer = DatetimeOneHotEncoderTransformer(demo_time_attributes, output="sparse")
+    for demo_chunk in demo_chunks:
+        demo_chunked_transformer.partial_fit(demo_chunk)
+    for demo_chunk_output in demo_chunked_transformer.predict_iter(demo_chunks):
+        print(demo_chunk_output.shape, demo_chunk_output.nnz)
@@ -0,0 +1,391 @@
+"""
+Transformer
+
+Creates lag and rolling window features of the numerical columns of a DataFrame with regular DatetimeIndex.
+
+Lags and windows are given as time spans ("15min", "1h", "1D") and converted to a number of rows by the step of the
+index learned in fit, so the index has to be regular (constant step, no gaps) and the spans multiples of the step:
+- lag: value of the column the span earlier,
+- rolling statistic (mean, std, min, max): statistic of the trailing window of the span ending with the row
+  (inclusive), as pandas rolling(window).<statistic>() with min_periods equal to the window. std has ddof=1.
+Rows without the full history (the first rows) are NaN.
+
+Everything is vectorized and O(n) whatever the window, with the values cut into blocks of the window length so every
+window is the suffix of one block and the prefix of the next one: means and standard deviations from cumulative sums
+restarted at every block over the values centred by their block mean (precise also for long and trending series),
+combined per window with the pairwise update of Chan et al., minima and maxima from prefix and suffix scans
+(van Herk/Gil-Werman). The output can be float32 and preallocated (predict_into).
+
+Usage can be found at the end of the file.
+"""
+
+from typing import Any, NamedTuple
+
+from numpy import (
+    arange,
+    cumsum,
+    diff,
+    dtype,
+    empty,
+    errstate,
+    float64,
+    full,
+    isnan,
+    maximum,
+    minimum,
+    nan,
+    ndarray,
+    result_type,
+    sqrt,
+    ufunc,
+    zeros,
+)
+from numpy.typing import DTypeLike
+from pandas import DataFrame, DatetimeIndex, Timedelta
+
+from src.exceptions.data_exception import IncorrectDataStructure
+from src.exceptions.development_exception import IncorrectValue, NoProperOptionInIf, NotValidOperation
+from src.exceptions.exception_executioner import ExceptionExecutioner
+from src.transformations.base_transformer import BaseTransformer, TransformerDescription, resolve_output_dtype
+
+STATISTICS = ("mean", "std", "min", "max")
+
+
+class LagRollingFeatures(NamedTuple):
+    """
+    Tuple for storing which features should be created.
+    - lags: list[str]. Time spans of the lags, e.g. ["1h", "1D"].
+    - windows: list[str]. Time spans of the rolling windows, e.g. ["6h"].
+    - statistics: list[str]. Statistics of every window, subset of STATISTICS.
+    """
+
+    lags: list[str]
+    windows: list[str]
+    statistics: list[str]
+
+
+class LagRollingFeatureTransformer(BaseTransformer):
+    """
+    Transforms a DataFrame with regular DatetimeIndex to a matrix of lag and rolling window features of its columns.
+
+    The output has one block of len(columns) columns per feature, lags first, then the windows with their statistics:
+        <column>_LAG_<lag>, ..., <column>_ROLLING_<window>_<STATISTIC>, ...
+    """
+
+    def __init__(self, features: LagRollingFeatures, dtype: DTypeLike | None = None) -> None:
+        """
+        Initialises the transformer with the features to create.
+        :param features: LagRollingFeatures. Lags, windows and statistics.
+        :param dtype: DTypeLike | None. Floating data type of the output, e.g. float32. Default None is the real dtype
+            of the project policy.
+        """
+        transformer_description = TransformerDescription(
+            input_type=[DataFrame], input_elements_type=[float], output_type=[ndarray], output_elements_type=[float]
+        )
+        BaseTransformer.__init__(self, class_name="LagRollingFeature", transformer_description=transformer_description)
+        if not features.lags and not (features.windows and features.statistics):
+            ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+                description=self._class_info.class_type + " " + self._class_info.class_name
+            )
+        unknown = set(features.statistics) - set(STATISTICS)
+        if unknown:
+            ExceptionExecutioner(NoProperOptionInIf).log_and_raise(
+                description=f"Unknown statistics {sorted(unknown)}, use a subset of {STATISTICS}."
+            )
+        self._features = features
+        self._dtype = resolve_output_dtype(dtype, "real")
+        self._step: Timedelta | None = None
+        self._columns: list[str] = []
+
+    def _rows(self, span: str) -> int:
+        """
+        Converts a time span to a number of rows of the fitted step.
+        :param span: str. Time span, e.g. "1h".
+        :return: int.
+        """
+        if self._step is None:
+            ExceptionExecutioner(NotValidOperation).log_and_raise(description=f"{self.get_class_name()} is not fitted.")
+        rows, remainder = divmod(Timedelta(span), self._step)
+        if remainder or rows < 1:
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Span {span} is not a positive multiple of the step {self._step}."
+            )
+        return int(rows)
+
+    def _check_index(self, df: DataFrame) -> Timedelta:
+        """
+        Returns the step of a regular DatetimeIndex, raises IncorrectDataStructure for anything else.
+        :param df: DataFrame.
+        :return: Timedelta.
+        """
+        if not isinstance(df.index, DatetimeIndex) or len(df.index) < 2:
+            ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+                description="Lag and rolling features need a DataFrame with DatetimeIndex of at least two rows."
+            )
+        ticks = df.index.asi8
+        steps = diff(ticks)
+        if (steps != steps[0]).any() or steps[0] <= 0:
+            ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+                description="Lag and rolling features need a regular, increasing DatetimeIndex without gaps."
+            )
+        return Timedelta(int(steps[0]), unit=df.index.unit)
+
+    def get_encoded_attribute_names(self) -> list[str]:
+        """
+        Returns the names of the output columns.
+        :return: List[str].
+        """
+        names = [f"{column}_LAG_{lag}" for lag in self._features.lags for column in self._columns]
+        return names + [
+            f"{column}_ROLLING_{window}_{statistic.upper()}"
+            for window in self._features.windows
+            for statistic in self._features.statistics
+            for column in self._columns
+        ]
+
+    def get_output_dtype(self) -> dtype[Any]:
+        """
+        Returns the dtype of the output.
+        :return: dtype[Any].
+        """
+        return self._dtype
+
+    def fit(self, df: DataFrame) -> None:
+        """
+        Learns the step of the index and the columns, and checks the spans against the step.
+        :param df: DataFrame. Numerical columns with regular DatetimeIndex.
+        """
+        self._step = self._check_index(df)
+        self._columns = [str(column) for column in df.columns]
+        for span in [*self._features.lags, *self._features.windows]:
+            self._rows(span)
+        self._params = {
+            "features": self._features,
+            "dtype": self._dtype.str,
+            "step": str(self._step),
+            "columns": self._columns,
+        }
+
+    def fit_predict(self, df: DataFrame) -> ndarray[Any, dtype[Any]]:
+        """
+        Fits and predicts.
+        :param df: DataFrame.
+        :return: ndarray[Any, dtype[Any]].
+        """
+        self.fit(df)
+        return self.predict(df)
+
+    def predict(self, df: DataFrame) -> ndarray[Any, dtype[Any]]:
+        """
+        Predicts.
+        :param df: DataFrame. Columns of the fit with DatetimeIndex of the fitted step.
+        :return: ndarray[Any, dtype[Any]]. Matrix of shape (len(df), number of output columns).
+        """
+        prediction: ndarray[Any, dtype[Any]] = empty(
+            (len(df), len(self.get_encoded_attribute_names())), dtype=self._dtype
+        )
+        self._write(df, prediction)
+        return prediction
+
+    def predict_into(self, df: DataFrame, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Writes the prediction into out.
+        :param df: DataFrame. Columns of the fit with DatetimeIndex of the fitted step.
+        :param out: ndarray[Any, dtype[Any]]. Preallocated floating output of shape (len(df), number of output
+            columns), may be a column slice of a bigger array.
+        """
+        if out.shape != (len(df), len(self.get_encoded_attribute_names())):
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Expected output of {len(self.get_encoded_attribute_names())} columns, got {out.shape}."
+            )
+        self._write(df, out)
+
+    def _write(self, df: DataFrame, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Writes all the feature blocks into out.
+        :param df: DataFrame.
+        :param out: ndarray[Any, dtype[Any]]. Output.
+        """
+        if self._check_index(df) != self._step or [str(column) for column in df.columns] != self._columns:
+            ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+                description=f"Expected columns {self._columns} with step {self._step}."
+            )
+        values = df.to_numpy(dtype=float64)
+        if isnan(values).any():
+            ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+                description="Lag and rolling features do not support NaN in the input."
+            )
+        n_columns = len(self._columns)
+        block = 0
+        for lag in self._features.lags:
+            _write_lag(values, self._rows(lag), out[:, block : block + n_columns])
+            block += n_columns
+        for window in self._features.windows:
+            rows = self._rows(window)
+            if rows > len(values):
+                out[:, block : block + n_columns * len(self._features.statistics)] = nan
+                block += n_columns * len(self._features.statistics)
+                continue
+            moments = _window_moments(values, rows) if {"mean", "std"} & set(self._features.statistics) else None
+            for statistic in self._features.statistics:
+                _write_statistic(values, rows, statistic, moments, out[:, block : block + n_columns])
+                block += n_columns
+
+    def is_row_wise(self) -> bool:
+        """
+        The lags and windows look at the previous rows, so the rows cannot be predicted in independent blocks.
+        :return: bool.
+        """
+        return False
+
+    def inverse(self, data: ndarray[Any, dtype[Any]]) -> ndarray[Any, dtype[Any]]:  # noqa: ARG002
+        """
+        The features are not invertible (the lags miss the last rows, the statistics the values), raises.
+        :param data: ndarray[Any, dtype[Any]].
+        :return: ndarray[Any, dtype[Any]].
+        """
+        ExceptionExecutioner(NotValidOperation).log_and_raise(
+            description=f"{self.get_class_name()} features are not invertible."
+        )
+
+    def restore_from_params(self, params: dict[str, Any]) -> None:
+        """
+        Restores the fitted state from params.
+        :param params: Dict[str, Any]. Params as produced by get_params() after a fit.
+        """
+        self._params = params
+        self._features = params["features"]
+        self._dtype = result_type(params["dtype"])
+        self._step = Timedelta(params["step"])
+        self._columns = params["columns"]
+
+
+def _write_lag(values: ndarray[Any, dtype[Any]], rows: int, out: ndarray[Any, dtype[Any]]) -> None:
+    """
+    Writes the values shifted down by rows, NaN above.
+    :param values: ndarray[Any, dtype[Any]]. Input columns.
+    :param rows: int. Lag in rows.
+    :param out: ndarray[Any, dtype[Any]]. Output block.
+    """
+    out[:rows] = nan
+    out[rows:] = values[:-rows]
+
+
+def _window_moments(
+    values: ndarray[Any, dtype[Any]], rows: int
+) -> tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]:
+    """
+    Returns the means and the sums of squared deviations from the mean of all the full trailing windows.
+
+    A difference of cumulative sums over the whole series loses the digits of a long or trending series, so the
+    values are cut into blocks of the window length, centred by their block mean and summed by cumulative sums
+    restarted at every block. A window is the suffix of one block and the (possibly empty) prefix of the next one, the
+    moments of the two parts are combined by the pairwise update of Chan et al.
+    :param values: ndarray[Any, dtype[Any]]. Input columns.
+    :param rows: int. Window in rows.
+    :return: Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]]. Means and sums of squared deviations, one
+        row per full window (len(values) - rows + 1 rows).
+    """
+    n_rows, n_columns = values.shape
+    n_blocks = -(-n_rows // rows)
+    blocks = zeros((n_blocks * rows, n_columns))
+    blocks[:n_rows] = values
+    blocks = blocks.reshape(n_blocks, rows, n_columns)
+    counts = full(n_blocks, float(rows))
+    counts[-1] = n_rows - (n_blocks - 1) * rows
+    block_means = blocks.sum(axis=1) / counts[:, None]
+    centred = blocks - block_means[:, None, :]
+    centred.reshape(-1, n_columns)[n_rows:] = 0.0  # padding of the last block
+    squares = centred * centred
+    prefix_sums = cumsum(centred, axis=1).reshape(-1, n_columns)
+    prefix_squares = cumsum(squares, axis=1).reshape(-1, n_columns)
+    suffix_sums = cumsum(centred[:, ::-1], axis=1)[:, ::-1].reshape(-1, n_columns)
+    suffix_squares = cumsum(squares[:, ::-1], axis=1)[:, ::-1].reshape(-1, n_columns)
+    means_of_rows = block_means.repeat(rows, axis=0)
+
+    # the window starting at row s is the suffix of the block of s (n_suffix rows) and the prefix of the next block
+    # ending at row s + rows - 1 (n_prefix rows, empty for a window aligned with a block)
+    n_windows = n_rows - rows + 1
+    n_prefix = (arange(n_windows) % rows)[:, None].astype(float64)
+    n_suffix = rows - n_prefix
+    suffix_sums, suffix_squares = suffix_sums[:n_windows], suffix_squares[:n_windows]
+    prefix_sums, prefix_squares = prefix_sums[rows - 1 : n_rows], prefix_squares[rows - 1 : n_rows]
+    suffix_mean = means_of_rows[:n_windows] + suffix_sums / n_suffix
+    suffix_m2 = suffix_squares - suffix_sums * suffix_sums / n_suffix
+    with errstate(invalid="ignore", divide="ignore"):
+        prefix_mean = means_of_rows[rows - 1 : n_rows] + prefix_sums / n_prefix
+        prefix_m2 = prefix_squares - prefix_sums * prefix_sums / n_prefix
+    empty_prefix = n_prefix[:, 0] == 0
+    prefix_mean[empty_prefix] = suffix_mean[empty_prefix]
+    prefix_m2[empty_prefix] = 0.0
+    delta = prefix_mean - suffix_mean
+    means = suffix_mean + delta * n_prefix / rows
+    sums_of_squares = suffix_m2 + prefix_m2 + delta * delta * n_suffix * n_prefix / rows
+    return means, sums_of_squares
+
+
+def _write_window_extremes(
+    values: ndarray[Any, dtype[Any]], rows: int, extreme: ufunc, out: ndarray[Any, dtype[Any]]
+) -> None:
+    """
+    Writes the minima or maxima of all the full trailing windows in O(n) whatever the window (van Herk/Gil-Werman):
+    the values are cut into blocks of the window length, every window spans the end of one block and the start of the
+    next one, so its extreme is the extreme of a suffix scan and a prefix scan of the blocks.
+    :param values: ndarray[Any, dtype[Any]]. Input columns.
+    :param rows: int. Window in rows.
+    :param extreme: ufunc. numpy minimum or maximum.
+    :param out: ndarray[Any, dtype[Any]]. Output, one row per full window (len(values) - rows + 1 rows).
+    """
+    n_rows, n_columns = values.shape
+    n_blocks = -(-n_rows // rows)
+    blocks = full((n_blocks * rows, n_columns), nan)
+    blocks[:n_rows] = values
+    blocks = blocks.reshape(n_blocks, rows, n_columns)
+    prefix = extreme.accumulate(blocks, axis=1).reshape(-1, n_columns)
+    suffix = extreme.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(-1, n_columns)
+    extreme(suffix[: n_rows - rows + 1], prefix[rows - 1 : n_rows], out=out, casting="same_kind")
+
+
+def _write_statistic(
+    values: ndarray[Any, dtype[Any]],
+    rows: int,
+    statistic: str,
+    moments: tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]] | None,
+    out: ndarray[Any, dtype[Any]],
+) -> None:
+    """
+    Writes a rolling statistic of the trailing windows, NaN for the rows without a full window.
+    :param values: ndarray[Any, dtype[Any]]. Input columns.
+    :param rows: int. Window in rows.
+    :param statistic: str. One of STATISTICS.
+    :param moments: Tuple[ndarray[Any, dtype[Any]], ndarray[Any, dtype[Any]]] | None. Result of _window_moments,
+        needed by mean and std.
+    :param out: ndarray[Any, dtype[Any]]. Output block.
+    """
+    out[: rows - 1] = nan
+    full_windows = out[rows - 1 :]
+    if statistic in {"min", "max"}:
+        _write_window_extremes(values, rows, minimum if statistic == "min" else maximum, full_windows)
+        return
+    if moments is None:
+        ExceptionExecutioner(NoProperOptionInIf).log_and_raise(description=f"Missing window moments for {statistic}.")
+    means, sums_of_squares = moments
+    if statistic == "mean":
+        full_windows[...] = means
+        return
+    full_windows[...] = nan if rows == 1 else sqrt(maximum(sums_of_squares / (rows - 1), 0))
+
+
+if __name__ == "__main__":
+    from numpy import arange
+    from pandas import date_range
+
+    demo_data = DataFrame(
+        {"load": arange(12, dtype=float64), "price": arange(12, dtype=float64) ** 2},
+        index=date_range("2024-01-01", periods=12, freq="h"),
+    )
+    demo_transformer = LagRollingFeatureTransformer(
+        LagRollingFeatures(lags=["1h"], windows=["3h"], statistics=["mean"])
+    )
+    print(demo_transformer.get_encoded_attribute_names())
+    print(demo_transformer.fit_predict(demo_data))
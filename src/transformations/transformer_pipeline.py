@@ -0,0 +1,353 @@
+"""
+Transformer pipeline.
+
+Composition of transformers:
+- TransformerPipeline chains steps, the output of one step is the input of the next one.
+- TransformerUnion runs branches on the same input and concatenates their outputs column-wise.
+
+Both are transformers themselves, so they nest: a pipeline step can be a union whose branches are pipelines.
+
+The union learns the output width of every branch in fit from the names of its output columns
+(get_encoded_attribute_names), so predict allocates the final output matrix once and every branch writes its columns
+straight into its slice of it (predict_into) instead of a concatenation copying all the branch outputs again. The
+fitted params of all the steps are saved and restored in one call through SaverAndLoader.
+
+Usage can be found at the end of the file.
+"""
+
+from typing import Any
+
+from numpy import dtype, empty, ndarray, result_type
+from scipy.sparse import hstack
+
+from src.data.saver_and_loader import SaverAndLoader
+from src.exceptions.development_exception import IncorrectValue
+from src.exceptions.exception_executioner import ExceptionExecutioner
+from src.transformations.base_transformer import BaseTransformer, TransformerDescription
+from src.utils.monitored_base import PIPELINE_TYPE_NAME
+
+
+class _Composition(BaseTransformer):
+    """
+    Common parent of the pipeline and the union: a list of transformers whose params are the list of their params.
+    """
+
+    def __init__(self, class_name: str, transformers: list[BaseTransformer]) -> None:
+        """
+        :param class_name: str. Name of the composition.
+        :param transformers: List[BaseTransformer]. Steps or branches.
+        """
+        if not transformers:
+            ExceptionExecutioner(IncorrectValue).log_and_raise(description=f"{class_name} needs a transformer.")
+        BaseTransformer.__init__(
+            self,
+            class_name=class_name,
+            transformer_description=TransformerDescription(
+                input_type=transformers[0].get_class_info().transformer_description.input_type,
+                input_elements_type=transformers[0].get_class_info().transformer_description.input_elements_type,
+                output_type=None,
+                output_elements_type=None,
+            ),
+        )
+        self._class_info = self._class_info._replace(class_type=PIPELINE_TYPE_NAME)
+        self._transformers = transformers
+
+    def get_transformers(self) -> list[BaseTransformer]:
+        """
+        Returns the steps or branches.
+        :return: List[BaseTransformer].
+        """
+        return self._transformers
+
+    def is_row_wise(self) -> bool:
+        """
+        The composition is row-wise if all its transformers are.
+        :return: bool.
+        """
+        return all(transformer.is_row_wise() for transformer in self._transformers)
+
+    def _store_params(self) -> None:
+        """
+        Stores the params of all the transformers.
+        """
+        self._params = {"transformers": [transformer.get_params() for transformer in self._transformers]}
+
+    def get_params(self) -> dict[str, Any]:
+        """
+        Gets the params of all the transformers, collected at the time of the call.
+        :return: Dict[str, Any].
+        """
+        self._store_params()
+        return self._params
+
+    def restore_from_params(self, params: dict[str, Any]) -> None:
+        """
+        Restores all the transformers from params produced by get_params of a composition of the same structure.
+        :param params: Dict[str, Any].
+        """
+        if len(params["transformers"]) != len(self._transformers):
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Params of {len(params['transformers'])} transformers for {len(self._transformers)}."
+            )
+        for transformer, transformer_params in zip(self._transformers, params["transformers"], strict=True):
+            transformer.restore_from_params(transformer_params)
+        self._params = params
+
+    def save_params(self, file_name: str, where: str = "data") -> None:
+        """
+        Saves the fitted params of all the transformers into one pickle file with a manifest.
+        :param file_name: str. File name without .pkl.
+        :param where: str. Name of the path from the config file.
+        """
+        SaverAndLoader.save_to_pickle(self.get_params(), file_name, where, manifest=True)
+
+    def load_params(self, file_name: str, where: str = "data") -> None:
+        """
+        Restores all the transformers from a file written by save_params, see restore_from_params.
+        :param file_name: str. File name without .pkl.
+        :param where: str. Name of the path from the config file.
+        """
+        self.restore_from_params(SaverAndLoader.load_from_pickle(file_name, where))
+
+
+class TransformerPipeline(_Composition):
+    """
+    Chain of transformers. fit fits every step on the output of the previous fitted step, predict runs the steps in
+    order and inverse in reverse order.
+    """
+
+    def __init__(self, steps: list[BaseTransformer]) -> None:
+        """
+        :param steps: List[BaseTransformer]. Transformers in the order of application.
+        """
+        _Composition.__init__(self, class_name="TransformerPipeline", transformers=steps)
+
+    def fit(self, data: Any) -> None:
+        """
+        Fits all the steps.
+        :param data: Any. Input of the first step.
+        """
+        for step in self._transformers[:-1]:
+            data = step.fit_predict(data)
+        self._transformers[-1].fit(data)
+        self._store_params()
+
+    def fit_predict(self, data: Any) -> Any:
+        """
+        Fits all the steps and returns the output of the last one.
+        :param data: Any. Input of the first step.
+        :return: Any. Output of the last step.
+        """
+        for step in self._transformers:
+            data = step.fit_predict(data)
+        self._store_params()
+        return data
+
+    def _predict_head(self, data: Any) -> Any:
+        """
+        Runs all the steps but the last one.
+        :param data: Any. Input of the first step.
+        :return: Any. Input of the last step.
+        """
+        for step in self._transformers[:-1]:
+            data = step.predict(data)
+        return data
+
+    def predict(self, data: Any) -> Any:
+        """
+        Runs all the steps.
+        :param data: Any. Input of the first step.
+        :return: Any. Output of the last step.
+        """
+        return self._transformers[-1].predict(self._predict_head(data))
+
+    def predict_into(self, data: Any, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Runs all the steps, the last one writing into out.
+        :param data: Any. Input of the first step.
+        :param out: ndarray[Any, dtype[Any]]. Preallocated output of the last step.
+        """
+        self._transformers[-1].predict_into(self._predict_head(data), out)
+
+    def get_encoded_attribute_names(self) -> list[str]:
+        """
+        Returns the names of the output columns of the last step.
+        :return: List[str].
+        """
+        return self._transformers[-1].get_encoded_attribute_names()
+
+    def get_output_dtype(self) -> dtype[Any]:
+        """
+        Returns the output dtype of the last step.
+        :return: dtype[Any].
+        """
+        return self._transformers[-1].get_output_dtype()
+
+    def is_sparse_output(self) -> bool:
+        """
+        Returns whether the last step has a sparse output.
+        :return: bool.
+        """
+        return self._transformers[-1].is_sparse_output()
+
+    def inverse(self, data: Any) -> Any:
+        """
+        Runs the inverse of all the steps in reverse order.
+        :param data: Any. Output of the last step.
+        :return: Any. Input of the first step, as far as the steps are invertible.
+        """
+        for step in reversed(self._transformers):
+            data = step.inverse(data)
+        return data
+
+
+class TransformerUnion(_Composition):
+    """
+    Branches run on the same input, their 2D outputs are concatenated column-wise in the order of the branches.
+
+    Every branch describes its output by get_encoded_attribute_names, get_output_dtype and is_sparse_output. Dense
+    outputs are written into slices of one preallocated matrix of the common dtype of the branch outputs. If a branch
+    returns a scipy sparse matrix, the union returns a CSR matrix stacked from the branch outputs instead.
+    """
+
+    def __init__(self, branches: list[BaseTransformer]) -> None:
+        """
+        :param branches: List[BaseTransformer]. Transformers of the same input.
+        """
+        _Composition.__init__(self, class_name="TransformerUnion", transformers=branches)
+        self._widths: list[int] = []
+        self._dtype: dtype[Any] | None = None
+        self._sparse = False
+
+    def _learn_layout(self) -> None:
+        """
+        Learns the output width of every fitted branch from the names of its output columns, and the dtype and
+        sparsity of the union output. Nothing is predicted, so branches which are not row-wise work too.
+        """
+        self._widths = [len(branch.get_encoded_attribute_names()) for branch in self._transformers]
+        self._dtype = self.get_output_dtype()
+        self._sparse = self.is_sparse_output()
+
+    def get_encoded_attribute_names(self) -> list[str]:
+        """
+        Returns the names of the output columns of all the branches in their order.
+        :return: List[str].
+        """
+        return [name for branch in self._transformers for name in branch.get_encoded_attribute_names()]
+
+    def get_output_dtype(self) -> dtype[Any]:
+        """
+        Returns the common dtype of the branch outputs.
+        :return: dtype[Any].
+        """
+        return result_type(*[branch.get_output_dtype() for branch in self._transformers])
+
+    def is_sparse_output(self) -> bool:
+        """
+        Returns whether any branch, and so the union, has a sparse output.
+        :return: bool.
+        """
+        return any(branch.is_sparse_output() for branch in self._transformers)
+
+    def _store_params(self) -> None:
+        """
+        Stores the params of all the branches and the output layout.
+        """
+        self._params = {
+            "transformers": [transformer.get_params() for transformer in self._transformers],
+            "widths": self._widths,
+            "dtype": None if self._dtype is None else self._dtype.str,
+            "sparse": self._sparse,
+        }
+
+    def restore_from_params(self, params: dict[str, Any]) -> None:
+        """
+        Restores all the branches and the output layout.
+        :param params: Dict[str, Any].
+        """
+        _Composition.restore_from_params(self, params)
+        self._widths = params["widths"]
+        self._dtype = None if params["dtype"] is None else dtype(params["dtype"])
+        self._sparse = params["sparse"]
+
+    def get_widths(self) -> list[int]:
+        """
+        Returns the output width of every branch.
+        :return: List[int].
+        """
+        return self._widths
+
+    def fit(self, data: Any) -> None:
+        """
+        Fits all the branches on data.
+        :param data: Any. Data supporting row slicing, e.g. DatetimeIndex, ndarray or DataFrame.
+        """
+        for branch in self._transformers:
+            branch.fit(data)
+        self._learn_layout()
+        self._store_params()
+
+    def fit_predict(self, data: Any) -> Any:
+        """
+        Fits all the branches on data and returns the concatenated prediction.
+        :param data: Any. Data supporting row slicing.
+        :return: Any. Concatenated outputs.
+        """
+        self.fit(data)
+        return self.predict(data)
+
+    def predict(self, data: Any) -> Any:
+        """
+        Returns the concatenated outputs of the branches.
+        :param data: Any. Data supporting row slicing.
+        :return: Any. ndarray, or CSR matrix if a branch is sparse.
+        """
+        if self._sparse:
+            return hstack([branch.predict(data) for branch in self._transformers], format="csr")
+        out = empty((len(data), sum(self._widths)), dtype=self._dtype)
+        self.predict_into(data, out)
+        return out
+
+    def predict_into(self, data: Any, out: ndarray[Any, dtype[Any]]) -> None:
+        """
+        Writes the output of every branch into its column slice of out.
+        :param data: Any. Data supporting row slicing.
+        :param out: ndarray[Any, dtype[Any]]. Preallocated output with sum(get_widths()) columns.
+        """
+        if out.shape[1] != sum(self._widths):
+            ExceptionExecutioner(IncorrectValue).log_and_raise(
+                description=f"Output has {out.shape[1]} columns, the branches {sum(self._widths)}."
+            )
+        start = 0
+        for branch, width in zip(self._transformers, self._widths, strict=True):
+            branch.predict_into(data, out[:, start : start + width])
+            start += width
+
+    def inverse(self, data: Any) -> list[Any]:
+        """
+        Runs the inverse of every branch on its columns.
+        :param data: Any. Concatenated outputs.
+        :return: List[Any]. Inverse of every branch.
+        """
+        inverted = []
+        start = 0
+        for branch, width in zip(self._transformers, self._widths, strict=True):
+            inverted.append(branch.inverse(data[:, start : start + width]))
+            start += width
+        return inverted
+
+
+if __name__ == "__main__":
+    from pandas import date_range
+
+    from src.transformations.datetime_one_hot_transformer import DatetimeOneHotEncoderTransformer, TimeAttributes
+
+    demo_union = TransformerUnion(
+        [
+            DatetimeOneHotEncoderTransformer(TimeAttributes(True, False, False, False, False, 0)),
+            DatetimeOneHotEncoderTransformer(TimeAttributes(False, True, True, True, False, 0)),
+        ]
+    )
+    demo_pipeline = TransformerPipeline([demo_union])
+    demo_data = date_range("2024-01-01", periods=24 * 60, freq="h")
+    print(demo_pipeline.fit_predict(demo_data).shape, demo_union.get_widths())
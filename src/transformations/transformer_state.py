@@ -0,0 +1,191 @@
+"""
+Transformer state.
+
+Compact, versioned format of the fitted params of a transformer (see BaseTransformer.get_params), written as two
+files through SaverAndLoader:
+- <file_name>.json: format version, class name of the transformer and the params with every array replaced by its
+  dtype, shape and offset,
+- <file_name>.npy: the raw bytes of all the arrays, one after another, each aligned to ARRAY_ALIGNMENT bytes.
+
+Unlike a pickle, loading executes no code and needs no import of the libraries the params were built with: the JSON
+is parsed and every array is a view of the one loaded buffer, so loading is linear in the size of the arrays.
+Params may hold str, int, float, bool, None, lists, dicts with str keys, NamedTuples defined in this project (src)
+and numeric arrays.
+
+Usage can be found at the end of the file.
+"""
+
+from importlib import import_module
+from typing import Any
+
+from numpy import concatenate, dtype, ndarray, result_type, uint8, zeros
+
+from src.data.saver_and_loader import SaverAndLoader
+from src.exceptions.data_exception import IncorrectDataStructure
+from src.exceptions.exception_executioner import ExceptionExecutioner
+
+STATE_FORMAT_VERSION = 1
+ARRAY_ALIGNMENT = 64
+PROJECT_PACKAGE = "src"
+TYPE_KEY = "__type__"
+
+
+class _ArrayPacker:
+    """
+    Collects arrays into one aligned byte buffer.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[ndarray[Any, dtype[Any]]] = []
+        self._size = 0
+
+    def add(self, array: ndarray[Any, dtype[Any]]) -> int:
+        """
+        Adds an array and returns its offset in the buffer.
+        :param array: ndarray[Any, dtype[Any]]. Numeric array.
+        :return: int.
+        """
+        offset = self._size
+        raw = array.reshape(-1).view(uint8) if array.size else zeros(0, dtype=uint8)
+        padding = -raw.size % ARRAY_ALIGNMENT
+        self._chunks.extend([raw, zeros(padding, dtype=uint8)])
+        self._size += raw.size + padding
+        return offset
+
+    def get_buffer(self) -> ndarray[Any, dtype[Any]]:
+        """
+        Returns the buffer.
+        :return: ndarray[Any, dtype[Any]]. uint8.
+        """
+        return concatenate(self._chunks) if self._chunks else zeros(0, dtype=uint8)
+
+
+def _encode(value: Any, packer: _ArrayPacker) -> Any:
+    """
+    Converts a params value to JSON data, arrays go to the packer.
+    :param value: Any.
+    :param packer: _ArrayPacker.
+    :return: Any. JSON data.
+    """
+    if value is None or isinstance(value, str | bool | int | float):
+        return value
+    if isinstance(value, ndarray):
+        if value.dtype.hasobject:
+            ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+                description="Arrays of dtype object can not be stored in the transformer state."
+            )
+        array = value if value.flags.c_contiguous else value.copy()
+        return {TYPE_KEY: "ndarray", "dtype": array.dtype.str, "shape": list(array.shape), "offset": packer.add(array)}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        if type(value).__module__.split(".")[0] != PROJECT_PACKAGE:
+            ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+                description=f"NamedTuple {type(value).__name__} is not a class of this project."
+            )
+        return {
+            TYPE_KEY: "namedtuple",
+            "class": f"{type(value).__module__}:{type(value).__qualname__}",
+            "fields": {field: _encode(item, packer) for field, item in zip(value._fields, value, strict=True)},
+        }
+    if isinstance(value, list):
+        return [_encode(item, packer) for item in value]
+    if not (isinstance(value, dict) and all(isinstance(key, str) for key in value)):
+        ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+            description=f"Value of type {type(value).__name__} can not be stored in the transformer state."
+        )
+    return {TYPE_KEY: "dict", "items": {key: _encode(item, packer) for key, item in value.items()}}
+
+
+def _named_tuple_class(reference: str) -> Any:
+    """
+    Imports a NamedTuple class of this project.
+    :param reference: str. "<module>:<qualified name>".
+    :return: Any. The class.
+    """
+    module_name, _, class_name = reference.partition(":")
+    if module_name.split(".")[0] != PROJECT_PACKAGE:
+        ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+            description=f"Class {reference} of the transformer state is not a class of this project."
+        )
+    named_tuple_class: Any = import_module(module_name)
+    for name in class_name.split("."):
+        named_tuple_class = getattr(named_tuple_class, name)
+    if not (isinstance(named_tuple_class, type) and issubclass(named_tuple_class, tuple)):
+        ExceptionExecutioner(IncorrectDataStructure).log_and_raise(description=f"{reference} is not a NamedTuple.")
+    return named_tuple_class
+
+
+def _decode(data: Any, buffer: ndarray[Any, dtype[Any]]) -> Any:
+    """
+    Converts JSON data made by _encode back to the params value.
+    :param data: Any. JSON data.
+    :param buffer: ndarray[Any, dtype[Any]]. uint8 buffer of the arrays.
+    :return: Any.
+    """
+    if isinstance(data, list):
+        return [_decode(item, buffer) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if data[TYPE_KEY] == "ndarray":
+        array_dtype = result_type(data["dtype"])
+        shape = tuple(data["shape"])
+        size = array_dtype.itemsize
+        for length in shape:
+            size *= length
+        array: ndarray[Any, dtype[Any]] = buffer[data["offset"] : data["offset"] + size].view(array_dtype)
+        return array.reshape(shape)
+    if data[TYPE_KEY] == "namedtuple":
+        fields = {field: _decode(item, buffer) for field, item in data["fields"].items()}
+        return _named_tuple_class(data["class"])(**fields)
+    return {key: _decode(item, buffer) for key, item in data["items"].items()}
+
+
+def save_state(class_name: str, params: dict[str, Any], file_name: str, where: str = "data") -> None:
+    """
+    Saves the params of a transformer.
+    :param class_name: str. Class name of the transformer, checked on load.
+    :param params: Dict[str, Any]. Params as produced by get_params() after a fit.
+    :param file_name: str. File name without extension.
+    :param where: str. Name of the path from the config file.
+    """
+    packer = _ArrayPacker()
+    metadata = {"version": STATE_FORMAT_VERSION, "class_name": class_name, "params": _encode(params, packer)}
+    SaverAndLoader.save_array(packer.get_buffer(), file_name, where, manifest=True)
+    SaverAndLoader.save_config_data(metadata, file_name, where, manifest=True)
+
+
+def load_state(class_name: str, file_name: str, where: str = "data") -> dict[str, Any]:
+    """
+    Loads the params of a transformer saved by save_state.
+    :param class_name: str. Class name of the transformer to be restored, has to be the saved one.
+    :param file_name: str. File name without extension.
+    :param where: str. Name of the path from the config file.
+    :return: Dict[str, Any]. Params for restore_from_params.
+    """
+    metadata = SaverAndLoader.load_config_data(file_name, dict[str, Any], where)
+    if metadata.get("version") != STATE_FORMAT_VERSION:
+        ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+            description=f"Transformer state {file_name} has version {metadata.get('version')}, "
+            f"supported is {STATE_FORMAT_VERSION}."
+        )
+    if metadata["class_name"] != class_name:
+        ExceptionExecutioner(IncorrectDataStructure).log_and_raise(
+            description=f"Transformer state {file_name} is of {metadata['class_name']}, not of {class_name}."
+        )
+    buffer = SaverAndLoader.load_array(file_name, where, mmap=False)
+    params: dict[str, Any] = _decode(metadata["params"], buffer)
+    return params
+
+
+if __name__ == "__main__":
+    from numpy import arange
+
+    from src.transformations.datetime_one_hot_transformer import TimeAttributes
+
+    demo_packer = _ArrayPacker()
+    demo_params = {
+        "time_attributes": TimeAttributes(True, False, False, False, False, 0),
+        "categories_": [arange(24.0)],
+    }
+    demo_data = _encode(demo_params, demo_packer)
+    print(demo_data)
+    print(_decode(demo_data, demo_packer.get_buffer()))
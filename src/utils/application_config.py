@@ -59,7 +59,10 @@ class ApplicationConfig(metaclass=Singleton):
 
         root = ProjectPaths().root
         self._data = self._data._replace(
-            path=self._data.path._replace(data=_resolve_path(self._data.path.data, root)),
+            path=self._data.path._replace(
+                data=_resolve_path(self._data.path.data, root),
+                cache=_resolve_path(self._data.path.cache, root),
+            ),
             param_ntb_execution=self._data.param_ntb_execution._replace(
                 ntb_path=_resolve_path(self._data.param_ntb_execution.ntb_path, root),
                 output_folder=_resolve_path(self._data.param_ntb_execution.output_folder, root),
@@ -8,9 +8,12 @@ from typing import NamedTuple
 class Path(NamedTuple):
     """
     Configuration tuple for paths to data files.
+    - data: str. Folder with the data files.
+    - cache: str. Folder of the artifact cache (see src/data/artifact_cache.py).
     """
 
     data: str
+    cache: str = "data/cache"
 
 
 class ParamNotebookExecution(NamedTuple):
@@ -25,6 +28,20 @@ class ParamNotebookExecution(NamedTuple):
     notebook_executioner_params: list[dict[str, float | str]]
 
 
+class TransformationDtypes(NamedTuple):
+    """
+    Configuration tuple for the default output dtypes of the transformers (see src/transformations/base_transformer.py),
+    used when a transformer is created without dtype.
+    - indicator: str. 0/1 outputs, e.g. one-hot encoding: "uint8", "bool", "float32", ...
+    - integer: str. Small integer outputs, e.g. numerical datetime attributes: "int16", "int32", ...
+    - real: str. Real-valued outputs, e.g. sine/cosine encoding and rolling statistics: "float32", "float64".
+    """
+
+    indicator: str = "uint8"
+    integer: str = "int16"
+    real: str = "float64"
+
+
 class ApplicationConfigData(NamedTuple):
     """
     Overall configuration tuple for everything.
@@ -33,3 +50,4 @@ class ApplicationConfigData(NamedTuple):
     name: str
     path: Path
     param_ntb_execution: ParamNotebookExecution
+    transformation_dtypes: TransformationDtypes = TransformationDtypes()
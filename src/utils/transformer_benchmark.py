@@ -0,0 +1,279 @@
+"""
+Micro-benchmark of DatetimeOneHotEncoderTransformer.
+
+Measures the throughput (rows per second, best of several runs) and the peak memory (tracemalloc, numpy allocations
+included) of fit, predict and fit_predict for minute-frequency indexes of several sizes and several combinations of
+time attributes. The results are saved as .json and .csv per git branch in logs/benchmarks and compared with the
+results of a baseline branch (by default the previous run of the current one): a throughput lower than the baseline
+by more than the tolerance is a regression and the script exits with 1.
+
+(.venv) > python src/utils/transformer_benchmark.py
+(.venv) > python src/utils/transformer_benchmark.py --full --baseline-branch main --tolerance 0.1
+
+Usage can be found at the end of the file.
+"""
+
+import argparse
+import csv
+import json
+import pathlib
+import sys
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from time import perf_counter
+from typing import Any, NamedTuple
+
+from pandas import DatetimeIndex, date_range
+
+# This module is invoked directly (see the Makefile's benchmark target), so the repo root must be added to sys.path
+# before the absolute "from src..." imports below can resolve - mirrors cover_logger.py.
+_BASE_DIR = pathlib.Path(__file__).resolve().parent
+sys.path += [str(_BASE_DIR / ".."), str(_BASE_DIR / "../..")]
+
+from src.transformations.datetime_one_hot_transformer import (  # noqa: E402
+    DatetimeOneHotEncoderTransformer,
+    TimeAttributes,
+)
+from src.utils.helper_functions import get_git_branch  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+FULL_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+ATTRIBUTE_COMBINATIONS = {
+    "hours": TimeAttributes(hours=True, days_of_week=False, weekend=False, months=False, years=False, min_interval=0),
+    "calendar": TimeAttributes(hours=False, days_of_week=True, weekend=True, months=True, years=False, min_interval=0),
+    "all": TimeAttributes(hours=True, days_of_week=True, weekend=True, months=True, years=True, min_interval=15),
+}
+OPERATIONS = ("fit", "predict", "fit_predict")
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.2
+BYTES_PER_MB = 1024 * 1024
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    Tuple for storing one measurement.
+    - branch: str. Git branch the benchmark ran on.
+    - time: str. Time of the measurement in format dd-mm-YYYY HH:MM:SS.
+    - combination: str. Key of ATTRIBUTE_COMBINATIONS.
+    - n_rows: int. Length of the minute-frequency index.
+    - operation: str. One of OPERATIONS.
+    - seconds: float. Duration of the best run.
+    - rows_per_second: float. Throughput of the best run.
+    - peak_memory_mb: float. Peak of the memory allocated during one run.
+    """
+
+    branch: str
+    time: str
+    combination: str
+    n_rows: int
+    operation: str
+    seconds: float
+    rows_per_second: float
+    peak_memory_mb: float
+
+
+class TransformerBenchmark:
+    """
+    Runs, saves, loads and compares the benchmark.
+    """
+
+    LOG_FOLDER_NAME = "logs"
+    BENCHMARK_FOLDER_NAME = "benchmarks"
+
+    def __init__(
+        self,
+        sizes: tuple[int, ...] = DEFAULT_SIZES,
+        combinations: tuple[str, ...] = tuple(ATTRIBUTE_COMBINATIONS),
+        repeat: int = DEFAULT_REPEAT,
+        folder: pathlib.Path | None = None,
+    ) -> None:
+        """
+        :param sizes: Tuple[int, ...]. Numbers of rows of the indexes.
+        :param combinations: Tuple[str, ...]. Keys of ATTRIBUTE_COMBINATIONS.
+        :param repeat: int. Number of timed runs, the best one is kept.
+        :param folder: pathlib.Path | None. Folder of the results. None for logs/benchmarks of the repository.
+        """
+        self._sizes = sizes
+        self._combinations = combinations
+        self._repeat = repeat
+        self._folder = (
+            folder
+            if folder is not None
+            else pathlib.Path(__file__).parent.parent.parent.absolute()
+            / self.LOG_FOLDER_NAME
+            / self.BENCHMARK_FOLDER_NAME
+        )
+
+    def _get_path(self, branch: str, extension: str) -> pathlib.Path:
+        """
+        Returns the path of the results of a branch.
+        :param branch: str. Branch name, "/" is replaced by "_".
+        :param extension: str. ".json" or ".csv".
+        :return: pathlib.Path.
+        """
+        return self._folder / ("benchmark_" + branch.replace("/", "_") + extension)
+
+    @staticmethod
+    def _measure(run: Callable[[], Any], repeat: int) -> tuple[float, float]:
+        """
+        Measures a function: the best time of repeat runs and the peak memory of one more run under tracemalloc,
+        which is not timed because tracing slows the allocations down.
+        :param run: Callable[[], Any]. Benchmarked function.
+        :param repeat: int. Number of timed runs.
+        :return: Tuple[float, float]. Seconds of the best run and peak memory in MB.
+        """
+        best = float("inf")
+        for _ in range(repeat):
+            start = perf_counter()
+            run()
+            best = min(best, perf_counter() - start)
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return best, peak / BYTES_PER_MB
+
+    def _benchmark_operation(self, operation: str, combination: str, data: DatetimeIndex) -> tuple[float, float]:
+        """
+        Measures one operation of a transformer with one attribute combination.
+        :param operation: str. One of OPERATIONS.
+        :param combination: str. Key of ATTRIBUTE_COMBINATIONS.
+        :param data: DatetimeIndex.
+        :return: Tuple[float, float]. Seconds and peak memory in MB.
+        """
+        transformer = DatetimeOneHotEncoderTransformer(ATTRIBUTE_COMBINATIONS[combination])
+        if operation == "predict":
+            transformer.fit(data)
+        return self._measure(lambda: getattr(transformer, operation)(data), self._repeat)
+
+    def run(self) -> list[BenchmarkResult]:
+        """
+        Runs all the operations for all the sizes and combinations.
+        :return: List[BenchmarkResult].
+        """
+        branch = get_git_branch()
+        results = []
+        for n_rows in self._sizes:
+            data = date_range("2000-01-01", periods=n_rows, freq="min")
+            for combination in self._combinations:
+                for operation in OPERATIONS:
+                    seconds, peak_memory_mb = self._benchmark_operation(operation, combination, data)
+                    results.append(
+                        BenchmarkResult(
+                            branch=branch,
+                            time=datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+                            combination=combination,
+                            n_rows=n_rows,
+                            operation=operation,
+                            seconds=seconds,
+                            rows_per_second=n_rows / seconds,
+                            peak_memory_mb=peak_memory_mb,
+                        )
+                    )
+        return results
+
+    def save(self, results: list[BenchmarkResult], branch: str) -> None:
+        """
+        Saves the results of a branch as .json and .csv, replacing its previous results.
+        :param results: List[BenchmarkResult].
+        :param branch: str.
+        """
+        self._folder.mkdir(parents=True, exist_ok=True)
+        with self._get_path(branch, ".json").open("w", encoding="utf-8") as file:
+            json.dump([result._asdict() for result in results], file, indent=2)
+        with self._get_path(branch, ".csv").open("w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(BenchmarkResult._fields)
+            writer.writerows(results)
+
+    def load(self, branch: str) -> list[BenchmarkResult]:
+        """
+        Loads the saved results of a branch.
+        :param branch: str.
+        :return: List[BenchmarkResult]. Empty if the branch has no results.
+        """
+        path = self._get_path(branch, ".json")
+        if not path.exists():
+            return []
+        with path.open(encoding="utf-8") as file:
+            return [BenchmarkResult(**result) for result in json.load(file)]
+
+    @staticmethod
+    def compare(
+        results: list[BenchmarkResult], baseline: list[BenchmarkResult], tolerance: float = DEFAULT_TOLERANCE
+    ) -> list[str]:
+        """
+        Compares the throughput of the measurements present in both lists.
+        :param results: List[BenchmarkResult]. Current results.
+        :param baseline: List[BenchmarkResult]. Baseline results.
+        :param tolerance: float. Allowed relative decrease of the throughput, e.g. 0.2 for 20 %.
+        :return: List[str]. Description of every regression, empty if there is none.
+        """
+        baseline_throughput = {
+            (result.combination, result.n_rows, result.operation): result.rows_per_second for result in baseline
+        }
+        regressions = []
+        for result in results:
+            reference = baseline_throughput.get((result.combination, result.n_rows, result.operation))
+            if reference is not None and result.rows_per_second < reference * (1 - tolerance):
+                regressions.append(
+                    f"{result.operation} {result.combination} {result.n_rows} rows: "
+                    f"{result.rows_per_second:,.0f} rows/s, baseline {reference:,.0f} rows/s "
+                    f"({result.rows_per_second / reference - 1:+.1%})."
+                )
+        return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    :return: argparse.Namespace. Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="DatetimeOneHotEncoderTransformer benchmark.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Numbers of rows.")
+    parser.add_argument("--full", action="store_true", help="Use FULL_SIZES (up to 1e8 rows) instead of --sizes.")
+    parser.add_argument(
+        "--combinations",
+        nargs="+",
+        choices=list(ATTRIBUTE_COMBINATIONS),
+        default=list(ATTRIBUTE_COMBINATIONS),
+        help="Combinations of time attributes.",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Number of timed runs.")
+    parser.add_argument(
+        "--baseline-branch", type=str, default=None, help="Branch to compare with, the current one by default."
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative decrease of the throughput."
+    )
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be positive.")
+    if not 0 <= args.tolerance < 1:
+        parser.error("--tolerance must be in [0, 1).")
+    return args
+
+
+if __name__ == "__main__":
+    ARGS = parse_args()
+    BENCHMARK = TransformerBenchmark(
+        sizes=FULL_SIZES if ARGS.full else tuple(ARGS.sizes), combinations=tuple(ARGS.combinations), repeat=ARGS.repeat
+    )
+    RESULTS = BENCHMARK.run()
+    for RESULT in RESULTS:
+        print(
+            f"{RESULT.operation:>12} {RESULT.combination:>9} {RESULT.n_rows:>12,} rows: "
+            f"{RESULT.rows_per_second:>14,.0f} rows/s {RESULT.peak_memory_mb:>10,.1f} MB"
+        )
+    BRANCH = get_git_branch()
+    REGRESSIONS = TransformerBenchmark.compare(
+        RESULTS, BENCHMARK.load(ARGS.baseline_branch or BRANCH), tolerance=ARGS.tolerance
+    )
+    BENCHMARK.save(RESULTS, BRANCH)
+    for REGRESSION in REGRESSIONS:
+        print("REGRESSION:", REGRESSION)
+    sys.exit(1 if REGRESSIONS else 0)
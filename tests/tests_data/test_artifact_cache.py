@@ -0,0 +1,205 @@
+"""
+Tests for ArtifactCache: key stability, hits and misses, checksum verification and LRU eviction.
+"""
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pytest
+from numpy import arange
+from pandas import DataFrame
+
+from src.data import saver_and_loader as saver_and_loader_module
+from src.data.artifact_cache import ArtifactCache
+from src.exceptions.data_exception import FileNotFound
+from src.exceptions.development_exception import IncorrectValue
+
+
+def _patch_get_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Redirects the module-level get_path helper to resolve inside tmp_path.
+    :param monkeypatch: pytest.MonkeyPatch. Used to patch the module-level function.
+    :param tmp_path: Path. Pytest-provided temporary directory to resolve paths against.
+    """
+
+    def _fake_get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:  # noqa: ARG001
+        return str(tmp_path / (file_name + extension))
+
+    monkeypatch.setattr(saver_and_loader_module, "get_path", _fake_get_path)
+
+
+_READS: list[str] = []
+
+
+def _square(x: int, calls: list[int]) -> int:
+    """
+    Squares x and records the call.
+    """
+    calls.append(x)
+    return x * x
+
+
+def test_make_key_is_deterministic_and_content_sensitive() -> None:
+    """
+    Tests that the key is stable for equal parameters regardless of set/dict ordering and changes with content.
+    """
+    frame = DataFrame({"a": arange(5)})
+
+    key = ArtifactCache.make_key(_square, ({"b": 1, "a": {3, 1, 2}}, frame))
+
+    assert key == ArtifactCache.make_key(_square, ({"a": {2, 1, 3}, "b": 1}, frame.copy()))
+    assert key != ArtifactCache.make_key(_square, ({"b": 1, "a": {3, 1, 2}}, frame + 1))
+    assert key != ArtifactCache.make_key(abs, ({"b": 1, "a": {3, 1, 2}}, frame))
+
+
+def _define_scale(source: str) -> Callable[..., int]:
+    """
+    Defines the function scale from its source, so versions of it share the qualified name.
+    """
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102
+    scale: Callable[..., int] = namespace["scale"]
+    return scale
+
+
+def test_make_key_changes_with_function_constants_defaults_and_closure() -> None:
+    """
+    Tests that the key changes with a constant, a default argument or a closure value of the function.
+    """
+    key = ArtifactCache.make_key(_define_scale("def scale(x):\n    return x * 2"), 1)
+
+    assert key == ArtifactCache.make_key(_define_scale("def scale(x):\n    return x * 2"), 1)
+    assert key != ArtifactCache.make_key(_define_scale("def scale(x):\n    return x * 3"), 1)
+    assert ArtifactCache.make_key(_define_scale("def scale(x, k=2):\n    return x * k"), 1) != ArtifactCache.make_key(
+        _define_scale("def scale(x, k=3):\n    return x * k"), 1
+    )
+
+    def _multiplier(k: int) -> Callable[[int], int]:
+        return lambda x: x * k
+
+    assert ArtifactCache.make_key(_multiplier(2), 1) != ArtifactCache.make_key(_multiplier(3), 1)
+
+
+def test_get_or_compute_misses_after_function_constant_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a changed constant in the cached function is not served the result of the old version.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    cache = ArtifactCache()
+
+    assert cache.get_or_compute(4, partial(_define_scale("def scale(x):\n    return x * 2"), 4)) == 8
+    assert cache.get_or_compute(4, partial(_define_scale("def scale(x):\n    return x * 3"), 4)) == 12
+
+
+def test_make_key_rejects_objects_without_deterministic_hash() -> None:
+    """
+    Tests that a plain object, whose repr holds its memory address, is rejected instead of producing a fresh key
+    on every run.
+    """
+
+    class _Plain:
+        pass
+
+    with pytest.raises(IncorrectValue):
+        ArtifactCache.make_key(_square, (1, _Plain()))
+
+
+def test_make_key_of_dataclasses_and_paths_is_deterministic() -> None:
+    """
+    Tests that dataclass instances and paths are hashed by their content.
+    """
+
+    @dataclass
+    class _Params:
+        alpha: float
+        path: Path
+
+    key = ArtifactCache.make_key(_square, _Params(0.5, Path("a.csv")))
+
+    assert key == ArtifactCache.make_key(_square, _Params(0.5, Path("a.csv")))
+    assert key != ArtifactCache.make_key(_square, _Params(0.5, Path("b.csv")))
+
+
+def test_get_or_compute_reuses_stored_result(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the second call with the same key parts is served from the cache.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    cache = ArtifactCache()
+    calls: list[int] = []
+
+    assert cache.get_or_compute(3, partial(_square, 3, calls)) == 9
+    assert cache.get_or_compute(3, partial(_square, 3, calls)) == 9
+    assert cache.get_or_compute(4, partial(_square, 4, calls)) == 16
+    assert calls == [3, 4]
+
+
+def test_cached_decorator_invalidates_on_input_file_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that touching an input file invalidates the entries depending on it.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    input_file = tmp_path / "input.csv"
+    input_file.write_text("a\n1\n", encoding="utf8")
+    _READS.clear()
+
+    # the calls are recorded in a module-level list: a closure value would be a part of the key
+    @ArtifactCache().cached(input_files=[input_file])
+    def _read(path: Path) -> str:
+        _READS.append(str(path))
+        return path.read_text(encoding="utf8")
+
+    _read(input_file)
+    _read(input_file)
+    input_file.write_text("a\n1\n2\n", encoding="utf8")
+    assert _read(input_file) == "a\n1\n2\n"
+    assert len(_READS) == 2
+
+
+def test_missing_input_file_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a missing input file raises FileNotFound instead of producing an unfounded key.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    with pytest.raises(FileNotFound):
+        ArtifactCache().get_or_compute(1, partial(_square, 1, []), input_files=[tmp_path / "missing.csv"])
+
+
+def test_corrupt_entry_is_recomputed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an entry whose pickle no longer matches its checksum is discarded and recomputed.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    cache = ArtifactCache()
+    calls: list[int] = []
+    cache.get_or_compute(5, partial(_square, 5, calls))
+    (data_path,) = tmp_path.glob("*.pkl")
+    data_path.write_bytes(data_path.read_bytes()[:-1] + b"\x00")
+
+    assert cache.get_or_compute(5, partial(_square, 5, calls)) == 25
+    assert calls == [5, 5]
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that eviction keeps the size limit and removes the least recently used entry first.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    cache = ArtifactCache()
+    calls: list[int] = []
+    for x in range(3):
+        cache.get_or_compute(x, partial(_square, x, calls))
+    sizes = {path.stem: path.stat().st_size for path in tmp_path.glob("*.pkl")}
+    for age, key in enumerate(ArtifactCache.make_key(_square, x) for x in range(3)):
+        os.utime(tmp_path / f"{key}.pkl", (1_000 + age, 1_000 + age))
+
+    ArtifactCache(max_size_bytes=sum(sizes.values()) - 1).evict()
+
+    remaining = {path.stem for path in tmp_path.glob("*.pkl")}
+    assert ArtifactCache.make_key(_square, 0) not in remaining
+    assert len(remaining) == 2
+    assert {path.name.split(".")[0] for path in tmp_path.glob("*.json")} == remaining
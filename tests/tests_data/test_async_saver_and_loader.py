@@ -0,0 +1,154 @@
+"""
+Tests for AsyncSaverAndLoader: round trips, bounded concurrency and a responsive event loop.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from src.data import saver_and_loader as saver_and_loader_module
+from src.data.async_saver_and_loader import AsyncSaverAndLoader
+from src.data.saver_and_loader import FileResult, SaverAndLoader
+from src.exceptions.data_exception import FileNotFound
+from src.exceptions.development_exception import NotValidOperation
+
+
+def _patch_get_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Redirects the module-level get_path helper to resolve inside tmp_path.
+    :param monkeypatch: pytest.MonkeyPatch. Used to patch the module-level function.
+    :param tmp_path: Path. Pytest-provided temporary directory to resolve paths against.
+    """
+
+    def _fake_get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:  # noqa: ARG001
+        return str(tmp_path / (file_name + extension))
+
+    monkeypatch.setattr(saver_and_loader_module, "get_path", _fake_get_path)
+
+
+def test_round_trip_and_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that awaited saves and loads behave like the blocking ones, including their exceptions.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]})
+
+    async def _main() -> DataFrame:
+        async with AsyncSaverAndLoader(max_concurrency=2) as saver_and_loader:
+            await saver_and_loader.save_dataframe_to_parquet(df, "data", compression="zstd")
+            with pytest.raises(FileNotFound):
+                await saver_and_loader.load_dataframe_from_pickle("missing")
+            return await saver_and_loader.load_dataframe_from_parquet("data", columns=["b"])
+
+    assert_frame_equal(asyncio.run(_main()), df[["b"]])
+
+
+def test_slow_loads_are_bounded_and_do_not_block_the_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that at most max_concurrency loads run at once while a heartbeat coroutine keeps ticking.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _slow_load(file_name: str, where: str = "raw_data") -> str:  # noqa: ARG001
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.1)
+        with lock:
+            running -= 1
+        return file_name
+
+    monkeypatch.setattr(SaverAndLoader, "load_from_pickle", staticmethod(_slow_load))
+
+    async def _main() -> tuple[list[Any], int]:
+        ticks = 0
+
+        async def _heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        heartbeat = asyncio.create_task(_heartbeat())
+        async with AsyncSaverAndLoader(max_concurrency=2) as saver_and_loader:
+            loaded = await asyncio.gather(*(saver_and_loader.load_from_pickle(f"file_{i}") for i in range(4)))
+        heartbeat.cancel()
+        return loaded, ticks
+
+    loaded, ticks = asyncio.run(_main())
+
+    assert loaded == [f"file_{i}" for i in range(4)]
+    assert peak == 2
+    assert ticks >= 10
+
+
+def test_load_many_is_collected_off_the_loop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the lazy results of load_many are collected on the pool with max_concurrency workers, and that run
+    refuses a method returning an iterator.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = DataFrame({"a": [1, 2, 3]})
+    SaverAndLoader.save_dataframe_to_pickle(df, "present")
+    pool_sizes: list[int | None] = []
+    run_many = SaverAndLoader._run_many
+
+    def _recording_run_many(self: SaverAndLoader, *args: Any) -> Any:
+        pool_sizes.append(args[4])
+        return run_many(self, *args)
+
+    monkeypatch.setattr(SaverAndLoader, "_run_many", _recording_run_many)
+
+    async def _main() -> list[FileResult]:
+        async with AsyncSaverAndLoader(max_concurrency=3) as saver_and_loader:
+            results = await saver_and_loader.load_many(["present", "missing"])
+            with pytest.raises(NotValidOperation):
+                await saver_and_loader.run("load_many", ["present"], method="load_from_pickle")
+        return results
+
+    results = asyncio.run(_main())
+
+    assert [result.file_name for result in results] == ["present", "missing"]
+    assert_frame_equal(results[0].data, df)
+    assert isinstance(results[1].error, FileNotFound)
+    assert pool_sizes == [3, None]
+
+
+def test_csv_chunks_are_read_one_at_a_time(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the async chunked csv iteration yields the chunks of the blocking one, reading no chunk ahead.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    (tmp_path / "data.csv").write_text("a\n" + "".join(f"{i}\n" for i in range(5)), encoding="utf8")
+    produced: list[int] = []
+    iter_chunks = SaverAndLoader.iter_dataframe_chunks_from_csv
+
+    def _recording_iter_chunks(self: SaverAndLoader, *args: Any, **kwargs: Any) -> Iterator[DataFrame]:
+        for chunk in iter_chunks(self, *args, **kwargs):
+            produced.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(SaverAndLoader, "iter_dataframe_chunks_from_csv", _recording_iter_chunks)
+
+    async def _main() -> list[int]:
+        consumed: list[int] = []
+        async with AsyncSaverAndLoader() as saver_and_loader:
+            async for chunk in saver_and_loader.iter_dataframe_chunks_from_csv("data", chunk_rows=2):
+                consumed.append(len(chunk))
+                if len(consumed) == 2:
+                    break
+        return consumed
+
+    assert asyncio.run(_main()) == [2, 2]
+    assert produced == [2, 2]
@@ -0,0 +1,113 @@
+"""
+Tests for DatasetCatalog and its upkeep by SaverAndLoader saves and deletes.
+"""
+
+from pathlib import Path
+
+import pytest
+from numpy import arange
+from pandas import DataFrame
+
+from src.data import saver_and_loader as saver_and_loader_module
+from src.data.catalog import CATALOG_FILE_NAME, DatasetCatalog, describe
+from src.data.saver_and_loader import SaverAndLoader, file_checksum
+
+
+def _patch_get_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Redirects the module-level get_path helper to resolve inside tmp_path.
+    :param monkeypatch: pytest.MonkeyPatch. Used to patch the module-level function.
+    :param tmp_path: Path. Pytest-provided temporary directory to resolve paths against.
+    """
+
+    def _fake_get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:  # noqa: ARG001
+        return str(tmp_path / (file_name + extension))
+
+    monkeypatch.setattr(saver_and_loader_module, "get_path", _fake_get_path)
+
+
+def test_saves_are_recorded_only_with_a_catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a location without a catalog is left alone and that, once created, saves record full metadata.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = DataFrame({"a": arange(5), "b": arange(5) * 0.5})
+    SaverAndLoader.save_dataframe_to_pickle(df, "before")
+    assert not (tmp_path / CATALOG_FILE_NAME).exists()
+
+    catalog = SaverAndLoader.get_catalog()
+    SaverAndLoader.save_dataframe_to_parquet(df, "frame")
+    SaverAndLoader.save_array(arange(7, dtype="int32"), "array", manifest=True)
+
+    entry = catalog.get("frame.parquet")
+    assert entry is not None
+    assert (entry.n_rows, entry.columns, entry.dtypes) == (5, ["a", "b"], ["int64", "float64"])
+    assert entry.size == (tmp_path / "frame.parquet").stat().st_size
+    assert entry.sha256 == file_checksum(tmp_path / "frame.parquet")
+    assert [entry.file for entry in catalog.list_entries()] == ["array.npy", "frame.parquet"]
+    assert catalog.get("before.pkl") is None
+
+
+def test_saves_are_hashed_while_written(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that every writer records the checksum of the saved file without reading the file back.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    catalog = SaverAndLoader.get_catalog()
+    df = DataFrame({"a": arange(50), "b": arange(50) * 0.5})
+    saver_and_loader = SaverAndLoader()
+    checksum = saver_and_loader_module.file_checksum
+
+    def _no_read_back(path: Path) -> str:
+        raise AssertionError(f"{path} was read back.")
+
+    monkeypatch.setattr(saver_and_loader_module, "file_checksum", _no_read_back)
+    saver_and_loader.save_dataframe_to_csv(df, "frame", compression="gzip")
+    saver_and_loader.save_dataframe_to_csv(df, "plain")
+    saver_and_loader.convert_csv_to_columnar("plain", columnar_format="feather", chunk_rows=20)
+    saver_and_loader.convert_csv_to_columnar("frame", columnar_format="parquet", chunk_rows=20)
+    SaverAndLoader.save_dataframe_to_pickle(df, "frame", compression="xz", manifest=True)
+    SaverAndLoader.save_dataframe_to_parquet(df, "frame")
+    SaverAndLoader.save_dataframe_to_feather(df, "frame")
+    SaverAndLoader.save_array(arange(7), "array")
+    for compression in (None, "zstd", "lz4", "bz2"):
+        SaverAndLoader.save_to_pickle({"a": [1, 2]}, f"data_{compression}", compression=compression)
+    SaverAndLoader.save_config_data(describe(1), "config")
+    monkeypatch.setattr(saver_and_loader_module, "file_checksum", checksum)
+
+    for entry in catalog.list_entries():
+        assert entry.sha256 == file_checksum(tmp_path / entry.file), entry.file
+    assert len(catalog.list_entries()) == 12
+    SaverAndLoader.verify_file("frame", extension=".pkl.xz")
+
+
+def test_deletes_remove_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that delete_pickle and delete_file keep the catalog in sync.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    catalog = SaverAndLoader.get_catalog()
+    SaverAndLoader.save_to_pickle({"a": 1}, "data", compression="zstd")
+    SaverAndLoader.save_config_data(describe(1), "config")
+    assert [entry.file for entry in catalog.list_entries()] == ["config.json", "data.pkl.zst"]
+
+    SaverAndLoader.delete_pickle("data")
+    SaverAndLoader.delete_file("config.json")
+
+    assert catalog.list_entries() == []
+
+
+def test_find_smallest(tmp_path: Path) -> None:
+    """
+    Tests that find_smallest picks the smallest file satisfying the column and row requirements.
+    """
+    catalog = DatasetCatalog(tmp_path)
+    catalog.record("full.parquet", 9_000, "a", *describe(DataFrame({"a": range(100), "b": range(100)})))
+    catalog.record("sample.parquet", 900, "b", *describe(DataFrame({"a": range(10), "b": range(10)})))
+    catalog.record("narrow.parquet", 500, "c", *describe(DataFrame({"a": range(100)})))
+
+    assert catalog.find_smallest(columns=["a"]).file == "narrow.parquet"  # type: ignore[union-attr]
+    assert catalog.find_smallest(columns=["a", "b"]).file == "sample.parquet"  # type: ignore[union-attr]
+    assert catalog.find_smallest(columns=["a", "b"], min_rows=50).file == "full.parquet"  # type: ignore[union-attr]
+    assert catalog.find_smallest(columns=["c"]) is None
+    assert catalog.find_smallest(pattern="s*") == catalog.get("sample.parquet")
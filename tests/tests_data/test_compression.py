@@ -0,0 +1,89 @@
+"""
+Tests for the compression codec registry.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data.compression import CODECS, compression_extension, detect_compression, open_compressed
+from src.exceptions.development_exception import NoProperOptionInIf
+
+_PAYLOAD = b"date,value\n2026/10/12 00:00:00,1.5\n" * 1_000
+
+
+@pytest.mark.parametrize("compression", list(CODECS))
+def test_round_trip_and_detection(tmp_path: Path, compression: str) -> None:
+    """
+    Tests that every codec compresses, is recognised by its extension and its magic bytes, and decompresses.
+    """
+    path = tmp_path / f"data.csv{compression_extension(compression)}"
+    with open_compressed(path, "wb", compression) as handle:
+        handle.write(_PAYLOAD)
+    renamed = path.rename(tmp_path / "renamed.csv")
+
+    assert renamed.stat().st_size < len(_PAYLOAD)
+    assert detect_compression(path) == compression
+    assert detect_compression(renamed) == compression
+    with open_compressed(renamed, "rb", compression) as handle:
+        assert handle.read() == _PAYLOAD
+
+
+@pytest.mark.parametrize("compression", [*CODECS, None])
+def test_open_file_is_wrapped(tmp_path: Path, compression: str | None) -> None:
+    """
+    Tests that a codec writes through an already open file and leaves it open.
+    """
+    path = tmp_path / "data.csv"
+    with path.open("wb") as outfile:
+        with open_compressed(outfile, "wb", compression) as handle:
+            handle.write(_PAYLOAD)
+        assert compression is None or not outfile.closed
+
+    with open_compressed(path, "rb", compression) as handle:
+        assert handle.read() == _PAYLOAD
+
+
+def test_uncompressed_file_is_not_detected(tmp_path: Path) -> None:
+    """
+    Tests that a plain file is read as it is.
+    """
+    path = tmp_path / "data.csv"
+    path.write_bytes(_PAYLOAD)
+
+    assert detect_compression(path) is None
+    with open_compressed(path, "rb", None) as handle:
+        assert handle.read() == _PAYLOAD
+
+
+def test_text_starting_like_bz2_is_not_detected(tmp_path: Path) -> None:
+    """
+    Tests that a plain csv whose header starts with "BZh", but not with the block size digit, is not taken for bz2.
+    """
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"BZh_column,value\n1,2\n")
+
+    assert detect_compression(path) is None
+
+
+def test_level_trades_size(tmp_path: Path) -> None:
+    """
+    Tests that the level reaches the codec.
+    """
+    payload = bytes(range(256)) * 64 + _PAYLOAD
+    sizes = []
+    for level in (1, 19):
+        path = tmp_path / f"data_{level}.zst"
+        with open_compressed(path, "wb", "zstd", level) as handle:
+            handle.write(payload)
+        sizes.append(path.stat().st_size)
+
+    assert sizes[1] < sizes[0]
+
+
+def test_unknown_codec_raises() -> None:
+    """
+    Tests that an unknown codec name is rejected.
+    """
+    with pytest.raises(NoProperOptionInIf):
+        compression_extension("rar")
@@ -0,0 +1,130 @@
+"""
+Tests for PartitionedDataset: layout, incremental appends and partition pruning.
+"""
+
+from pathlib import Path
+
+import pytest
+from numpy import arange
+from pandas import DataFrame, concat, date_range
+from pandas.testing import assert_frame_equal
+
+from src.data import saver_and_loader as saver_and_loader_module
+from src.data.partitioned_dataset import PartitionedDataset
+from src.data.saver_and_loader import SaverAndLoader
+from src.exceptions.data_exception import IncorrectDataStructure, NoData
+
+
+def _patch_get_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Redirects the module-level get_path helper to resolve inside tmp_path.
+    :param monkeypatch: pytest.MonkeyPatch. Used to patch the module-level function.
+    :param tmp_path: Path. Pytest-provided temporary directory to resolve paths against.
+    """
+
+    def _fake_get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:  # noqa: ARG001
+        return str(tmp_path / (file_name + extension))
+
+    monkeypatch.setattr(saver_and_loader_module, "get_path", _fake_get_path)
+
+
+def _generate_dataframe(start: str, periods: int) -> DataFrame:
+    """
+    Generates a daily DataFrame with DatetimeIndex named date.
+    """
+    index = date_range(start, periods=periods, freq="D", name="date")
+    return DataFrame({"value": arange(periods, dtype="int64"), "other": arange(periods) * 0.5}, index=index)
+
+
+def test_append_writes_monthly_partitions(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests the Hive-style layout and that appending adds part files without touching the existing ones.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    dataset = PartitionedDataset("prices")
+
+    dataset.append(_generate_dataframe("2026-01-20", 20))
+    first_part = tmp_path / "prices" / "year=2026" / "month=01" / "part-00000.parquet"
+    first_mtime = first_part.stat().st_mtime_ns
+    written = dataset.append(_generate_dataframe("2026-02-10", 30))
+
+    assert dataset.partitions() == [(2026, 1), (2026, 2), (2026, 3)]
+    assert written == [
+        "prices/year=2026/month=02/part-00001",
+        "prices/year=2026/month=03/part-00000",
+    ]
+    assert first_part.stat().st_mtime_ns == first_mtime
+
+
+def test_append_after_deleted_part_does_not_overwrite(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a gap in the part numbering does not make an append overwrite an existing part.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    dataset = PartitionedDataset("prices")
+    dataset.append(_generate_dataframe("2026-01-01", 5))
+    second = _generate_dataframe("2026-01-10", 5)
+    dataset.append(second)
+    (tmp_path / "prices" / "year=2026" / "month=01" / "part-00000.parquet").unlink()
+    third = _generate_dataframe("2026-01-20", 5)
+
+    assert dataset.append(third) == ["prices/year=2026/month=01/part-00002"]
+    assert_frame_equal(dataset.read(), concat([second, third]), check_freq=False)
+
+
+def test_read_prunes_partitions_and_filters_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a range read opens only the overlapping partitions and returns exactly the rows in [start, end).
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe("2026-01-01", 120)
+    dataset = PartitionedDataset("prices")
+    dataset.append(df)
+    loaded_names = []
+    load = SaverAndLoader.load_dataframe_from_parquet
+
+    def _recording_load(file_name: str, *args: object, **kwargs: object) -> DataFrame:
+        loaded_names.append(file_name)
+        return load(file_name, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(SaverAndLoader, "load_dataframe_from_parquet", staticmethod(_recording_load))
+
+    result = dataset.read(start="2026-02-10", end="2026-03-01", columns=["value"])
+
+    assert loaded_names == ["prices/year=2026/month=02/part-00000"]
+    assert_frame_equal(result, df.loc["2026-02-10":"2026-02-28", ["value"]], check_freq=False)
+
+
+def test_read_whole_dataset(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an unbounded read returns all appended rows in time order.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    dataset = PartitionedDataset("prices", compression="zstd")
+    df = _generate_dataframe("2025-12-01", 70)
+    dataset.append(df.iloc[35:])
+    dataset.append(df.iloc[:35])
+
+    assert_frame_equal(dataset.read(), df, check_freq=False)
+
+
+def test_read_without_partitions_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a range without any partition raises NoData.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    dataset = PartitionedDataset("prices")
+    dataset.append(_generate_dataframe("2026-01-01", 10))
+
+    with pytest.raises(NoData):
+        dataset.read(start="2027-01-01")
+
+
+def test_append_requires_datetime_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a DataFrame without DatetimeIndex is rejected.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+
+    with pytest.raises(IncorrectDataStructure):
+        PartitionedDataset("prices").append(DataFrame({"value": [1, 2]}))
@@ -1,18 +1,26 @@
 """
-Tests for the config-snapshot round-trip in SaverAndLoader.
+Tests for SaverAndLoader: the config-snapshot round-trip and the pickle, csv, columnar and array stores.
 """
 
 import ast
 import inspect
 import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import NamedTuple
 
 import pytest
+from numpy import arange, array_equal, memmap, uint8, zeros
+from numpy import array as numpy_array
+from pandas import DataFrame, concat, date_range
+from pandas.testing import assert_frame_equal
+from pyarrow import default_memory_pool, proxy_memory_pool, set_memory_pool
+from pyarrow.parquet import ParquetFile
 
 from src.data import saver_and_loader as saver_and_loader_module
 from src.data.saver_and_loader import SaverAndLoader
 from src.exceptions.data_exception import FileNotFound, IncorrectDataStructure
+from src.exceptions.development_exception import NoProperOptionInIf
 
 
 class _FixtureConfigData(NamedTuple):
@@ -158,3 +166,396 @@ def test_saver_and_loader_module_imports_no_pyhocon() -> None:
             imported_modules.extend(alias.name for alias in node.names)
 
     assert not any("pyhocon" in module.lower() for module in imported_modules)
+
+
+def _generate_dataframe() -> DataFrame:
+    """
+    Generates a small time-indexed DataFrame used by the columnar round-trip tests.
+    :return: DataFrame.
+    """
+    return DataFrame(
+        {"col_a": range(10), "col_b": [float(i) / 2 for i in range(10)], "col_c": list("abcdefghij")},
+        index=date_range("2020-01-01", periods=10, freq="D", name="date"),
+    )
+
+
+def test_parquet_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a DataFrame saved to parquet loads back equal, including its index.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe()
+
+    SaverAndLoader.save_dataframe_to_parquet(df, "data", row_group_size=3)
+    result = SaverAndLoader.load_dataframe_from_parquet("data")
+
+    assert (tmp_path / "data.parquet").exists()
+    assert_frame_equal(result, df, check_freq=False)
+
+
+def test_parquet_column_and_row_projection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that load_dataframe_from_parquet returns only the requested columns and the rows matching the filters.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe()
+    SaverAndLoader.save_dataframe_to_parquet(df, "data", row_group_size=3)
+
+    result = SaverAndLoader.load_dataframe_from_parquet("data", columns=["col_b"], filters=[("col_a", ">=", 7)])
+
+    assert_frame_equal(result, df.loc[df["col_a"] >= 7, ["col_b"]], check_freq=False)
+
+
+def test_feather_round_trip_with_projection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a DataFrame saved to feather loads back equal, and that a projected load keeps the index.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe()
+
+    SaverAndLoader.save_dataframe_to_feather(df, "data")
+    full = SaverAndLoader.load_dataframe_from_feather("data")
+    projected = SaverAndLoader.load_dataframe_from_feather(
+        "data", columns=["col_c"], filters=[[("col_a", "<", 2)], [("col_a", ">", 8)]]
+    )
+
+    assert_frame_equal(full, df, check_freq=False)
+    assert_frame_equal(projected, df.loc[(df["col_a"] < 2) | (df["col_a"] > 8), ["col_c"]], check_freq=False)
+
+
+def test_feather_projection_does_not_decode_other_columns(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a projected load of a compressed feather file allocates nothing for the columns not asked for: the
+    8 MB column compressed to a few bytes would need 8 MB of Arrow memory to be decompressed.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    n_rows = 1_000_000
+    df = DataFrame({"small": arange(n_rows, dtype=uint8), "big": zeros(n_rows)})
+    SaverAndLoader.save_dataframe_to_feather(df, "data", compression="zstd")
+
+    default_pool = default_memory_pool()
+    pool = proxy_memory_pool(default_pool)
+    set_memory_pool(pool)
+    try:
+        projected = SaverAndLoader.load_dataframe_from_feather("data", columns=["small"], filters=[("small", "<", 9)])
+        columns, small = list(projected.columns), projected["small"].to_numpy(copy=True)
+        del projected  # its buffers are allocated from the proxy pool, so they are freed before it
+    finally:
+        set_memory_pool(default_pool)
+
+    assert columns == ["small"]
+    assert array_equal(small, df.loc[df["small"] < 9, "small"])
+    assert pool.max_memory() < df["big"].nbytes
+
+
+def test_load_dataframe_from_parquet_missing_file_raises_file_not_found(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that loading a missing parquet file raises FileNotFound naming the resolved path.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+
+    with pytest.raises(FileNotFound) as exc_info:
+        SaverAndLoader.load_dataframe_from_parquet("does_not_exist")
+
+    assert str(tmp_path / "does_not_exist.parquet") in exc_info.value.get_description()
+
+
+def _write_csv(tmp_path: Path, n_rows: int) -> Path:
+    """
+    Writes a csv file with an integer, a float and a date time column into tmp_path.
+    :param tmp_path: Path. Directory to write the data.csv file into.
+    :param n_rows: int. Number of data rows.
+    :return: Path. Path of the written file.
+    """
+    csv_path = tmp_path / "data.csv"
+    lines = ["col_a,col_b,col_date"] + [f"{i},{i / 4},2020/01/{1 + i % 28:02d} 10:00:00" for i in range(n_rows)]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf8")
+    return csv_path
+
+
+def test_iter_dataframe_chunks_from_csv_yields_typed_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the csv file is read in chunks of at most chunk_rows rows, with the requested types, and that the
+    chunks together equal the whole file.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    _write_csv(tmp_path, 25)
+    saver_and_loader = SaverAndLoader()
+
+    chunks = list(
+        saver_and_loader.iter_dataframe_chunks_from_csv(
+            "data", chunk_rows=10, dtype={"col_a": "int32"}, parse_dates=["col_date"]
+        )
+    )
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert all(chunk["col_a"].dtype == "int32" for chunk in chunks)
+    assert all(chunk["col_date"].dtype.kind == "M" for chunk in chunks)
+    whole = concat(chunks, ignore_index=True)
+    assert whole["col_a"].tolist() == list(range(25))
+    assert whole["col_b"].tolist() == [i / 4 for i in range(25)]
+
+
+def test_iter_dataframe_chunks_from_csv_missing_file_raises_before_iteration(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that a missing csv file is reported when the iterator is requested, not lazily on the first chunk.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+
+    with pytest.raises(FileNotFound):
+        SaverAndLoader().iter_dataframe_chunks_from_csv("does_not_exist")
+
+
+@pytest.mark.parametrize("columnar_format", ["parquet", "feather"])
+def test_convert_csv_to_columnar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, columnar_format: str) -> None:
+    """
+    Tests that the chunked csv conversion writes a columnar file with all rows, loadable by the columnar loaders.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    _write_csv(tmp_path, 25)
+    saver_and_loader = SaverAndLoader()
+
+    n_rows = saver_and_loader.convert_csv_to_columnar(
+        "data", columnar_format=columnar_format, chunk_rows=10, parse_dates=["col_date"]
+    )
+
+    if columnar_format == "parquet":
+        result = saver_and_loader.load_dataframe_from_parquet("data")
+        assert ParquetFile(tmp_path / "data.parquet").metadata.num_row_groups == 3
+    else:
+        result = saver_and_loader.load_dataframe_from_feather("data")
+    assert n_rows == 25
+    assert list(result.columns) == ["col_a", "col_b", "col_date"]
+    assert result["col_a"].tolist() == list(range(25))
+
+
+def test_convert_csv_to_columnar_unknown_format_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an unknown columnar format is rejected before anything is read or written.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    _write_csv(tmp_path, 5)
+
+    with pytest.raises(NoProperOptionInIf):
+        SaverAndLoader().convert_csv_to_columnar("data", columnar_format="orc")
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_array_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mmap: bool) -> None:
+    """
+    Tests that an array saved by save_array loads back equal, memory-mapped read-only or as a private copy.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    array = arange(24, dtype=uint8).reshape(6, 4)
+
+    SaverAndLoader.save_array(array, "matrix")
+    result = SaverAndLoader.load_array("matrix", mmap=mmap)
+
+    assert (tmp_path / "matrix.npy").exists()
+    assert array_equal(result, array)
+    assert result.dtype == uint8
+    assert isinstance(result, memmap) is mmap
+    assert result.flags.writeable is not mmap
+
+
+def test_save_array_object_dtype_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an object array, which would need pickling, is rejected instead of being saved.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+
+    with pytest.raises(IncorrectDataStructure):
+        SaverAndLoader.save_array(numpy_array([{"a": 1}], dtype=object), "matrix")
+
+    assert not (tmp_path / "matrix.npy").exists()
+
+
+def test_failed_save_keeps_previous_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a save failing mid-write leaves the previous file intact and no temporary file behind.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    SaverAndLoader.save_to_pickle({"a": 1}, "data")
+
+    with pytest.raises(AttributeError):
+        SaverAndLoader.save_to_pickle({"a": lambda: 1}, "data")
+
+    assert SaverAndLoader.load_from_pickle("data") == {"a": 1}
+    assert [path.name for path in tmp_path.iterdir()] == ["data.pkl"]
+
+
+@pytest.mark.parametrize("extension", [".pkl", ".csv", ".parquet", ".feather", ".npy", ".json"])
+def test_save_with_manifest_is_verified(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, extension: str) -> None:
+    """
+    Tests that every save path writes a manifest matching the file when asked to.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe()
+    saver_and_loader = SaverAndLoader()
+    saves: dict[str, Callable[[], None]] = {
+        ".pkl": lambda: saver_and_loader.save_dataframe_to_pickle(df, "data", manifest=True),
+        ".csv": lambda: saver_and_loader.save_dataframe_to_csv(df, "data", manifest=True),
+        ".parquet": lambda: saver_and_loader.save_dataframe_to_parquet(df, "data", manifest=True),
+        ".feather": lambda: saver_and_loader.save_dataframe_to_feather(df, "data", manifest=True),
+        ".npy": lambda: saver_and_loader.save_array(arange(10), "data", manifest=True),
+        ".json": lambda: saver_and_loader.save_config_data(_FixtureConfigData("a", 1, []), "data", manifest=True),
+    }
+    saves[extension]()
+
+    manifest = json.loads((tmp_path / f"data{extension}.manifest.json").read_text(encoding="utf8"))
+    assert manifest["size"] == (tmp_path / f"data{extension}").stat().st_size
+    SaverAndLoader.verify_file("data", extension=extension)
+
+
+def test_load_rejects_file_not_matching_manifest_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a truncated file is rejected by its manifest even when it is above min_size.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    SaverAndLoader.save_dataframe_to_pickle(_generate_dataframe(), "data", manifest=True)
+    pkl_path = tmp_path / "data.pkl"
+    pkl_path.write_bytes(pkl_path.read_bytes()[:-10])
+
+    with pytest.raises(IncorrectDataStructure) as exc_info:
+        SaverAndLoader.load_dataframe_from_pickle("data")
+
+    assert "manifest" in exc_info.value.get_description()
+
+
+def test_verify_file_detects_same_size_corruption(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that verify_file catches a changed byte which the size check alone can not see.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    SaverAndLoader.save_array(arange(10), "data", manifest=True)
+    npy_path = tmp_path / "data.npy"
+    content = bytearray(npy_path.read_bytes())
+    content[-1] ^= 0xFF
+    npy_path.write_bytes(bytes(content))
+
+    SaverAndLoader.load_array("data")
+    with pytest.raises(IncorrectDataStructure):
+        SaverAndLoader.verify_file("data", extension=".npy")
+
+
+def test_save_without_manifest_removes_stale_manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that overwriting a file without a manifest drops the old manifest instead of leaving a false mismatch.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    SaverAndLoader.save_to_pickle([1, 2, 3], "data", manifest=True)
+    SaverAndLoader.save_to_pickle(list(range(100)), "data")
+
+    assert not (tmp_path / "data.pkl.manifest.json").exists()
+    assert SaverAndLoader.load_from_pickle("data") == list(range(100))
+    with pytest.raises(FileNotFound):
+        SaverAndLoader.verify_file("data")
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd", "gzip"])
+def test_compressed_pickle_and_csv_round_trip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, compression: str
+) -> None:
+    """
+    Tests that compressed pickle and csv files get the codec suffix and load without naming the codec.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe().reset_index(drop=True)
+    saver_and_loader = SaverAndLoader()
+
+    saver_and_loader.save_dataframe_to_pickle(df, "frame", compression=compression, manifest=True)
+    saver_and_loader.save_to_pickle({"a": [1, 2]}, "data", compression=compression)
+    saver_and_loader.save_dataframe_to_csv(df, "frame", compression=compression)
+
+    suffix = {"lz4": ".lz4", "zstd": ".zst", "gzip": ".gz"}[compression]
+    assert sorted(path.name for path in tmp_path.iterdir() if not path.name.endswith(".json")) == [
+        f"data.pkl{suffix}",
+        f"frame.csv{suffix}",
+        f"frame.pkl{suffix}",
+    ]
+    assert_frame_equal(saver_and_loader.load_dataframe_from_pickle("frame"), df)
+    assert saver_and_loader.load_from_pickle("data") == {"a": [1, 2]}
+    assert_frame_equal(saver_and_loader.load_dataframe_from_csv("frame"), df)
+    assert_frame_equal(concat(saver_and_loader.iter_dataframe_chunks_from_csv("frame", chunk_rows=3)), df)
+
+    saver_and_loader.delete_pickle("data")
+    assert not saver_and_loader.is_file("data", extension=f".pkl{suffix}")
+
+
+def test_compressed_file_under_plain_name_is_detected(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the codec is detected from the header when the file does not carry its suffix.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    SaverAndLoader.save_to_pickle(list(range(10)), "data", compression="zstd")
+    (tmp_path / "data.pkl.zst").rename(tmp_path / "data.pkl")
+
+    assert SaverAndLoader.load_from_pickle("data") == list(range(10))
+
+
+@pytest.mark.parametrize("columnar_format", ["parquet", "feather"])
+def test_columnar_native_compression(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, columnar_format: str) -> None:
+    """
+    Tests that parquet and feather files are written with the requested native codec and load transparently.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe()
+    if columnar_format == "parquet":
+        SaverAndLoader.save_dataframe_to_parquet(df, "data", compression="zstd", compression_level=5)
+        assert ParquetFile(tmp_path / "data.parquet").metadata.row_group(0).column(0).compression == "ZSTD"
+        loaded = SaverAndLoader.load_dataframe_from_parquet("data")
+    else:
+        SaverAndLoader.save_dataframe_to_feather(df, "data", compression="zstd", compression_level=5)
+        loaded = SaverAndLoader.load_dataframe_from_feather("data")
+
+    assert_frame_equal(loaded, df, check_freq=False)
+
+
+def test_load_many_reports_errors_per_file_in_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that load_many keeps the input order and reports a missing and a corrupt file without aborting.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = _generate_dataframe()
+    SaverAndLoader().save_many({"first": df, "second": df.iloc[:3]}, method="save_dataframe_to_pickle")
+    (tmp_path / "corrupt.pkl").write_bytes(b"\x80\x05not a pickle")
+
+    results = list(SaverAndLoader().load_many(["second", "missing", "corrupt", "first"], max_workers=2))
+
+    assert [result.file_name for result in results] == ["second", "missing", "corrupt", "first"]
+    assert_frame_equal(results[0].data, df.iloc[:3])
+    assert isinstance(results[1].error, FileNotFound)
+    assert isinstance(results[2].error, IncorrectDataStructure)
+    assert_frame_equal(results[3].data, df)
+    assert results[3].error is None
+
+
+def test_load_many_as_completed_with_processes(tmp_path: Path) -> None:
+    """
+    Tests the process executor and the completion order mode. Absolute file names make get_path resolve inside
+    tmp_path in the worker processes too.
+    """
+    arrays = {str(tmp_path / f"array_{i}"): arange(i + 1) for i in range(4)}
+    saver_and_loader = SaverAndLoader()
+    assert all(result.error is None for result in saver_and_loader.save_many(arrays, "data", method="save_array"))
+
+    results = saver_and_loader.load_many(
+        list(arrays), "data", method="load_array", executor="process", max_workers=2, ordered=False, mmap=False
+    )
+
+    loaded = {result.file_name: result.data for result in results}
+    assert loaded.keys() == arrays.keys()
+    assert all(array_equal(loaded[name], array) for name, array in arrays.items())
+
+
+@pytest.mark.parametrize(("method", "executor"), [("save_to_pickle", "thread"), ("load_from_pickle", "fiber")])
+def test_load_many_rejects_unknown_options(method: str, executor: str) -> None:
+    """
+    Tests that a non-load method or an unknown executor is rejected before anything is submitted.
+    """
+    with pytest.raises(NoProperOptionInIf):
+        SaverAndLoader().load_many(["data"], method=method, executor=executor)
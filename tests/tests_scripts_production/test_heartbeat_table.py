@@ -0,0 +1,143 @@
+"""
+Tests for the shared-memory heartbeat table: slots written by other processes, ages read in one scan, and the
+watcher built on it.
+"""
+
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from src.scripts_production.heartbeat_table import HeartbeatTable, SharedMemoryHeartbeatWatcher
+
+
+@pytest.fixture
+def table() -> Iterator[HeartbeatTable]:
+    """Heartbeat table of three slots, freed after the test."""
+    heartbeat_table = HeartbeatTable.create(3)
+    yield heartbeat_table
+    heartbeat_table.close()
+
+
+# ---------------------------------------------------------------------------
+# HeartbeatTable
+# ---------------------------------------------------------------------------
+class TestHeartbeatTable:
+    """Tests for HeartbeatTable."""
+
+    def test_new_slots_are_infinitely_old(self, table: HeartbeatTable) -> None:
+        """Slots never written have an infinite age and no progress."""
+        assert len(table) == 3
+        assert list(table.ages()) == [float("inf")] * 3
+        assert table.progress(0) == 0
+
+    def test_beat_updates_only_its_slot(self, table: HeartbeatTable) -> None:
+        """A heartbeat makes its slot fresh and increments its progress."""
+        table.beat(1)
+        table.beat(1)
+        ages = table.ages()
+        assert ages[0] == float("inf")
+        assert 0.0 <= ages[1] < 1.0
+        assert table.progress(1) == 2
+
+    def test_beat_with_explicit_progress(self, table: HeartbeatTable) -> None:
+        """A worker can report its own progress."""
+        table.beat(2, progress=1234)
+        assert table.progress(2) == 1234
+
+    def test_reset_keeps_progress(self, table: HeartbeatTable) -> None:
+        """The restart reset makes the slot fresh without touching the progress."""
+        table.beat(0, progress=7)
+        table.reset(0)
+        assert table.progress(0) == 7
+        assert table.ages()[0] < 1.0
+
+    def test_attached_table_shares_the_slots(self, table: HeartbeatTable) -> None:
+        """A heartbeat written through an attached view is read by the owner."""
+        worker_view = HeartbeatTable.attach(table.name)
+        worker_view.beat(2)
+        worker_view.close()
+        assert table.progress(2) == 1
+        assert table.ages()[2] < 1.0
+
+    def test_heartbeat_from_another_process(self, table: HeartbeatTable) -> None:
+        """A worker process writes its slot with its own monotonic clock, comparable with the watchdog one."""
+        code = (
+            "import sys; from src.scripts_production.heartbeat_table import HeartbeatTable; "
+            f"table = HeartbeatTable.attach({table.name!r}); table.beat(1, progress=42); table.close()"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+        assert table.progress(1) == 42
+        assert 0.0 <= table.ages()[1] < 5.0
+
+    def test_attach_to_foreign_memory_raises(self) -> None:
+        """A shared memory block without the table header is rejected."""
+        memory = SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(ValueError, match="not a heartbeat table"):
+                HeartbeatTable.attach(memory.name)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_close_of_owner_frees_the_memory(self) -> None:
+        """After the owner closes the table, it cannot be attached any more."""
+        heartbeat_table = HeartbeatTable.create(1)
+        name = heartbeat_table.name
+        heartbeat_table.close()
+        with pytest.raises(FileNotFoundError):
+            HeartbeatTable.attach(name)
+
+
+# ---------------------------------------------------------------------------
+# SharedMemoryHeartbeatWatcher
+# ---------------------------------------------------------------------------
+class TestSharedMemoryHeartbeatWatcher:
+    """Tests for SharedMemoryHeartbeatWatcher."""
+
+    def test_ages_are_read_on_refresh(self, table: HeartbeatTable) -> None:
+        """The ages of all the workers come from the last scan."""
+        watcher = SharedMemoryHeartbeatWatcher(table, {"worker0": 0, "worker1": 1}, {"worker0": 5.0, "worker1": 5.0})
+        table.beat(1)
+        assert watcher.heartbeat_age_seconds("worker1") == float("inf")
+        watcher.refresh()
+        assert watcher.heartbeat_age_seconds("worker1") < 1.0
+        assert watcher.heartbeat_age_seconds("worker0") == float("inf")
+
+    def test_wait_returns_when_the_deadline_passes(self, table: HeartbeatTable) -> None:
+        """The wait ends when a fresh heartbeat gets older than its timeout."""
+        watcher = SharedMemoryHeartbeatWatcher(table, {"worker0": 0}, {"worker0": 0.3})
+        table.beat(0)
+        start = time.monotonic()
+        watcher.wait(10.0)
+        assert time.monotonic() - start < 2.0
+        assert watcher.heartbeat_age_seconds("worker0") > 0.3
+
+    def test_passed_deadline_does_not_shorten_the_wait(self, table: HeartbeatTable) -> None:
+        """A worker already older than its timeout does not end the wait early."""
+        watcher = SharedMemoryHeartbeatWatcher(table, {"worker0": 0}, {"worker0": 0.3})
+        start = time.monotonic()
+        watcher.wait(0.2)
+        assert time.monotonic() - start >= 0.15
+
+
+# ---------------------------------------------------------------------------
+# worker scripts
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("script", "script_args"),
+    [("run_cmd_status_print_01", ["--hello", "h", "--minute", "1"]), ("run_cmd_status_print_02", ["--pozdrav", "p"])],
+)
+@pytest.mark.parametrize("table_args", [["--heartbeat-table", "table"], ["--heartbeat-slot", "0"]])
+def test_worker_requires_table_and_slot_together(script: str, script_args: list[str], table_args: list[str]) -> None:
+    """A worker given only one of the heartbeat table arguments exits with a usage error."""
+    args = ["--worker-name", "w", "--heartbeat-file", "w.hb", "--heartbeat-folder", ".", "--delay", "1"]
+    args += ["--healthcheck-url-key", "k", *script_args, *table_args]
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", f"src.scripts_production.{script}", *args], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 2
+    assert "have to be given together" in result.stderr
@@ -0,0 +1,165 @@
+"""
+Tests for the heartbeat watchers of the watchdog: polling and inotify report the same heartbeat ages, and the inotify
+watcher wakes up when a heartbeat deadline passes.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.scripts_production.heartbeat_watcher import (
+    HEARTBEAT_SUFFIX,
+    InotifyHeartbeatWatcher,
+    PollingHeartbeatWatcher,
+    create_heartbeat_watcher,
+)
+
+linux_only = pytest.mark.skipif(sys.platform != "linux", reason="inotify is available on Linux only")
+
+
+def _touch(heartbeat_dir: Path, worker_name: str, age: float = 0.0) -> None:
+    """Touches the heartbeat file of a worker, backdated by age seconds."""
+    path = heartbeat_dir / f"{worker_name}{HEARTBEAT_SUFFIX}"
+    path.touch()
+    if age:
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+
+
+# ---------------------------------------------------------------------------
+# PollingHeartbeatWatcher
+# ---------------------------------------------------------------------------
+class TestPollingHeartbeatWatcher:
+    """Tests for PollingHeartbeatWatcher."""
+
+    def test_missing_heartbeat_is_infinitely_old(self, tmp_path: Path) -> None:
+        """A worker without a heartbeat file has an infinite age."""
+        assert PollingHeartbeatWatcher(tmp_path, {"worker1": 10.0}).heartbeat_age_seconds("worker1") == float("inf")
+
+    def test_age_follows_the_file(self, tmp_path: Path) -> None:
+        """The age is read from the file on every call."""
+        watcher = PollingHeartbeatWatcher(tmp_path, {"worker1": 10.0})
+        _touch(tmp_path, "worker1", age=100.0)
+        assert 99.0 < watcher.heartbeat_age_seconds("worker1") < 102.0
+
+
+# ---------------------------------------------------------------------------
+# InotifyHeartbeatWatcher
+# ---------------------------------------------------------------------------
+@linux_only
+class TestInotifyHeartbeatWatcher:
+    """Tests for InotifyHeartbeatWatcher."""
+
+    def test_initial_ages_match_polling(self, tmp_path: Path) -> None:
+        """Existing heartbeat files are read once on start."""
+        _touch(tmp_path, "worker1", age=100.0)
+        timeouts = {"worker1": 10.0, "worker2": 10.0}
+        watcher = InotifyHeartbeatWatcher(tmp_path, timeouts)
+        polling = PollingHeartbeatWatcher(tmp_path, timeouts)
+        try:
+            for name in timeouts:
+                assert watcher.heartbeat_age_seconds(name) == pytest.approx(polling.heartbeat_age_seconds(name), abs=1)
+        finally:
+            watcher.close()
+
+    def test_touch_updates_the_age_after_refresh(self, tmp_path: Path) -> None:
+        """A touch is seen after refresh, without reading the file on every age request."""
+        watcher = InotifyHeartbeatWatcher(tmp_path, {"worker1": 10.0})
+        try:
+            assert watcher.heartbeat_age_seconds("worker1") == float("inf")
+            _touch(tmp_path, "worker1")
+            watcher.refresh()
+            assert watcher.heartbeat_age_seconds("worker1") < 1.0
+        finally:
+            watcher.close()
+
+    def test_write_updates_the_age(self, tmp_path: Path) -> None:
+        """Writing the heartbeat file (IN_CLOSE_WRITE) counts as a heartbeat."""
+        _touch(tmp_path, "worker1", age=100.0)
+        watcher = InotifyHeartbeatWatcher(tmp_path, {"worker1": 10.0})
+        try:
+            (tmp_path / f"worker1{HEARTBEAT_SUFFIX}").write_text("alive")
+            watcher.refresh()
+            assert watcher.heartbeat_age_seconds("worker1") < 1.0
+        finally:
+            watcher.close()
+
+    def test_wait_returns_when_the_deadline_passes(self, tmp_path: Path) -> None:
+        """The wait ends when the heartbeat gets older than the timeout, long before max_seconds."""
+        _touch(tmp_path, "worker1")
+        watcher = InotifyHeartbeatWatcher(tmp_path, {"worker1": 0.3})
+        try:
+            start = time.monotonic()
+            watcher.wait(10.0)
+            assert time.monotonic() - start < 2.0
+            assert watcher.heartbeat_age_seconds("worker1") > 0.3
+        finally:
+            watcher.close()
+
+    def test_passed_deadline_is_reported_once(self, tmp_path: Path) -> None:
+        """A passed deadline does not end the next waits until the worker beats again."""
+        _touch(tmp_path, "worker1", age=100.0)
+        watcher = InotifyHeartbeatWatcher(tmp_path, {"worker1": 10.0})
+        try:
+            watcher.wait(10.0)
+            start = time.monotonic()
+            watcher.wait(0.2)
+            assert time.monotonic() - start >= 0.15
+        finally:
+            watcher.close()
+
+    def test_heartbeat_postpones_the_deadline(self, tmp_path: Path) -> None:
+        """A new heartbeat supersedes the previous deadline."""
+        _touch(tmp_path, "worker1")
+        watcher = InotifyHeartbeatWatcher(tmp_path, {"worker1": 0.5})
+        try:
+            time.sleep(0.3)
+            _touch(tmp_path, "worker1")
+            start = time.monotonic()
+            watcher.wait(10.0)
+            assert time.monotonic() - start > 0.35
+        finally:
+            watcher.close()
+
+    def test_other_files_are_ignored(self, tmp_path: Path) -> None:
+        """Files of unknown workers and other suffixes do not change the ages."""
+        watcher = InotifyHeartbeatWatcher(tmp_path, {"worker1": 10.0})
+        try:
+            _touch(tmp_path, "watchdog")
+            (tmp_path / "worker1.pid").write_text("1")
+            watcher.refresh()
+            assert watcher.heartbeat_age_seconds("worker1") == float("inf")
+        finally:
+            watcher.close()
+
+    def test_missing_directory_raises(self, tmp_path: Path) -> None:
+        """A directory that cannot be watched raises OSError."""
+        with pytest.raises(OSError, match="inotify_add_watch"):
+            InotifyHeartbeatWatcher(tmp_path / "missing", {"worker1": 10.0})
+
+
+# ---------------------------------------------------------------------------
+# create_heartbeat_watcher
+# ---------------------------------------------------------------------------
+class TestCreateHeartbeatWatcher:
+    """Tests for create_heartbeat_watcher."""
+
+    def test_polling_when_events_disabled(self, tmp_path: Path) -> None:
+        """use_events=False always polls."""
+        watcher = create_heartbeat_watcher(tmp_path, {"worker1": 10.0}, use_events=False)
+        assert type(watcher) is PollingHeartbeatWatcher
+
+    @linux_only
+    def test_inotify_on_linux(self, tmp_path: Path) -> None:
+        """Linux gets the inotify watcher."""
+        watcher = create_heartbeat_watcher(tmp_path, {"worker1": 10.0})
+        watcher.close()
+        assert isinstance(watcher, InotifyHeartbeatWatcher)
+
+    def test_falls_back_to_polling(self, tmp_path: Path) -> None:
+        """If inotify cannot watch the directory, the watcher polls."""
+        watcher = create_heartbeat_watcher(tmp_path / "missing", {"worker1": 10.0})
+        assert type(watcher) is PollingHeartbeatWatcher
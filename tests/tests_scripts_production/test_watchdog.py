@@ -3,14 +3,17 @@ Tests for the watchdog.py pure decision logic: restart backoff, crash-loop detec
 single-instance lock (ADR 0007).
 """
 
+import asyncio
 import json
 import os
+import sys
 import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
+from src.configurations.watchdog_config_data import SupervisionTimingData, WorkerData
 from src.scripts_production import watchdog
 from src.scripts_production.watchdog import (
     acquire_single_instance_lock,
@@ -21,8 +24,11 @@ from src.scripts_production.watchdog import (
     is_crash_loop,
     process_alive,
     resolve_ping_url,
+    stop_worker_async,
+    watchdog_async,
     write_pid,
 )
+from src.scripts_production.watchdog_metrics import WatchdogMetrics
 from src.utils.envs import Envs
 
 
@@ -329,6 +335,18 @@ class TestBuildCommand:
         )
         assert command[-1] == "key1"
 
+    def test_heartbeat_slot_is_passed_to_the_worker(self, tmp_path: Path) -> None:
+        """A shared-memory heartbeat slot adds --heartbeat-table/--heartbeat-slot before the worker args."""
+        command = build_command(
+            script="run_cmd_status_print_01.py",
+            worker_name="worker1",
+            args=["--delay", 1],
+            heartbeat_dir=tmp_path,
+            healthcheck_url_key="key1",
+            heartbeat_slot=("psm_table", 3),
+        )
+        assert command[-6:] == ["--heartbeat-table", "psm_table", "--heartbeat-slot", "3", "--delay", "1"]
+
     def test_script_outside_base_dir_raises_value_error(self, tmp_path: Path) -> None:
         """A script path that escapes BASE_DIR is rejected rather than launched."""
         with pytest.raises(ValueError, match="must be inside"):
@@ -350,3 +368,175 @@ class TestBuildCommand:
                 heartbeat_dir=tmp_path,
                 healthcheck_url_key="key1",
             )
+
+
+# ---------------------------------------------------------------------------
+# asyncio supervisor
+# ---------------------------------------------------------------------------
+SLEEPER = "import time; time.sleep(60)"
+TERM_IGNORING_SLEEPER = (
+    "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print('ready', flush=True); time.sleep(60)"
+)
+CRASHER = "import time; time.sleep(0.1)"
+
+
+async def _spawn(code: str) -> asyncio.subprocess.Process:
+    """Starts a python process running code, waiting for its 'ready' line if it prints one."""
+    process = await asyncio.create_subprocess_exec(sys.executable, "-c", code, stdout=asyncio.subprocess.PIPE)
+    if "ready" in code:
+        assert process.stdout is not None
+        await process.stdout.readline()
+    return process
+
+
+@pytest.fixture
+def async_supervisor(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Fresh supervisor state, fast timings, and workers running the python code of their args[0]."""
+    starts: list[str] = []
+
+    async def _start(config: WorkerData, _heartbeat_dir: Path) -> asyncio.subprocess.Process:
+        starts.append(config.name)
+        return await _spawn(config.args[0])
+
+    monkeypatch.setattr(watchdog, "start_worker_async", _start)
+    monkeypatch.setattr(watchdog, "ASYNC_PROCESSES", {})
+    monkeypatch.setattr(watchdog, "CONSECUTIVE_FAILURES", {})
+    monkeypatch.setattr(watchdog, "RESTART_TIMES", {})
+    monkeypatch.setattr(watchdog, "NEXT_RESTART_TIME", {})
+    monkeypatch.setattr(watchdog, "METRICS", WatchdogMetrics())
+    monkeypatch.setattr(
+        watchdog,
+        "SUPERVISION",
+        SupervisionTimingData(check_interval=30.0, startup_grace_period=0.0, stop_grace_period=0.5, backoff_base=0.01),
+    )
+    return starts
+
+
+async def _run_for(seconds: float, workers: list[WorkerData], heartbeat_dir: Path) -> None:
+    """Runs watchdog_async for the given time."""
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(seconds, stop.set)
+    await watchdog_async(workers, heartbeat_dir, stop=stop)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM handling of the test processes is POSIX only")
+class TestStopWorkerAsync:
+    """Tests for stop_worker_async."""
+
+    def test_graceful_stop(self, async_supervisor: list[str]) -> None:  # noqa: ARG002
+        """A worker honouring SIGTERM exits within the grace period."""
+
+        async def _main() -> int | None:
+            process = await _spawn(SLEEPER)
+            await stop_worker_async(process, "worker1")
+            return process.returncode
+
+        assert asyncio.run(_main()) == -15
+
+    def test_kill_after_grace_period(self, async_supervisor: list[str]) -> None:  # noqa: ARG002
+        """A worker ignoring SIGTERM is killed once the grace period is over."""
+
+        async def _main() -> int | None:
+            process = await _spawn(TERM_IGNORING_SLEEPER)
+            await stop_worker_async(process, "worker1")
+            return process.returncode
+
+        assert asyncio.run(_main()) == -9
+
+    def test_stops_run_concurrently(self, async_supervisor: list[str]) -> None:  # noqa: ARG002
+        """Stopping several workers takes one grace period, not one per worker."""
+
+        async def _main() -> float:
+            processes = [await _spawn(TERM_IGNORING_SLEEPER) for _ in range(3)]
+            start = time.monotonic()
+            await asyncio.gather(*(stop_worker_async(process, f"worker{i}") for i, process in enumerate(processes)))
+            return time.monotonic() - start
+
+        assert asyncio.run(_main()) < 1.2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM handling of the test processes is POSIX only")
+class TestWatchdogAsync:
+    """Tests for watchdog_async."""
+
+    def test_crash_is_restarted_without_waiting_for_check_interval(
+        self, tmp_path: Path, async_supervisor: list[str]
+    ) -> None:
+        """A crashed worker is restarted when it exits, although check_interval is 30 s."""
+        heartbeat_path("crasher", tmp_path).touch()
+        asyncio.run(_run_for(1.5, [WorkerData("crasher", "", [CRASHER], 60.0)], tmp_path))
+        assert async_supervisor.count("crasher") >= 3
+
+    def test_frozen_worker_is_restarted_at_its_deadline(self, tmp_path: Path, async_supervisor: list[str]) -> None:
+        """A live worker whose heartbeat gets older than its timeout is stopped and restarted."""
+        heartbeat_path("frozen", tmp_path).touch()
+        asyncio.run(_run_for(1.0, [WorkerData("frozen", "", [SLEEPER], 0.3)], tmp_path))
+        assert async_supervisor.count("frozen") >= 2
+
+    def test_slow_stop_does_not_delay_other_workers(self, tmp_path: Path, async_supervisor: list[str]) -> None:
+        """A crashing worker keeps being restarted while a frozen one waits out its stop grace period."""
+        heartbeat_path("crasher", tmp_path).touch()
+        heartbeat_path("frozen", tmp_path).touch()
+        watchdog.SUPERVISION = watchdog.SUPERVISION._replace(stop_grace_period=2.0)
+        workers = [
+            WorkerData("frozen", "", [TERM_IGNORING_SLEEPER], 0.2),
+            WorkerData("crasher", "", [CRASHER], 60.0),
+        ]
+        start = time.monotonic()
+        asyncio.run(_run_for(1.5, workers, tmp_path))
+        assert async_supervisor.count("crasher") >= 3
+        assert time.monotonic() - start < 5.0
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="/proc resource telemetry is Linux only")
+    def test_worker_over_its_rss_limit_is_restarted(self, tmp_path: Path, async_supervisor: list[str]) -> None:
+        """A worker using more memory than max_rss_mb is gracefully restarted at its next check."""
+        heartbeat_path("hog", tmp_path).touch()
+        watchdog.SUPERVISION = watchdog.SUPERVISION._replace(check_interval=0.2)
+        asyncio.run(_run_for(1.0, [WorkerData("hog", "", [SLEEPER], 60.0, max_rss_mb=1.0)], tmp_path))
+        assert async_supervisor.count("hog") >= 2
+
+    def test_failed_restart_drops_the_dead_process(
+        self, tmp_path: Path, async_supervisor: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """After a failed restart the exited process is neither kept nor sampled for its resources."""
+        heartbeat_path("crasher", tmp_path).touch()
+        watchdog.SUPERVISION = watchdog.SUPERVISION._replace(check_interval=0.1)
+        sampled_alive: list[bool] = []
+
+        async def _start_once(config: WorkerData, _heartbeat_dir: Path) -> asyncio.subprocess.Process:
+            async_supervisor.append(config.name)
+            if len(async_supervisor) > 1:
+                raise OSError("cannot start")
+            return await _spawn(CRASHER)
+
+        def _sample(config: WorkerData, _pid: int) -> None:
+            sampled_alive.append(watchdog.ASYNC_PROCESSES[config.name].returncode is None)
+
+        monkeypatch.setattr(watchdog, "start_worker_async", _start_once)
+        monkeypatch.setattr(watchdog, "_resource_limit_breach", _sample)
+        asyncio.run(_run_for(1.0, [WorkerData("crasher", "", [CRASHER], 60.0)], tmp_path))
+        assert async_supervisor.count("crasher") >= 3
+        assert "crasher" not in watchdog.ASYNC_PROCESSES
+        assert all(sampled_alive)
+
+    def test_restarts_are_exported_as_metrics(self, tmp_path: Path, async_supervisor: list[str]) -> None:
+        """The restarts of a crashing worker are counted in the metrics textfile."""
+        heartbeat_path("crasher", tmp_path).touch()
+        textfile = tmp_path / "watchdog.prom"
+        watchdog.SUPERVISION = watchdog.SUPERVISION._replace(check_interval=0.2, metrics_textfile=str(textfile))
+        asyncio.run(_run_for(1.0, [WorkerData("crasher", "", [CRASHER], 60.0)], tmp_path))
+        restarts = async_supervisor.count("crasher") - 1
+        assert restarts >= 1
+        assert f'watchdog_worker_restarts_total{{worker="crasher"}} {float(restarts)}' in watchdog.METRICS.render()
+        assert 'watchdog_worker_restarts_total{worker="crasher"}' in textfile.read_text(encoding="utf-8")
+
+    def test_all_workers_are_stopped_on_stop(self, tmp_path: Path, async_supervisor: list[str]) -> None:
+        """Setting the stop event stops every worker and writes the watchdog heartbeat and PID."""
+        workers = [WorkerData(f"worker{i}", "", [SLEEPER], 60.0) for i in range(3)]
+        for worker in workers:
+            heartbeat_path(worker.name, tmp_path).touch()
+        asyncio.run(_run_for(0.3, workers, tmp_path))
+        assert sorted(async_supervisor) == ["worker0", "worker1", "worker2"]
+        assert all(process.returncode is not None for process in watchdog.ASYNC_PROCESSES.values())
+        assert heartbeat_path("watchdog", tmp_path).exists()
+        assert (tmp_path / "watchdog.pid").exists()
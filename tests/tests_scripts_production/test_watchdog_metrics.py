@@ -0,0 +1,126 @@
+"""
+Tests for the supervision metrics of the watchdog: recording, the Prometheus / OpenMetrics text, the textfile and the
+HTTP endpoint.
+"""
+
+import math
+from collections.abc import Iterator
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from src.scripts_production.watchdog_metrics import (
+    OPEN_METRICS_CONTENT_TYPE,
+    PROMETHEUS_CONTENT_TYPE,
+    WatchdogMetrics,
+)
+from src.scripts_production.worker_telemetry import ResourceSample
+
+
+@pytest.fixture
+def metrics() -> WatchdogMetrics:
+    """Metrics of two workers, one of them restarted."""
+    watchdog_metrics = WatchdogMetrics()
+    watchdog_metrics.worker_started("worker1")
+    watchdog_metrics.worker_checked("worker1", alive=True, heartbeat_age=1.5)
+    watchdog_metrics.worker_restarted("worker2", consecutive_failures=3, backoff=8.0, crash_looping=True)
+    watchdog_metrics.worker_checked("worker2", alive=False, heartbeat_age=math.inf)
+    watchdog_metrics.check_finished(0.25)
+    return watchdog_metrics
+
+
+@pytest.fixture
+def served(metrics: WatchdogMetrics) -> Iterator[str]:
+    """URL of the metrics endpoint on a free port, stopped after the test."""
+    port = metrics.serve(0)
+    yield f"http://127.0.0.1:{port}"
+    metrics.close()
+
+
+# ---------------------------------------------------------------------------
+# render
+# ---------------------------------------------------------------------------
+class TestRender:
+    """Tests for WatchdogMetrics.render."""
+
+    def test_worker_samples(self, metrics: WatchdogMetrics) -> None:
+        """The recorded values are rendered per worker."""
+        text = metrics.render()
+        assert 'watchdog_worker_up{worker="worker1"} 1.0' in text
+        assert 'watchdog_worker_up{worker="worker2"} 0.0' in text
+        assert 'watchdog_worker_heartbeat_age_seconds{worker="worker1"} 1.5' in text
+        assert 'watchdog_worker_heartbeat_age_seconds{worker="worker2"} +Inf' in text
+        assert 'watchdog_worker_consecutive_failures{worker="worker2"} 3.0' in text
+        assert 'watchdog_worker_crash_looping{worker="worker2"} 1.0' in text
+
+    def test_prometheus_counters(self, metrics: WatchdogMetrics) -> None:
+        """In the Prometheus text format the counter families carry the _total suffix and there is no # EOF."""
+        text = metrics.render()
+        assert "# TYPE watchdog_worker_restarts_total counter" in text
+        assert 'watchdog_worker_restarts_total{worker="worker2"} 1.0' in text
+        assert "watchdog_checks_total 1.0" in text
+        assert "# EOF" not in text
+
+    def test_open_metrics_counters(self, metrics: WatchdogMetrics) -> None:
+        """In OpenMetrics the counter families have no suffix, the samples do, and the text ends with # EOF."""
+        text = metrics.render(open_metrics=True)
+        assert "# TYPE watchdog_worker_restarts counter" in text
+        assert 'watchdog_worker_restarts_total{worker="worker2"} 1.0' in text
+        assert text.endswith("# EOF\n")
+
+    def test_resources(self, metrics: WatchdogMetrics) -> None:
+        """A resource sample is rendered in bytes, percent and file descriptors."""
+        metrics.worker_sampled("worker1", ResourceSample(0.0, 0.0, 12.5, 2.0, 1, 7, 0, 0))
+        text = metrics.render()
+        assert f'watchdog_worker_resident_memory_bytes{{worker="worker1"}} {float(2 * 1024 * 1024)}' in text
+        assert 'watchdog_worker_cpu_percent{worker="worker1"} 12.5' in text
+        assert 'watchdog_worker_open_fds{worker="worker1"} 7.0' in text
+
+    def test_label_escaping(self) -> None:
+        """Quotes and backslashes in a worker name are escaped."""
+        watchdog_metrics = WatchdogMetrics()
+        watchdog_metrics.worker_started('odd"name\\')
+        assert 'watchdog_worker_up{worker="odd\\"name\\\\"} 1.0' in watchdog_metrics.render()
+
+
+# ---------------------------------------------------------------------------
+# write_textfile
+# ---------------------------------------------------------------------------
+class TestWriteTextfile:
+    """Tests for WatchdogMetrics.write_textfile."""
+
+    def test_replaces_the_file(self, metrics: WatchdogMetrics, tmp_path: Path) -> None:
+        """The file holds the Prometheus text and no temporary file is left behind."""
+        path = tmp_path / "watchdog.prom"
+        path.write_text("stale", encoding="utf-8")
+        metrics.write_textfile(path)
+        assert "watchdog_checks_total 1.0" in path.read_text(encoding="utf-8")
+        assert [file.name for file in tmp_path.iterdir()] == ["watchdog.prom"]
+
+
+# ---------------------------------------------------------------------------
+# serve
+# ---------------------------------------------------------------------------
+class TestServe:
+    """Tests for WatchdogMetrics.serve."""
+
+    def test_prometheus_scrape(self, served: str) -> None:
+        """A plain scrape gets the Prometheus text format."""
+        with urlopen(f"{served}/metrics") as response:  # noqa: S310
+            assert response.headers["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+            assert "watchdog_checks_total 1.0" in response.read().decode("utf-8")
+
+    def test_open_metrics_scrape(self, served: str) -> None:
+        """A scraper accepting OpenMetrics gets it."""
+        request = Request(f"{served}/metrics", headers={"Accept": "application/openmetrics-text; version=1.0.0"})  # noqa: S310
+        with urlopen(request) as response:  # noqa: S310
+            assert response.headers["Content-Type"] == OPEN_METRICS_CONTENT_TYPE
+            assert response.read().decode("utf-8").endswith("# EOF\n")
+
+    def test_other_path_is_not_found(self, served: str) -> None:
+        """Only /metrics is served."""
+        with pytest.raises(HTTPError) as error:
+            urlopen(f"{served}/other")  # noqa: S310
+        assert error.value.code == 404
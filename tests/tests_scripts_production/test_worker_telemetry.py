@@ -0,0 +1,167 @@
+"""
+Tests for the /proc resource telemetry of the watchdog workers: parsing, resource limits and leak detection.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.configurations.watchdog_config_data import WorkerData
+from src.scripts_production import worker_telemetry
+from src.scripts_production.worker_telemetry import (
+    CLOCK_TICKS,
+    ResourceSample,
+    WorkerTelemetry,
+    limit_breach,
+    read_process_resources,
+)
+
+
+def _fake_process(proc_dir: Path, pid: int, cpu_ticks: int, rss_kb: int, n_fds: int) -> None:
+    """Writes the /proc files of a fake process, with a command name containing spaces and parentheses."""
+    process_dir = proc_dir / str(pid)
+    (process_dir / "fd").mkdir(parents=True, exist_ok=True)
+    for fd in range(n_fds):
+        (process_dir / "fd" / str(fd)).touch()
+    fields = ["S", *["0"] * 10, str(cpu_ticks), "0", *["0"] * 30]
+    (process_dir / "stat").write_text(f"{pid} (my (worker) 1) {' '.join(fields)}\n", encoding="utf-8")
+    (process_dir / "status").write_text(f"Name:\tworker\nVmRSS:\t  {rss_kb} kB\nThreads:\t3\n", encoding="utf-8")
+    (process_dir / "io").write_text("rchar: 10\nread_bytes: 4096\nwrite_bytes: 8192\n", encoding="utf-8")
+
+
+def _sample(rss_mb: float = 100.0, cpu_percent: float = 10.0, n_fds: int = 10) -> ResourceSample:
+    """Sample with the given resources."""
+    return ResourceSample(0.0, 0.0, cpu_percent, rss_mb, 1, n_fds, 0, 0)
+
+
+# ---------------------------------------------------------------------------
+# read_process_resources
+# ---------------------------------------------------------------------------
+class TestReadProcessResources:
+    """Tests for read_process_resources."""
+
+    def test_parses_proc_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The fields are read from stat, status, io and fd."""
+        monkeypatch.setattr(worker_telemetry, "PROC_DIR", tmp_path)
+        _fake_process(tmp_path, 42, cpu_ticks=3 * CLOCK_TICKS, rss_kb=2048, n_fds=5)
+        sample = read_process_resources(42)
+        assert sample is not None
+        assert sample.cpu_seconds == pytest.approx(3.0)
+        assert sample.cpu_percent == 0.0
+        assert sample.rss_mb == 2.0
+        assert (sample.n_threads, sample.n_fds, sample.read_bytes, sample.write_bytes) == (3, 5, 4096, 8192)
+
+    def test_cpu_percent_since_previous_sample(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The CPU % is the CPU time used since the previous sample over the elapsed time."""
+        monkeypatch.setattr(worker_telemetry, "PROC_DIR", tmp_path)
+        _fake_process(tmp_path, 42, cpu_ticks=3 * CLOCK_TICKS, rss_kb=2048, n_fds=1)
+        sample = read_process_resources(42)
+        assert sample is not None
+        previous = sample._replace(time=sample.time - 10.0, cpu_seconds=1.0)
+        later = read_process_resources(42, previous)
+        assert later is not None
+        assert later.cpu_percent == pytest.approx(20.0, rel=0.01)
+
+    def test_missing_io_reads_zero(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An unreadable io file does not prevent the sample."""
+        monkeypatch.setattr(worker_telemetry, "PROC_DIR", tmp_path)
+        _fake_process(tmp_path, 42, cpu_ticks=0, rss_kb=1024, n_fds=1)
+        (tmp_path / "42" / "io").unlink()
+        sample = read_process_resources(42)
+        assert sample is not None
+        assert (sample.read_bytes, sample.write_bytes) == (0, 0)
+
+    def test_missing_process_returns_none(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A process without /proc entry cannot be sampled."""
+        monkeypatch.setattr(worker_telemetry, "PROC_DIR", tmp_path)
+        assert read_process_resources(42) is None
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="/proc is available on Linux only")
+    def test_current_process(self) -> None:
+        """The real /proc entry of the test process is readable."""
+        sample = read_process_resources(os.getpid())
+        assert sample is not None
+        assert sample.rss_mb > 1.0
+        assert sample.n_fds > 0
+
+
+# ---------------------------------------------------------------------------
+# limit_breach
+# ---------------------------------------------------------------------------
+class TestLimitBreach:
+    """Tests for limit_breach."""
+
+    @pytest.mark.parametrize(
+        ("max_rss_mb", "max_cpu_pct", "expected"),
+        [
+            (None, None, None),
+            (200.0, 50.0, None),
+            (50.0, None, "RSS 100 MB over the limit of 50 MB"),
+            (None, 5.0, "CPU 10 % over the limit of 5 %"),
+            (50.0, 5.0, "RSS 100 MB over the limit of 50 MB"),
+        ],
+    )
+    def test_limits(self, max_rss_mb: float | None, max_cpu_pct: float | None, expected: str | None) -> None:
+        """Only a set and exceeded limit is reported, memory first."""
+        config = WorkerData("worker1", "", [], 30.0, max_rss_mb=max_rss_mb, max_cpu_pct=max_cpu_pct)
+        assert limit_breach(config, _sample()) == expected
+
+
+# ---------------------------------------------------------------------------
+# WorkerTelemetry
+# ---------------------------------------------------------------------------
+class TestWorkerTelemetry:
+    """Tests for WorkerTelemetry."""
+
+    @staticmethod
+    def _feed(monkeypatch: pytest.MonkeyPatch, samples: list[ResourceSample]) -> None:
+        """Makes read_process_resources return the given samples one after another."""
+        remaining = iter(samples)
+        monkeypatch.setattr(worker_telemetry, "read_process_resources", lambda _pid, _previous: next(remaining))
+
+    def test_history_is_a_ring_buffer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the last history_length samples are kept."""
+        self._feed(monkeypatch, [_sample(rss_mb=float(i)) for i in range(5)])
+        telemetry = WorkerTelemetry(history_length=3)
+        for _ in range(5):
+            telemetry.sample("worker1", 1)
+        assert [sample.rss_mb for sample in telemetry.history("worker1")] == [2.0, 3.0, 4.0]
+
+    def test_new_pid_resets_history(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A restarted worker starts a new history."""
+        self._feed(monkeypatch, [_sample(rss_mb=float(i)) for i in range(3)])
+        telemetry = WorkerTelemetry(history_length=3)
+        telemetry.sample("worker1", 1)
+        telemetry.sample("worker1", 1)
+        telemetry.sample("worker1", 2)
+        assert [sample.rss_mb for sample in telemetry.history("worker1")] == [2.0]
+
+    def test_steady_growth_is_an_anomaly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Memory and file descriptors growing over the full history are reported."""
+        self._feed(monkeypatch, [_sample(rss_mb=100.0 + 30 * i, n_fds=10 + 10 * i) for i in range(3)])
+        telemetry = WorkerTelemetry(history_length=3)
+        for _ in range(2):
+            telemetry.sample("worker1", 1)
+        assert telemetry.anomalies("worker1") == []
+        telemetry.sample("worker1", 1)
+        assert telemetry.anomalies("worker1") == ["rss_mb", "n_fds"]
+
+    def test_fluctuation_is_not_an_anomaly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A resource that drops in between, or grows a little, is not reported."""
+        self._feed(
+            monkeypatch, [_sample(rss_mb=rss_mb, n_fds=n_fds) for rss_mb, n_fds in ((100, 10), (90, 11), (200, 12))]
+        )
+        telemetry = WorkerTelemetry(history_length=3)
+        for _ in range(3):
+            telemetry.sample("worker1", 1)
+        assert telemetry.anomalies("worker1") == []
+
+    def test_unsampled_process_keeps_history(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A failed sample returns None and adds nothing."""
+        self._feed(monkeypatch, [_sample(), None])  # type: ignore[list-item]
+        telemetry = WorkerTelemetry()
+        telemetry.sample("worker1", 1)
+        assert telemetry.sample("worker1", 1) is None
+        assert len(telemetry.history("worker1")) == 1
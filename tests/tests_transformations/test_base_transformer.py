@@ -0,0 +1,118 @@
+"""
+Tests for the block-parallel predict and the output dtype policy of BaseTransformer.
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+from numpy import array_equal, bool_, float32, float64, int16, uint8
+from numpy.random import default_rng
+from pandas import DataFrame, date_range
+from scipy.sparse import csr_array
+
+from src.exceptions.development_exception import IncorrectValue, NoProperOptionInIf
+from src.transformations.base_transformer import MIN_BLOCK_ROWS, resolve_output_dtype
+from src.transformations.datetime_cyclical_transformer import CyclicalAttributes, DatetimeCyclicalTransformer
+from src.transformations.datetime_one_hot_transformer import DatetimeOneHotEncoderTransformer, TimeAttributes
+from src.transformations.lag_rolling_feature_transformer import LagRollingFeatures, LagRollingFeatureTransformer
+from src.utils.application_config import ApplicationConfig
+from src.utils.envs import Envs
+
+DATA = date_range("2023-01-01", periods=4 * MIN_BLOCK_ROWS + 17, freq="37min")
+ATTRIBUTES = TimeAttributes(hours=True, days_of_week=True, weekend=True, months=True, years=True, min_interval=0)
+
+
+@pytest.mark.parametrize("output", ["dense", "sparse"])
+def test_thread_blocks_equal_predict(output: str) -> None:
+    """
+    Tests that the blocks predicted on threads give the prediction, dense or sparse.
+    :param output: str. Output of the one-hot encoder.
+    """
+    transformer = DatetimeOneHotEncoderTransformer(ATTRIBUTES, output=output, dtype=uint8)
+    transformer.fit(DATA)
+    parallel = transformer.predict_parallel(DATA, n_jobs=4)
+    expected = transformer.predict(DATA)
+    if output == "sparse":
+        assert isinstance(parallel, csr_array) and isinstance(expected, csr_array)
+        assert array_equal(parallel.toarray(), expected.toarray())
+    else:
+        assert parallel.dtype == uint8
+        assert array_equal(parallel, expected)
+
+
+def test_process_blocks_and_shared_memory_output() -> None:
+    """
+    Tests process workers writing into a temporary shared memory block, and threads writing into a given one.
+    """
+    transformer = DatetimeCyclicalTransformer(CyclicalAttributes(hours=True, days_of_week=True, days_of_year=True))
+    transformer.fit(DATA)
+    expected = transformer.predict(DATA)
+    assert array_equal(transformer.predict_parallel(DATA, n_jobs=2, executor="process"), expected)
+    memory = SharedMemory(create=True, size=expected.nbytes)
+    try:
+        parallel = transformer.predict_parallel(DATA, n_jobs=3, shared_memory=memory)
+        assert array_equal(parallel, expected)
+        del parallel
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_not_row_wise_transformer_is_predicted_whole() -> None:
+    """
+    Tests that a transformer looking at previous rows gives the prediction, not a per-block one.
+    """
+    df = DataFrame(
+        {"value": default_rng(seed=864).normal(size=len(DATA))},
+        index=date_range("2023-01-01", periods=len(DATA), freq="15min"),
+    )
+    transformer = LagRollingFeatureTransformer(LagRollingFeatures(lags=["1h"], windows=["1D"], statistics=["mean"]))
+    transformer.fit(df)
+    assert not transformer.is_row_wise()
+    assert array_equal(transformer.predict_parallel(df, n_jobs=4), transformer.predict(df), equal_nan=True)
+
+
+def test_incorrect_input() -> None:
+    """
+    Tests exception raise for an invalid n_jobs and executor.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    transformer = DatetimeOneHotEncoderTransformer(ATTRIBUTES)
+    transformer.fit(DATA)
+    with pytest.raises(IncorrectValue):
+        transformer.predict_parallel(DATA, n_jobs=0)
+    with pytest.raises(NoProperOptionInIf):
+        transformer.predict_parallel(DATA, executor="fork")
+
+
+def test_output_dtype_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that transformers without dtype follow the policy of ApplicationConfig and an explicit dtype overrides it.
+    :param monkeypatch: pytest.MonkeyPatch. Used to change the policy.
+    """
+    transformer = DatetimeOneHotEncoderTransformer(ATTRIBUTES)
+    output = transformer.fit_predict(DATA[:100])
+    assert output.dtype == uint8
+    assert transformer.inverse(output).dtype == int16
+    assert DatetimeCyclicalTransformer(CyclicalAttributes(True, False, False)).fit_predict(DATA).dtype == float64
+    assert resolve_output_dtype(float32, "real") == float32
+
+    config = ApplicationConfig()
+    policy = config.get_data().transformation_dtypes._replace(indicator="bool", real="float32")
+    monkeypatch.setattr(config, "_data", config.get_data()._replace(transformation_dtypes=policy))
+    assert DatetimeOneHotEncoderTransformer(ATTRIBUTES).fit_predict(DATA[:100]).dtype == bool_
+    assert DatetimeCyclicalTransformer(CyclicalAttributes(True, False, False)).fit_predict(DATA).dtype == float32
+    assert DatetimeOneHotEncoderTransformer(ATTRIBUTES, dtype=float64).fit_predict(DATA[:100]).dtype == float64
+
+
+def test_incorrect_output_dtype() -> None:
+    """
+    Tests exception raise for an unknown kind of output and a dtype which can not hold it.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    with pytest.raises(NoProperOptionInIf):
+        resolve_output_dtype(None, "complex")
+    with pytest.raises(IncorrectValue):
+        DatetimeCyclicalTransformer(CyclicalAttributes(True, False, False), dtype=int16)
@@ -0,0 +1,80 @@
+"""
+Tests for the cached calendar table and DatetimeCalendar.
+"""
+
+import pytest
+from numpy import array_equal
+from numpy.random import default_rng
+from pandas import DatetimeIndex, NaT, date_range, to_datetime
+
+from src.exceptions.development_exception import IncorrectValue
+from src.transformations.calendar_table import DatetimeCalendar, get_calendar_table
+from src.transformations.datetime_cyclical_transformer import CyclicalAttributes, DatetimeCyclicalTransformer
+from src.transformations.datetime_one_hot_transformer import DatetimeOneHotEncoderTransformer, TimeAttributes
+from src.utils.envs import Envs
+
+_rng = default_rng(seed=864)
+RANDOM_DATA = DatetimeIndex(
+    to_datetime(_rng.integers(-(10**9), 3 * 10**9, size=20_000), unit="s")
+)  # 1938 - 2065, across 1970
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        RANDOM_DATA,
+        RANDOM_DATA.as_unit("ns"),
+        RANDOM_DATA.as_unit("ms"),
+        RANDOM_DATA.tz_localize("UTC").tz_convert("America/New_York"),
+        date_range("2024-03-30", "2024-04-01", freq="15min", tz="Europe/Prague"),
+    ],
+)
+def test_attributes_match_pandas(data: DatetimeIndex) -> None:
+    """
+    Tests that the attributes equal the pandas accessors, in any unit and time zone.
+    :param data: DatetimeIndex.
+    """
+    calendar = DatetimeCalendar(data)
+    assert array_equal(calendar.hour(), data.hour)
+    assert array_equal(calendar.minute_of_day(), data.hour * 60 + data.minute)
+    assert array_equal(calendar.day_of_week(), data.dayofweek)
+    assert array_equal(calendar.weekend(), data.dayofweek >= 5)
+    assert array_equal(calendar.month(), data.month)
+    assert array_equal(calendar.year(), data.year)
+    assert array_equal(calendar.day_of_year(), data.dayofyear)
+
+
+def test_table_is_cached_and_read_only() -> None:
+    """
+    Tests that the same years reuse the same read-only table.
+    """
+    table = get_calendar_table(2023, 2024)
+    assert get_calendar_table(2023, 2024) is table
+    assert len(table.day_of_week) == 365 + 366
+    assert not table.month.flags.writeable
+    DatetimeCalendar(date_range("2023-05-01", "2024-05-01", freq="D"))
+    assert get_calendar_table.cache_info().hits >= 2
+
+
+def test_nat_raises() -> None:
+    """
+    Tests that NaT is rejected instead of being looked up as a day tens of thousands of years back, also by the
+    transformers using the calendar.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    data = DatetimeIndex(["2024-01-01 10:00", NaT, "2024-01-02 11:00"])
+    with pytest.raises(IncorrectValue):
+        DatetimeCalendar(data)
+    encoder = DatetimeOneHotEncoderTransformer(
+        TimeAttributes(hours=True, days_of_week=False, weekend=False, months=False, years=True, min_interval=0)
+    )
+    with pytest.raises(IncorrectValue):
+        encoder.fit(data)
+    encoder.fit(data.dropna())
+    with pytest.raises(IncorrectValue):
+        encoder.predict(data)
+    with pytest.raises(IncorrectValue):
+        DatetimeCyclicalTransformer(CyclicalAttributes(hours=True, days_of_week=False, days_of_year=False)).predict(
+            data
+        )
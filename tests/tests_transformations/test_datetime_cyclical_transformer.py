@@ -0,0 +1,67 @@
+"""
+Tests for DatetimeCyclicalTransformer.
+"""
+
+import pytest
+from numpy import allclose, array_equal, cos, float32, float64, pi, sin, zeros
+from pandas import date_range
+
+from src.exceptions.development_exception import NoProperOptionInIf
+from src.transformations.datetime_cyclical_transformer import CyclicalAttributes, DatetimeCyclicalTransformer
+from src.utils.envs import Envs
+
+DATA = date_range("2023-01-01", periods=3000, freq="137min")
+ALL_ATTRIBUTES = CyclicalAttributes(hours=True, days_of_week=True, days_of_year=True)
+
+
+@pytest.mark.parametrize("output_dtype", [float64, float32])
+def test_output(output_dtype: type) -> None:
+    """
+    Tests the sines and cosines against a direct computation, their dtype and the column names.
+    :param output_dtype: type. Output dtype.
+    """
+    transformer = DatetimeCyclicalTransformer(ALL_ATTRIBUTES, dtype=output_dtype)
+    output = transformer.fit_predict(DATA)
+    hours = 2 * pi * (DATA.hour * 60 + DATA.minute) / (24 * 60)
+    days_of_week = 2 * pi * DATA.dayofweek / 7
+    days_of_year = 2 * pi * (DATA.dayofyear - 1) / (365 + DATA.is_leap_year)
+    expected = [sin(hours), cos(hours), sin(days_of_week), cos(days_of_week), sin(days_of_year), cos(days_of_year)]
+    assert output.dtype == output_dtype
+    for column, values in enumerate(expected):
+        assert allclose(output[:, column], values, atol=1e-6)
+    assert transformer.get_encoded_attribute_names("TIME")[:2] == ["TIME_HOUR_SIN", "TIME_HOUR_COS"]
+
+
+def test_inverse_and_predict_into() -> None:
+    """
+    Tests the inverse and writing into a column slice of a bigger array.
+    """
+    transformer = DatetimeCyclicalTransformer(CyclicalAttributes(hours=True, days_of_week=True, days_of_year=False))
+    transformer.fit(DATA)
+    out = zeros((len(DATA), 6))
+    transformer.predict_into(DATA, out[:, 1:5])
+    assert array_equal(out[:, 1:5], transformer.predict(DATA))
+    inverted = transformer.inverse(out[:, 1:5])
+    assert allclose(inverted[:, 0], DATA.hour + DATA.minute / 60)
+    assert array_equal(inverted[:, 1], DATA.dayofweek)
+
+
+def test_restore_from_params() -> None:
+    """
+    Tests that a transformer restored from params predicts identically.
+    """
+    transformer = DatetimeCyclicalTransformer(ALL_ATTRIBUTES, dtype=float32)
+    transformer.fit(DATA)
+    restored = DatetimeCyclicalTransformer(CyclicalAttributes(hours=True, days_of_week=False, days_of_year=False))
+    restored.restore_from_params(transformer.get_params())
+    assert array_equal(restored.predict(DATA), transformer.predict(DATA))
+
+
+def test_incorrect_input() -> None:
+    """
+    Tests exception raise situation when there is no option selected.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    with pytest.raises(NoProperOptionInIf):
+        DatetimeCyclicalTransformer(CyclicalAttributes(hours=False, days_of_week=False, days_of_year=False))
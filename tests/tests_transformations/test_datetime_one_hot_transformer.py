@@ -10,11 +10,13 @@ from datetime import datetime
 from typing import Any
 
 import pytest
-from numpy import array, array_equal, dtype, ndarray, zeros
+from numpy import array, array_equal, bool_, dtype, float32, float64, ndarray, uint8, vstack, zeros
 from numpy.random import default_rng
 from pandas import DatetimeIndex
+from scipy.sparse import csr_array
 
-from src.exceptions.development_exception import NoProperOptionInIf
+from src.exceptions.development_exception import IncorrectValue, NoProperOptionInIf, NotReadyFunctionality
+from src.transformations.base_transformer import BaseTransformer, TransformerDescription
 from src.transformations.datetime_one_hot_transformer import DatetimeOneHotEncoderTransformer, TimeAttributes
 from src.transformations.transformer_methods import FP, P
 from src.utils.envs import Envs
@@ -460,3 +462,127 @@ def test_restore_from_params_predicts_identically_to_original() -> None:
     prediction_a = encoder_a.predict(INPUT_DATA)
     prediction_b = encoder_b.predict(INPUT_DATA)
     assert array_equal(prediction_a, prediction_b)
+
+
+def test_handle_unknown_error() -> None:
+    """
+    Tests that a value not seen in fit raises with handle_unknown="error", also for an unseen year.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    time_attributes = TimeAttributes(
+        hours=False, days_of_week=False, weekend=False, months=False, years=True, min_interval=0
+    )
+    transformer = DatetimeOneHotEncoderTransformer(time_attributes, handle_unknown="error")
+    transformer.fit(DatetimeIndex([datetime(2019, 1, 1), datetime(2021, 1, 1)]))
+    assert array_equal(transformer.predict(DatetimeIndex([datetime(2021, 5, 1)])), array([[0, 1]]))
+    with pytest.raises(IncorrectValue):
+        transformer.predict(DatetimeIndex([datetime(2020, 1, 1)]))
+
+
+def test_incorrect_handle_unknown() -> None:
+    """
+    Tests exception raise for an unknown handle_unknown option.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    time_attributes = TimeAttributes(
+        hours=True, days_of_week=False, weekend=False, months=False, years=False, min_interval=0
+    )
+    with pytest.raises(NoProperOptionInIf):
+        DatetimeOneHotEncoderTransformer(time_attributes, handle_unknown="infrequent_if_exist")
+
+
+def test_inverse_of_ignored_unknown_is_none() -> None:
+    """
+    Tests that an attribute left all zero by an ignored unknown value inverts to None.
+    """
+    time_attributes = TimeAttributes(
+        hours=False, days_of_week=False, weekend=False, months=True, years=True, min_interval=0
+    )
+    transformer = DatetimeOneHotEncoderTransformer(time_attributes)
+    transformer.fit(DatetimeIndex([datetime(2019, 1, 1)]))
+    inverted = transformer.inverse(transformer.predict(DatetimeIndex([datetime(2019, 1, 1), datetime(2020, 2, 1)])))
+    assert inverted.tolist() == [[1.0, 2019.0], [None, None]]
+
+
+@pytest.mark.parametrize("output_dtype", [float64, float32, uint8, bool_])
+def test_sparse_output_matches_dense(output_dtype: type) -> None:
+    """
+    Tests that the sparse output holds the dense output, in the requested dtype, also with ignored unknown values.
+    :param output_dtype: type. Output dtype.
+    """
+    time_attributes = TimeAttributes(
+        hours=True, days_of_week=True, weekend=True, months=True, years=True, min_interval=30
+    )
+    dense = DatetimeOneHotEncoderTransformer(time_attributes, dtype=output_dtype)
+    sparse = DatetimeOneHotEncoderTransformer(time_attributes, output="sparse", dtype=output_dtype)
+    dense.fit(INPUT_DATA)
+    sparse.fit(INPUT_DATA)
+    data = DATES[::97]
+    dense_output = dense.predict(data)
+    sparse_output = sparse.predict(data)
+    assert isinstance(sparse_output, csr_array)
+    assert dense_output.dtype == sparse_output.dtype == output_dtype
+    assert array_equal(sparse_output.toarray(), dense_output)
+    assert sparse.inverse(sparse_output).tolist() == dense.inverse(dense_output).tolist()
+
+
+def test_incorrect_output() -> None:
+    """
+    Tests exception raise for an unknown output option.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    time_attributes = TimeAttributes(
+        hours=True, days_of_week=False, weekend=False, months=False, years=False, min_interval=0
+    )
+    with pytest.raises(NoProperOptionInIf):
+        DatetimeOneHotEncoderTransformer(time_attributes, output="coo")
+
+
+def test_partial_fit_and_predict_iter_match_fit_and_predict() -> None:
+    """
+    Tests that partial_fit over chunks learns the categories of fit over all the data, and that predict_iter yields
+    the chunks of predict.
+    """
+    time_attributes = TimeAttributes(
+        hours=True, days_of_week=True, weekend=True, months=True, years=True, min_interval=45
+    )
+    chunks = [DATES[i : i + 5000] for i in range(0, len(DATES), 5000)]
+    transformer = DatetimeOneHotEncoderTransformer(time_attributes)
+    transformer.fit(DATES)
+    chunked_transformer = DatetimeOneHotEncoderTransformer(time_attributes)
+    for chunk in chunks:
+        chunked_transformer.partial_fit(chunk)
+    assert chunked_transformer.get_encoded_attribute_names() == transformer.get_encoded_attribute_names()
+    assert array_equal(vstack(list(chunked_transformer.predict_iter(iter(chunks)))), transformer.predict(DATES))
+
+
+def test_partial_fit_not_supported() -> None:
+    """
+    Tests that the default partial_fit of BaseTransformer raises.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+
+    class _Identity(BaseTransformer):
+        def fit(self, data: Any) -> None:
+            pass
+
+        def predict(self, data: Any) -> Any:
+            return data
+
+        def fit_predict(self, data: Any) -> Any:
+            return data
+
+        def inverse(self, data: Any) -> Any:
+            return data
+
+    transformer = _Identity(
+        "Identity",
+        TransformerDescription(input_type=None, input_elements_type=None, output_type=None, output_elements_type=None),
+    )
+    assert list(transformer.predict_iter([1, 2])) == [1, 2]
+    with pytest.raises(NotReadyFunctionality):
+        transformer.partial_fit([1])
@@ -0,0 +1,122 @@
+"""
+Tests for LagRollingFeatureTransformer.
+"""
+
+import pytest
+from numpy import allclose, arange, array_equal, float32, float64, full, isnan, nan
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.random import default_rng
+from pandas import DataFrame, Timedelta, date_range
+
+from src.exceptions.data_exception import IncorrectDataStructure
+from src.exceptions.development_exception import IncorrectValue, NotValidOperation
+from src.transformations.lag_rolling_feature_transformer import (
+    STATISTICS,
+    LagRollingFeatures,
+    LagRollingFeatureTransformer,
+)
+from src.utils.envs import Envs
+
+_rng = default_rng(seed=864)
+STEP = "15min"
+FEATURES = LagRollingFeatures(lags=["15min", "2h"], windows=["15min", "1h", "1D"], statistics=list(STATISTICS))
+
+
+def _data(n_rows: int) -> DataFrame:
+    """
+    Generates two columns with regular index, one with a large offset to test precision.
+    :param n_rows: int.
+    :return: DataFrame.
+    """
+    return DataFrame(
+        {"load": _rng.normal(1e6, 5.0, n_rows), "price": _rng.normal(0.0, 1.0, n_rows)},
+        index=date_range("2024-01-01", periods=n_rows, freq=STEP),
+    )
+
+
+def _pandas_features(df: DataFrame) -> DataFrame:
+    """
+    Computes the features of FEATURES with pandas shift and rolling.
+    :param df: DataFrame.
+    :return: DataFrame. Features named as by the transformer.
+    """
+    features = {}
+    for lag in FEATURES.lags:
+        for column in df:
+            features[f"{column}_LAG_{lag}"] = df[column].shift(Timedelta(lag) // Timedelta(STEP))
+    for window in FEATURES.windows:
+        for statistic in FEATURES.statistics:
+            for column in df:
+                rolling = df[column].rolling(Timedelta(window) // Timedelta(STEP))
+                features[f"{column}_ROLLING_{window}_{statistic.upper()}"] = getattr(rolling, statistic)()
+    return DataFrame(features)
+
+
+@pytest.mark.parametrize("n_rows, output_dtype", [(500, float64), (96, float64), (97, float32), (3, float64)])
+def test_output_matches_pandas(n_rows: int, output_dtype: type) -> None:
+    """
+    Tests the features against pandas, also with windows longer than the data and at window-multiple lengths.
+    :param n_rows: int. Number of rows of the data.
+    :param output_dtype: type. Output dtype.
+    """
+    df = _data(n_rows)
+    transformer = LagRollingFeatureTransformer(FEATURES, dtype=output_dtype)
+    output = transformer.fit_predict(df)
+    expected = _pandas_features(df)[transformer.get_encoded_attribute_names()].to_numpy()
+    assert output.dtype == output_dtype
+    assert array_equal(isnan(output), isnan(expected))
+    assert allclose(output, expected, equal_nan=True, rtol=1e-6 if output_dtype == float32 else 1e-9)
+
+
+def test_long_trending_series_is_precise() -> None:
+    """
+    Tests the rolling mean and std of a long trending series against pandas (whose online update drifts slightly on
+    such a series, hence the tolerance) and against the exact statistics of a sample of the windows.
+    """
+    n_rows, window_rows = 2_000_000, 105
+    df = DataFrame(
+        {"trend": arange(n_rows, dtype=float64) + _rng.normal(0.0, 1.0, n_rows)},
+        index=date_range("2024-01-01", periods=n_rows, freq="1min"),
+    )
+    transformer = LagRollingFeatureTransformer(
+        LagRollingFeatures(lags=[], windows=[f"{window_rows}min"], statistics=["mean", "std"])
+    )
+    output = transformer.fit_predict(df)
+    rolling = df["trend"].rolling(window_rows)
+    assert allclose(output[:, 0], rolling.mean().to_numpy(), equal_nan=True, rtol=1e-9)
+    assert allclose(output[:, 1], rolling.std().to_numpy(), equal_nan=True, rtol=1e-3)
+    ends = _rng.integers(window_rows - 1, n_rows, 1_000)
+    windows = sliding_window_view(df["trend"].to_numpy(), window_rows)[ends - window_rows + 1]
+    assert allclose(output[ends, 1], windows.std(axis=1, ddof=1), rtol=1e-9)
+
+
+def test_predict_into_and_restore_from_params() -> None:
+    """
+    Tests writing into a column slice and predicting with a transformer restored from params.
+    """
+    df = _data(200)
+    transformer = LagRollingFeatureTransformer(FEATURES)
+    transformer.fit(df.iloc[:10])
+    restored = LagRollingFeatureTransformer(LagRollingFeatures(lags=["1D"], windows=[], statistics=[]))
+    restored.restore_from_params(transformer.get_params())
+    out = full((len(df), 1 + len(transformer.get_encoded_attribute_names())), nan)
+    restored.predict_into(df, out[:, 1:])
+    assert array_equal(out[:, 1:], transformer.predict(df), equal_nan=True)
+    assert isnan(out[:, 0]).all()
+
+
+def test_incorrect_input() -> None:
+    """
+    Tests exception raise for an irregular index, a span not a multiple of the step and the inverse.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    df = _data(50)
+    transformer = LagRollingFeatureTransformer(FEATURES)
+    with pytest.raises(IncorrectDataStructure):
+        transformer.fit(df.drop(df.index[10]))
+    with pytest.raises(IncorrectValue):
+        LagRollingFeatureTransformer(LagRollingFeatures(lags=["20min"], windows=[], statistics=[])).fit(df)
+    transformer.fit(df)
+    with pytest.raises(NotValidOperation):
+        transformer.inverse(transformer.predict(df))
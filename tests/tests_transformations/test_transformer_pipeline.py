@@ -0,0 +1,160 @@
+"""
+Tests for TransformerPipeline and TransformerUnion.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from numpy import array_equal, dtype, float64, hstack, ndarray, uint8, zeros
+from pandas import DataFrame, DatetimeIndex, date_range
+from scipy.sparse import issparse
+
+from src.data import saver_and_loader as saver_and_loader_module
+from src.transformations.base_transformer import BaseTransformer, TransformerDescription
+from src.transformations.datetime_one_hot_transformer import DatetimeOneHotEncoderTransformer, TimeAttributes
+from src.transformations.lag_rolling_feature_transformer import LagRollingFeatures, LagRollingFeatureTransformer
+from src.transformations.transformer_pipeline import TransformerPipeline, TransformerUnion
+from src.utils.monitored_base import PIPELINE_TYPE_NAME
+
+DATA = date_range("2024-01-01", periods=24 * 40, freq="h")
+HOURS = TimeAttributes(hours=True, days_of_week=False, weekend=False, months=False, years=False, min_interval=0)
+CALENDAR = TimeAttributes(hours=False, days_of_week=True, weekend=True, months=True, years=True, min_interval=0)
+
+
+class _Doubler(BaseTransformer):
+    """
+    Multiplies an array by two.
+    """
+
+    def __init__(self) -> None:
+        BaseTransformer.__init__(
+            self,
+            class_name="Doubler",
+            transformer_description=TransformerDescription(
+                input_type=[ndarray], input_elements_type=[None], output_type=[ndarray], output_elements_type=[None]
+            ),
+        )
+
+    def fit(self, data: Any) -> None:
+        self._params = {"fitted_rows": len(data)}
+
+    def predict(self, data: Any) -> Any:
+        return data * 2
+
+    def fit_predict(self, data: Any) -> Any:
+        self.fit(data)
+        return self.predict(data)
+
+    def inverse(self, data: Any) -> Any:
+        return data / 2
+
+
+def _patch_get_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Redirects the module-level get_path helper to resolve inside tmp_path.
+    :param monkeypatch: pytest.MonkeyPatch. Used to patch the module-level function.
+    :param tmp_path: Path. Pytest-provided temporary directory to resolve paths against.
+    """
+
+    def _fake_get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:  # noqa: ARG001
+        return str(tmp_path / (file_name + extension))
+
+    monkeypatch.setattr(saver_and_loader_module, "get_path", _fake_get_path)
+
+
+def _union(output_dtype: type = float64) -> TransformerUnion:
+    """
+    Creates a union of an hour and a calendar one-hot encoder.
+    :param output_dtype: type. Output dtype of the encoders.
+    :return: TransformerUnion.
+    """
+    return TransformerUnion(
+        [
+            DatetimeOneHotEncoderTransformer(HOURS, dtype=output_dtype),
+            DatetimeOneHotEncoderTransformer(CALENDAR, dtype=output_dtype),
+        ]
+    )
+
+
+def test_union_concatenates_branches() -> None:
+    """
+    Tests that the union output is the column-wise concatenation of the branch outputs, in their dtype.
+    """
+    union = _union(uint8)
+    output = union.fit_predict(DATA)
+    hours, calendar = union.get_transformers()
+    assert union.get_class_type() == PIPELINE_TYPE_NAME
+    assert union.get_widths() == [24, 12]
+    assert output.dtype == uint8
+    assert array_equal(output, hstack([hours.predict(DATA), calendar.predict(DATA)]))
+    inverted = union.inverse(output)
+    assert array_equal(inverted[0][:, 0], DATA.hour)
+    assert array_equal(inverted[1][:, 2], DATA.month)
+
+
+def test_union_predict_into_column_slice_with_unknown_values() -> None:
+    """
+    Tests writing into a non-contiguous slice of a bigger array, with values unseen in fit left zero.
+    """
+    union = _union()
+    union.fit(DATA[:100])
+    new_data = DatetimeIndex(DATA[-50:])
+    out = zeros((len(new_data), 2 + sum(union.get_widths())))
+    out[:, 0] = 7.0
+    union.predict_into(new_data, out[:, 1:-1])
+    assert array_equal(out[:, 1:-1], union.predict(new_data))
+    assert (out[:, 0] == 7.0).all() and (out[:, -1] == 0).all()
+
+
+def test_union_of_sparse_branch_is_sparse() -> None:
+    """
+    Tests that a sparse branch makes the union output a CSR matrix.
+    """
+    union = TransformerUnion(
+        [DatetimeOneHotEncoderTransformer(HOURS, output="sparse"), DatetimeOneHotEncoderTransformer(CALENDAR)]
+    )
+    output = union.fit_predict(DATA)
+    assert issparse(output)
+    assert array_equal(output.toarray(), _union().fit_predict(DATA))
+
+
+def test_union_of_branches_which_are_not_row_wise() -> None:
+    """
+    Tests that the layout of branches looking at other rows is learned without predicting a slice of the data.
+    """
+    df = DataFrame({"load": DATA.hour.to_numpy(dtype=float64)}, index=DATA)
+    lags = LagRollingFeatureTransformer(LagRollingFeatures(lags=["1h", "2h"], windows=[], statistics=[]))
+    windows = LagRollingFeatureTransformer(LagRollingFeatures(lags=[], windows=["6h"], statistics=["mean", "max"]))
+    union = TransformerUnion([lags, windows])
+    output = union.fit_predict(df)
+    assert not union.is_row_wise()
+    assert union.get_widths() == [2, 2]
+    assert (
+        union.get_encoded_attribute_names()
+        == lags.get_encoded_attribute_names() + windows.get_encoded_attribute_names()
+    )
+    assert array_equal(output, hstack([lags.predict(df), windows.predict(df)]), equal_nan=True)
+
+
+def test_pipeline_runs_steps_and_restores_params(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the pipeline chains the steps, inverts in reverse order and that params saved in one file restore an
+    unfitted pipeline of the same structure.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    pipeline = TransformerPipeline([_union(), _Doubler()])
+    output = pipeline.fit_predict(DATA)
+    assert array_equal(output, _union().fit_predict(DATA) * 2)
+    assert array_equal(pipeline.inverse(output)[0][:, 0], DATA.hour)
+    pipeline.save_params("pipeline")
+
+    restored = TransformerPipeline([_union(), _Doubler()])
+    restored.load_params("pipeline")
+    new_data = date_range("2024-03-01", periods=500, freq="h")
+    assert array_equal(restored.predict(new_data), pipeline.predict(new_data))
+    assert restored.get_params()["transformers"][1] == {"fitted_rows": len(DATA)}
+
+    out: ndarray[Any, dtype[Any]] = zeros((len(new_data), 36))
+    TransformerPipeline([restored.get_transformers()[0]]).predict_into(new_data, out)
+    assert array_equal(out * 2, restored.predict(new_data))
@@ -0,0 +1,149 @@
+"""
+Tests for the compact transformer state format.
+"""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+from numpy import arange, array, array_equal, float32, uint8
+from pandas import DataFrame, date_range
+from scipy.sparse import csr_array
+
+from src.data import saver_and_loader as saver_and_loader_module
+from src.exceptions.data_exception import IncorrectDataStructure
+from src.transformations.base_transformer import BaseTransformer
+from src.transformations.datetime_cyclical_transformer import CyclicalAttributes, DatetimeCyclicalTransformer
+from src.transformations.datetime_one_hot_transformer import DatetimeOneHotEncoderTransformer, TimeAttributes
+from src.transformations.lag_rolling_feature_transformer import LagRollingFeatures, LagRollingFeatureTransformer
+from src.transformations.transformer_pipeline import TransformerUnion
+from src.transformations.transformer_state import ARRAY_ALIGNMENT, _ArrayPacker, _decode, _encode
+from src.utils.envs import Envs
+
+DATA = date_range("2023-12-01", periods=24 * 80, freq="h")
+ATTRIBUTES = TimeAttributes(hours=True, days_of_week=True, weekend=True, months=True, years=True, min_interval=30)
+
+
+class _Foreign(NamedTuple):
+    """
+    NamedTuple outside of the project package.
+    """
+
+    x: int
+
+
+def _patch_get_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Redirects the module-level get_path helper to resolve inside tmp_path.
+    :param monkeypatch: pytest.MonkeyPatch. Used to patch the module-level function.
+    :param tmp_path: Path. Pytest-provided temporary directory to resolve paths against.
+    """
+
+    def _fake_get_path(file_name: str, where: str = "raw_data", extension: str = ".pkl") -> str:  # noqa: ARG001
+        return str(tmp_path / (file_name + extension))
+
+    monkeypatch.setattr(saver_and_loader_module, "get_path", _fake_get_path)
+
+
+def _union() -> TransformerUnion:
+    """
+    Creates a union of a one-hot and a cyclical encoder.
+    :return: TransformerUnion.
+    """
+    return TransformerUnion(
+        [
+            DatetimeOneHotEncoderTransformer(ATTRIBUTES, dtype=uint8),
+            DatetimeCyclicalTransformer(CyclicalAttributes(hours=True, days_of_week=False, days_of_year=True)),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda: DatetimeOneHotEncoderTransformer(ATTRIBUTES, output="sparse"),
+        lambda: DatetimeCyclicalTransformer(CyclicalAttributes(True, True, True), dtype=float32),
+        _union,
+    ],
+)
+def test_round_trip(create: Callable[[], BaseTransformer], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an unfitted transformer loading the saved state predicts as the fitted one.
+    :param create: Callable[[], BaseTransformer]. Creates the transformer.
+    :param tmp_path: Path. Pytest-provided temporary directory.
+    :param monkeypatch: pytest.MonkeyPatch.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    transformer = create()
+    transformer.fit(DATA[: 24 * 40])
+    transformer.save_state("state")
+    assert (tmp_path / "state.json").exists() and (tmp_path / "state.npy").exists()
+    restored = create()
+    restored.load_state("state")
+    expected = transformer.predict(DATA)
+    predicted = restored.predict(DATA)
+    if isinstance(expected, csr_array):
+        expected, predicted = expected.toarray(), predicted.toarray()
+    assert array_equal(predicted, expected)
+
+
+def test_round_trip_of_lag_rolling_features(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests the state of the lag and rolling features, whose step is a Timedelta.
+    :param tmp_path: Path. Pytest-provided temporary directory.
+    :param monkeypatch: pytest.MonkeyPatch.
+    """
+    _patch_get_path(monkeypatch, tmp_path)
+    df = DataFrame({"value": arange(300.0) % 17}, index=date_range("2024-01-01", periods=300, freq="15min"))
+    features = LagRollingFeatures(lags=["30min"], windows=["2h"], statistics=["mean", "max"])
+    transformer = LagRollingFeatureTransformer(features)
+    transformer.fit(df)
+    transformer.save_state("lag_state")
+    restored = LagRollingFeatureTransformer(LagRollingFeatures(lags=["1D"], windows=[], statistics=[]))
+    restored.load_state("lag_state")
+    assert array_equal(restored.predict(df), transformer.predict(df), equal_nan=True)
+
+
+def test_arrays_are_aligned_views_of_one_buffer() -> None:
+    """
+    Tests that arrays of any dtype and shape come back equal and aligned.
+    """
+    packer = _ArrayPacker()
+    params = {"a": [array([1, 2, 3], dtype=uint8), arange(12.0).reshape(3, 4)[:, ::2], array([], dtype=float32)]}
+    data = _encode(params, packer)
+    json.dumps(data)
+    decoded = _decode(data, packer.get_buffer())
+    for original, loaded in zip(params["a"], decoded["a"], strict=True):
+        assert loaded.dtype == original.dtype
+        assert array_equal(loaded, original)
+    assert all(item["offset"] % ARRAY_ALIGNMENT == 0 for item in data["items"]["a"])
+
+
+def test_incorrect_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests exception raise for a state of another class, of another version and for values which can not be stored.
+    :param tmp_path: Path. Pytest-provided temporary directory.
+    :param monkeypatch: pytest.MonkeyPatch.
+    """
+    env = Envs()
+    env.set_running_unit_tests()
+    _patch_get_path(monkeypatch, tmp_path)
+    transformer = DatetimeCyclicalTransformer(CyclicalAttributes(True, False, False))
+    transformer.fit(DATA)
+    transformer.save_state("state")
+    with pytest.raises(IncorrectDataStructure):
+        DatetimeOneHotEncoderTransformer(ATTRIBUTES).load_state("state")
+    with pytest.raises(IncorrectDataStructure):
+        _encode({"foreign": _Foreign(x=1)}, _ArrayPacker())
+    with pytest.raises(IncorrectDataStructure):
+        _encode({"objects": array([None])}, _ArrayPacker())
+    metadata_path = tmp_path / "state.json"
+    metadata = json.loads(metadata_path.read_text(encoding="utf8"))
+    metadata["version"] += 1
+    transformer.save_state("state")
+    metadata_path.write_text(json.dumps(metadata), encoding="utf8")
+    (tmp_path / "state.json.manifest.json").unlink()
+    with pytest.raises(IncorrectDataStructure):
+        transformer.load_state("state")
@@ -0,0 +1,57 @@
+"""
+Tests for the transformer benchmark.
+"""
+
+from pathlib import Path
+
+from src.utils.transformer_benchmark import OPERATIONS, BenchmarkResult, TransformerBenchmark
+
+
+def _result(operation: str, rows_per_second: float) -> BenchmarkResult:
+    """
+    Creates a result of 1000 rows of the hours combination.
+    :param operation: str.
+    :param rows_per_second: float.
+    :return: BenchmarkResult.
+    """
+    return BenchmarkResult(
+        branch="main",
+        time="18-10-2026 10:00:00",
+        combination="hours",
+        n_rows=1000,
+        operation=operation,
+        seconds=1000 / rows_per_second,
+        rows_per_second=rows_per_second,
+        peak_memory_mb=1.0,
+    )
+
+
+def test_run_save_and_load(tmp_path: Path) -> None:
+    """
+    Tests that every operation is measured and that the saved results load back, per branch.
+    :param tmp_path: Path. Pytest-provided temporary directory.
+    """
+    benchmark = TransformerBenchmark(sizes=(500,), combinations=("hours", "all"), repeat=1, folder=tmp_path)
+    results = benchmark.run()
+    assert [(result.combination, result.operation) for result in results] == [
+        (combination, operation) for combination in ("hours", "all") for operation in OPERATIONS
+    ]
+    assert all(result.rows_per_second > 0 and result.peak_memory_mb > 0 for result in results)
+    benchmark.save(results, "feature/one")
+    assert benchmark.load("feature/one") == results
+    assert benchmark.load("main") == []
+    csv_lines = (tmp_path / "benchmark_feature_one.csv").read_text(encoding="utf-8").splitlines()
+    assert csv_lines[0].split(",") == list(BenchmarkResult._fields)
+    assert len(csv_lines) == 1 + len(results)
+
+
+def test_compare_reports_regressions_beyond_tolerance() -> None:
+    """
+    Tests that only a throughput decrease beyond the tolerance of a measurement present in the baseline is reported.
+    """
+    baseline = [_result("fit", 1e6), _result("predict", 1e6)]
+    results = [_result("fit", 0.85e6), _result("predict", 0.75e6), _result("fit_predict", 1.0)]
+    regressions = TransformerBenchmark.compare(results, baseline, tolerance=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("predict hours 1000 rows")
+    assert TransformerBenchmark.compare(results, baseline, tolerance=0.3) == []